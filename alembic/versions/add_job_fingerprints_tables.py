@@ -0,0 +1,45 @@
+"""add job_fingerprints + job_fingerprint_bands (MinHash/LSH near-duplicate index)
+
+Revision ID: add_job_fingerprints
+Revises: add_job_neighbors
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import ARRAY
+
+revision: str = "add_job_fingerprints"
+down_revision: Union[str, None] = "add_job_neighbors"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_fingerprints",
+        sa.Column("job_id", sa.String(), nullable=False),
+        sa.Column("signature", ARRAY(sa.BigInteger()), nullable=False),
+        sa.Column("duplicates_seen", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("job_id"),
+    )
+    op.create_table(
+        "job_fingerprint_bands",
+        sa.Column("band", sa.SmallInteger(), nullable=False),
+        sa.Column("bucket", sa.BigInteger(), nullable=False),
+        sa.Column("job_id", sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("band", "bucket", "job_id"),
+    )
+    op.create_index(
+        op.f("ix_job_fingerprint_bands_job_id"), "job_fingerprint_bands", ["job_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_job_fingerprint_bands_job_id"), table_name="job_fingerprint_bands")
+    op.drop_table("job_fingerprint_bands")
+    op.drop_table("job_fingerprints")
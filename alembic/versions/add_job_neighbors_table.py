@@ -0,0 +1,36 @@
+"""add job_neighbors table (precomputed similar jobs)
+
+Revision ID: add_job_neighbors
+Revises: add_user_match_profiles
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "add_job_neighbors"
+down_revision: Union[str, None] = "add_user_match_profiles"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_neighbors",
+        sa.Column("job_id", sa.String(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("neighbor_id", sa.String(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("built_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["neighbor_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("job_id", "rank"),
+    )
+    op.create_index(op.f("ix_job_neighbors_neighbor_id"), "job_neighbors", ["neighbor_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_job_neighbors_neighbor_id"), table_name="job_neighbors")
+    op.drop_table("job_neighbors")
@@ -0,0 +1,59 @@
+"""add jobs.expires_at and jobs_archive; saved_jobs no longer cascades from jobs
+
+Revision ID: add_jobs_expiry_archive
+Revises: add_job_fingerprints
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "add_jobs_expiry_archive"
+down_revision: Union[str, None] = "add_job_fingerprints"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("jobs", sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index(op.f("ix_jobs_expires_at"), "jobs", ["expires_at"], unique=False)
+
+    op.create_table(
+        "jobs_archive",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("source", sa.String(50), nullable=False),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("company_name", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("domain", sa.String(100), nullable=False),
+        sa.Column("subdomain", sa.String(100), nullable=False),
+        sa.Column("years_experience_min", sa.Integer(), nullable=False),
+        sa.Column("years_experience_max", sa.Integer(), nullable=False),
+        sa.Column("skills_required", JSONB(), nullable=False),
+        sa.Column("location", sa.String(255), nullable=False),
+        sa.Column("country", sa.String(100), nullable=True),
+        sa.Column("remote", sa.String(20), nullable=False),
+        sa.Column("salary_min", sa.Integer(), nullable=True),
+        sa.Column("salary_max", sa.Integer(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Saved jobs must outlive archival of the posting they point at
+    op.drop_constraint("saved_jobs_job_id_fkey", "saved_jobs", type_="foreignkey")
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM saved_jobs WHERE job_id NOT IN (SELECT id FROM jobs)")
+    op.create_foreign_key(
+        "saved_jobs_job_id_fkey", "saved_jobs", "jobs", ["job_id"], ["id"], ondelete="CASCADE"
+    )
+    op.drop_table("jobs_archive")
+    op.drop_index(op.f("ix_jobs_expires_at"), table_name="jobs")
+    op.drop_column("jobs", "expires_at")
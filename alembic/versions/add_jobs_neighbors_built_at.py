@@ -0,0 +1,32 @@
+"""jobs.neighbors_built_at: per-job neighbour build state
+
+Revision ID: add_jobs_neighbors_built_at
+Revises: compact_match_results
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "add_jobs_neighbors_built_at"
+down_revision: Union[str, None] = "compact_match_results"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("jobs", sa.Column("neighbors_built_at", sa.DateTime(timezone=True), nullable=True))
+    # Jobs that already have neighbour rows keep their build time; the rest are built on the next cycle
+    op.execute(
+        """
+        UPDATE jobs j SET neighbors_built_at = n.built_at
+        FROM (SELECT job_id, max(built_at) AS built_at FROM job_neighbors GROUP BY job_id) n
+        WHERE n.job_id = j.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("jobs", "neighbors_built_at")
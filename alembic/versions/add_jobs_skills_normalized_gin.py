@@ -0,0 +1,43 @@
+"""add jobs.skills_normalized (text[]) with GIN index for skill-overlap retrieval
+
+Revision ID: add_skills_normalized_gin
+Revises: add_job_embedding_hnsw
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import ARRAY
+
+revision: str = "add_skills_normalized_gin"
+down_revision: Union[str, None] = "add_job_embedding_hnsw"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "jobs",
+        sa.Column("skills_normalized", ARRAY(sa.Text()), server_default="{}", nullable=False),
+    )
+    # Backfill: lowercase, trimmed, de-duplicated copy of skills_required
+    op.execute(
+        """
+        UPDATE jobs SET skills_normalized = ARRAY(
+            SELECT DISTINCT lower(btrim(s))
+            FROM jsonb_array_elements_text(COALESCE(skills_required, '[]'::jsonb)) AS s
+            WHERE btrim(s) <> ''
+        )
+        """
+    )
+    # GIN inverted index: serves skills_normalized && ARRAY[...] (any shared skill)
+    op.execute(
+        "CREATE INDEX ix_jobs_skills_normalized_gin ON jobs USING gin (skills_normalized)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_jobs_skills_normalized_gin")
+    op.drop_column("jobs", "skills_normalized")
@@ -0,0 +1,60 @@
+"""make match_jobs a durable queue: attempts, backoff, leases, payload table
+
+Revision ID: add_match_jobs_durable_queue
+Revises: add_jobs_expiry_archive
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "add_match_jobs_durable_queue"
+down_revision: Union[str, None] = "add_jobs_expiry_archive"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("match_jobs", sa.Column("attempts", sa.Integer(), server_default="0", nullable=False))
+    op.add_column(
+        "match_jobs",
+        sa.Column("available_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.add_column("match_jobs", sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True))
+    # Claim scans: pending rows by availability, processing rows by lease expiry
+    op.create_index(
+        "ix_match_jobs_pending_available_at",
+        "match_jobs",
+        ["available_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "ix_match_jobs_processing_lease",
+        "match_jobs",
+        ["lease_expires_at"],
+        postgresql_where=sa.text("status = 'processing'"),
+    )
+    op.create_table(
+        "match_job_payloads",
+        sa.Column("job_id", sa.String(64), nullable=False),
+        sa.Column("filename", sa.String(255), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["match_jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("job_id"),
+    )
+    # Jobs queued in memory by the old worker are gone; don't leave them pending forever
+    op.execute(
+        "UPDATE match_jobs SET status = 'failed', error = 'Lost in queue migration; please re-upload' "
+        "WHERE status IN ('pending', 'processing')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("match_job_payloads")
+    op.drop_index("ix_match_jobs_processing_lease", table_name="match_jobs")
+    op.drop_index("ix_match_jobs_pending_available_at", table_name="match_jobs")
+    op.drop_column("match_jobs", "lease_expires_at")
+    op.drop_column("match_jobs", "available_at")
+    op.drop_column("match_jobs", "attempts")
@@ -0,0 +1,24 @@
+"""add match_jobs.stage (current pipeline stage while processing)
+
+Revision ID: add_match_jobs_stage
+Revises: add_parse_embedding_caches
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "add_match_jobs_stage"
+down_revision: Union[str, None] = "add_parse_embedding_caches"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("match_jobs", sa.Column("stage", sa.String(20), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("match_jobs", "stage")
@@ -0,0 +1,36 @@
+"""add compact ranking + resume skills to match_result_cache
+
+matches_json now holds only the materialised top page; ranking_json holds the full
+ordering as [job_id, score, skills, semantic, yoe] rows, hydrated per page on read.
+
+Revision ID: add_match_cache_ranking
+Revises: add_skills_normalized_gin
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "add_match_cache_ranking"
+down_revision: Union[str, None] = "add_skills_normalized_gin"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "match_result_cache",
+        sa.Column("ranking_json", JSONB(), server_default="[]", nullable=False),
+    )
+    op.add_column(
+        "match_result_cache",
+        sa.Column("resume_skills", JSONB(), server_default="[]", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("match_result_cache", "resume_skills")
+    op.drop_column("match_result_cache", "ranking_json")
@@ -0,0 +1,72 @@
+"""store match results one row per (user_id, rank); drop the JSONB lists from match_result_cache
+
+Revision ID: add_match_results_rows
+Revises: add_match_jobs_stage
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "add_match_results_rows"
+down_revision: Union[str, None] = "add_match_jobs_stage"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "match_results",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("job_id", sa.String(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("skills_score", sa.Float(), nullable=False),
+        sa.Column("semantic_score", sa.Float(), nullable=False),
+        sa.Column("yoe_score", sa.Float(), nullable=False),
+        sa.Column("result", JSONB(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "rank"),
+    )
+    # Explode the stored ranking; the materialised prefix lines up with the first ranks
+    op.execute(
+        """
+        INSERT INTO match_results
+            (user_id, rank, job_id, score, skills_score, semantic_score, yoe_score, result)
+        SELECT c.user_id, (r.ord - 1)::int, r.elem->>0, (r.elem->>1)::float, (r.elem->>2)::float,
+               (r.elem->>3)::float, (r.elem->>4)::float, c.matches_json -> (r.ord - 1)::int
+        FROM match_result_cache c
+        CROSS JOIN LATERAL jsonb_array_elements(c.ranking_json) WITH ORDINALITY AS r(elem, ord)
+        """
+    )
+    op.drop_column("match_result_cache", "ranking_json")
+    op.drop_column("match_result_cache", "matches_json")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "match_result_cache",
+        sa.Column("matches_json", JSONB(), server_default=sa.text("'[]'::jsonb"), nullable=False),
+    )
+    op.add_column(
+        "match_result_cache",
+        sa.Column("ranking_json", JSONB(), server_default=sa.text("'[]'::jsonb"), nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE match_result_cache c SET
+            ranking_json = COALESCE((
+                SELECT jsonb_agg(jsonb_build_array(m.job_id, m.score, m.skills_score,
+                                                   m.semantic_score, m.yoe_score) ORDER BY m.rank)
+                FROM match_results m WHERE m.user_id = c.user_id
+            ), '[]'::jsonb),
+            matches_json = COALESCE((
+                SELECT jsonb_agg(m.result ORDER BY m.rank)
+                FROM match_results m WHERE m.user_id = c.user_id AND m.result IS NOT NULL
+            ), '[]'::jsonb)
+        """
+    )
+    op.drop_table("match_results")
@@ -0,0 +1,43 @@
+"""add resume_parse_cache and embedding_cache tables
+
+Revision ID: add_parse_embedding_caches
+Revises: match_job_payloads_spool_ref
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "add_parse_embedding_caches"
+down_revision: Union[str, None] = "match_job_payloads_spool_ref"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VECTOR_DIM = 1536
+
+
+def upgrade() -> None:
+    op.create_table(
+        "resume_parse_cache",
+        sa.Column("sha256", sa.String(64), nullable=False),
+        sa.Column("pipeline_id", sa.String(100), nullable=False),
+        sa.Column("result", JSONB(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("sha256", "pipeline_id"),
+    )
+    op.create_table(
+        "embedding_cache",
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("text_sha256", sa.String(64), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("model", "text_sha256"),
+    )
+    op.execute(f"ALTER TABLE embedding_cache ADD COLUMN embedding vector({VECTOR_DIM}) NOT NULL")
+
+
+def downgrade() -> None:
+    op.drop_table("embedding_cache")
+    op.drop_table("resume_parse_cache")
@@ -0,0 +1,44 @@
+"""add user_match_profiles table and jobs.updated_at index for incremental re-match
+
+Revision ID: add_user_match_profiles
+Revises: add_match_cache_ranking
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "add_user_match_profiles"
+down_revision: Union[str, None] = "add_match_cache_ranking"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VECTOR_DIM = 1536
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_match_profiles",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("domain", sa.String(100), nullable=False),
+        sa.Column("years_experience", sa.Integer(), nullable=False),
+        sa.Column("country", sa.String(100), nullable=True),
+        sa.Column("skills", JSONB(), nullable=False),
+        sa.Column("summary", sa.Text(), nullable=False),
+        sa.Column("matched_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute(f"ALTER TABLE user_match_profiles ADD COLUMN resume_embedding vector({VECTOR_DIM}) NOT NULL")
+    # Delta scan for refresh: jobs updated since a profile was last matched
+    op.create_index(op.f("ix_jobs_updated_at"), "jobs", ["updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_jobs_updated_at"), table_name="jobs")
+    op.drop_table("user_match_profiles")
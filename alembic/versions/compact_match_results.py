@@ -0,0 +1,30 @@
+"""match_results: replace materialised result JSONB with skill index arrays
+
+Revision ID: compact_match_results
+Revises: add_match_results_rows
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+revision: str = "compact_match_results"
+down_revision: Union[str, None] = "add_match_results_rows"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("match_results", sa.Column("matched_skill_idx", ARRAY(sa.SmallInteger()), nullable=True))
+    op.add_column("match_results", sa.Column("missing_skill_idx", ARRAY(sa.SmallInteger()), nullable=True))
+    # Existing rows keep NULL indices: their explanation is recomputed from resume_skills on read
+    op.drop_column("match_results", "result")
+
+
+def downgrade() -> None:
+    op.add_column("match_results", sa.Column("result", JSONB(), nullable=True))
+    op.drop_column("match_results", "missing_skill_idx")
+    op.drop_column("match_results", "matched_skill_idx")
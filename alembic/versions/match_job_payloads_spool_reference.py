@@ -0,0 +1,41 @@
+"""match_job_payloads: reference a spooled file (path, sha256, size) instead of a bytea blob
+
+Revision ID: match_job_payloads_spool_ref
+Revises: add_match_jobs_durable_queue
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "match_job_payloads_spool_ref"
+down_revision: Union[str, None] = "add_match_jobs_durable_queue"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Blob payloads can't be carried over to spool files; fail their jobs so users re-upload
+    op.execute(
+        "UPDATE match_jobs SET status = 'failed', error = 'Lost in queue migration; please re-upload' "
+        "WHERE id IN (SELECT job_id FROM match_job_payloads) AND status IN ('pending', 'processing')"
+    )
+    op.execute("DELETE FROM match_job_payloads")
+    op.drop_column("match_job_payloads", "data")
+    op.add_column("match_job_payloads", sa.Column("spool_path", sa.Text(), nullable=False))
+    op.add_column("match_job_payloads", sa.Column("sha256", sa.String(64), nullable=False))
+    op.add_column("match_job_payloads", sa.Column("size_bytes", sa.BigInteger(), nullable=False))
+
+
+def downgrade() -> None:
+    op.execute(
+        "UPDATE match_jobs SET status = 'failed', error = 'Lost in queue migration; please re-upload' "
+        "WHERE id IN (SELECT job_id FROM match_job_payloads) AND status IN ('pending', 'processing')"
+    )
+    op.execute("DELETE FROM match_job_payloads")
+    op.drop_column("match_job_payloads", "size_bytes")
+    op.drop_column("match_job_payloads", "sha256")
+    op.drop_column("match_job_payloads", "spool_path")
+    op.add_column("match_job_payloads", sa.Column("data", sa.LargeBinary(), nullable=False))
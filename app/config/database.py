@@ -1,4 +1,7 @@
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from app.config.settings import settings
@@ -7,6 +10,8 @@ engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,   # Test connections before use; discard if closed (e.g. Neon idle timeout)
     pool_recycle=300,     # Recycle connections after 5 min so they don't exceed server idle timeout
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
 )
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
@@ -21,3 +26,21 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+@contextmanager
+def try_advisory_lock(name: str) -> Iterator[bool]:
+    """Non-blocking cluster-wide lock for the with block (yields False if another process holds it).
+
+    Session-level pg_try_advisory_lock on a dedicated connection, so the lock survives the commits
+    made by the work inside the block (those use their own sessions).
+    """
+    with engine.connect() as conn:
+        held = bool(conn.execute(text("SELECT pg_try_advisory_lock(hashtext(:name))"), {"name": name}).scalar())
+        conn.commit()
+        try:
+            yield held
+        finally:
+            if held:
+                conn.execute(text("SELECT pg_advisory_unlock(hashtext(:name))"), {"name": name})
+                conn.commit()
@@ -17,9 +17,14 @@ class Settings(BaseSettings):
     JWT_SECRET: str
     FRONTEND_URL: str = "http://localhost:8080"
 
+    # ── Database pool (per process; size API and worker processes separately) ──
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+
     # ── LLM (OpenRouter) ──
     OPENROUTER_API_KEY: str = ""
     OPENROUTER_MODEL: str = "google/gemini-2.5-flash"
+    OPENROUTER_BASE_URL: str = "https://openrouter.ai/api/v1"  # Point at scripts/stub_external_apis.py for load tests
 
     # ── Embeddings (OpenRouter, same key as LLM) ──
     EMBEDDING_MODEL: str = "openai/text-embedding-3-small"
@@ -28,15 +33,92 @@ class Settings(BaseSettings):
     # ── Reducto (resume parsing pipeline) ──
     REDUCTO_API_KEY: str = ""
     REDUCTO_PIPELINE_ID: str = "k9768yn3q9sfczr46t0red1dg18153rk"
+    REDUCTO_BASE_URL: str = ""  # Empty = SDK default (production API)
+    REDUCTO_TIMEOUT_SECONDS: float = 60.0  # Per HTTP request (upload, submit, poll)
+    REDUCTO_MAX_RETRIES: int = 2  # Client retries on connection errors / 429 / 5xx
+    REDUCTO_JOB_TIMEOUT_SECONDS: float = 300.0  # Give up on a pipeline job after this long
+    REDUCTO_POLL_INTERVAL_SECONDS: float = 1.0  # First job poll delay (grows 1.5x up to 5s)
+
+    # ── External call resilience (OpenRouter, Reducto) ──
+    EMBEDDING_CALL_DEADLINE_SECONDS: float = 10.0  # Per single-text embedding call, hedges included
+    REDUCTO_CALL_DEADLINE_SECONDS: float = 20.0  # Per Reducto HTTP call (upload, submit, poll)
+    EXTERNAL_HEDGE_ENABLED: bool = True  # Send a duplicate request once a call exceeds the recent p95
+    EXTERNAL_HEDGE_MIN_DELAY_MS: int = 50
+    EXTERNAL_HEDGE_MAX_DELAY_MS: int = 5000
+    CIRCUIT_FAILURE_THRESHOLD: int = 5  # Consecutive provider failures that open the circuit
+    CIRCUIT_OPEN_SECONDS: float = 30.0  # Fail fast this long before letting a trial call through
+
+    # ── Resume parsing ──
+    RESUME_PARSER: str = "auto"  # auto (local, Reducto when unsure) | local (offline) | reducto
+    LOCAL_PARSER_MIN_CONFIDENCE: float = 0.6  # Below this, auto mode sends the resume to Reducto
+
+    # ── Parse / embedding caches ──
+    PARSE_CACHE_TTL_SECONDS: int = 30 * 24 * 3600  # Reuse a file's parse (by sha256 + pipeline) this long; 0 disables
+    EMBEDDING_CACHE_ENABLED: bool = True  # Reuse embeddings by model + text hash
 
     # ── Matching (Postgres + pgvector) ──
     YOE_WINDOW: int = 4  # ±years for display
     ANN_TOP_K: int = 200
     ANN_CANDIDATE_POOL: int = 5000  # Vector-first: fetch this many by similarity, then filter by domain/YoE/country
+    HYBRID_SKILL_TOP_K: int = 100  # Jobs sharing resume skills (GIN) unioned with ANN results; 0 disables
+    HYBRID_SKILL_MIN_OVERLAP: int = 2  # Min shared skills for a skill-overlap hit (capped at resume skill count)
+    MATCH_MATERIALISE_TOP_N: int = 50  # Results built eagerly per match run; later pages hydrate on read
+    RANKING_OFFLOAD_THRESHOLD: int = 1000  # Candidate count at/above which scoring runs on the executor
+    RANKING_EXECUTOR: str = "process"  # process | thread
+    RANKING_EXECUTOR_WORKERS: int = 0  # 0 = executor default (CPU count)
+    BATCH_MATCH_MAX_PROFILES: int = 500  # Max profiles per POST /api/match/batch
+    JOB_NEIGHBORS_K: int = 20  # Precomputed similar jobs per job
+    JOB_NEIGHBORS_REFRESH_SECONDS: int = 300  # Background builder interval; 0 disables
+    JOB_SUMMARY_CACHE_SIZE: int = 20000  # Serialised job payloads kept in-process (LRU)
+    MATCH_LIST_CACHE_MAX_MB: int = 64  # Decoded per-user match lists kept in-process (LRU); 0 disables
+    MATCH_LIST_CACHE_TTL_SECONDS: int = 300  # Also bounds how stale cached job summaries can get
     WEIGHT_SKILLS: float = 0.45
     WEIGHT_SEMANTIC: float = 0.40
     WEIGHT_YOE: float = 0.15
 
+    # ── Sharded matching (scatter-gather across shard workers; see scripts/run_match_shard.py) ──
+    MATCH_SHARD_ADDRESSES: str = ""  # Comma-separated host:port per shard, in shard order; empty disables
+    MATCH_SHARD_KEY: str = "hash"  # hash (job id) | domain
+    MATCH_SHARD_TOP_K: int = 500  # Local top-K each shard returns
+    MATCH_SHARD_RELOAD_SECONDS: int = 300  # Shard snapshot refresh interval; 0 disables
+    MATCH_SHARD_TIMEOUT_SECONDS: float = 10.0  # Per-shard reply deadline; slower shards are left out of the merge
+    MATCH_SHARD_AUTHKEY: str = ""  # Shared secret for shard connections; required when shards are used
+
+    # ── Match worker (in the API process, or standalone via python -m app.worker) ──
+    RUN_MATCH_WORKER: bool = True  # False = API only enqueues; run app.worker separately
+    MATCH_WORKER_CONCURRENCY: int = 16  # Max jobs in flight across all pipeline stages
+    MATCH_STAGE_QUEUE_SIZE: int = 4  # Bounded hand-off queue between stages (backpressure)
+    MATCH_PARSE_CONCURRENCY: int = 4  # Parse stage workers (Reducto)
+    MATCH_EMBED_CONCURRENCY: int = 4  # Embed + filter stage workers (OpenRouter)
+    MATCH_DB_CONCURRENCY: int = 2  # Search/rank stage workers (DB-bound)
+    MATCH_PERSIST_CONCURRENCY: int = 2  # Persist stage workers (save results + profile)
+    MATCH_LEASE_SECONDS: int = 300  # Claimed job is reclaimable if its worker stops renewing for this long
+    MATCH_MAX_ATTEMPTS: int = 3  # Tries per job before it is marked failed
+    MATCH_RETRY_BASE_SECONDS: int = 10  # Backoff before retry n is base * 2^(n-1)
+    MATCH_RETRY_MAX_SECONDS: int = 600
+    MATCH_QUEUE_POLL_SECONDS: float = 5.0  # Idle poll interval when no NOTIFY arrives
+    MATCH_SPOOL_DIR: str = ""  # Uploaded resumes awaiting a worker; empty = <tmp>/jobzie-match-spool (shared volume if workers run elsewhere)
+    MATCH_SPOOL_ORPHAN_SECONDS: int = 3600  # Unreferenced spool files older than this are removed
+    MATCH_SPOOL_SWEEP_SECONDS: int = 900  # Orphaned spool file sweep interval (match workers); 0 disables
+
+    # ── Match admission control ──
+    MATCH_MAX_PENDING: int = 200  # Unfinished jobs at which uploads get 429; 0 disables
+    MATCH_THROUGHPUT_WINDOW_SECONDS: int = 300  # Completions window used to estimate Retry-After
+    MATCH_RETRY_AFTER_MIN_SECONDS: int = 5
+    MATCH_RETRY_AFTER_MAX_SECONDS: int = 300
+
+    # ── Job expiry / archival ──
+    # Jobs older than this are expired (0 = only explicit expires_at). Opt-in: enabling it archives
+    # every existing job past the age on the archiver's next run
+    JOB_MAX_AGE_DAYS: int = 0
+    JOB_ARCHIVE_INTERVAL_SECONDS: int = 3600  # Background archiver interval; 0 disables
+    JOB_ARCHIVE_BATCH_SIZE: int = 500
+
+    # ── Ingest dedup (MinHash/LSH + embedding check) ──
+    DEDUP_ENABLED: bool = True
+    DEDUP_MINHASH_THRESHOLD: float = 0.8  # Min estimated Jaccard over description shingles
+    DEDUP_EMBEDDING_THRESHOLD: float = 0.97  # Min cosine of job embeddings (checked when both exist)
+
     model_config = {"env_file": ".env", "extra": "ignore"}
 
 
@@ -2,6 +2,7 @@ import logging
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.exc import OperationalError
 
 from app.config.settings import settings
@@ -27,8 +28,21 @@ async def on_startup():
             "API will start but DB-dependent routes will fail until the DB is available. Error: %s",
             e,
         )
-    from app.services.match_job_queue import start_match_worker
-    app.state.match_worker_task = start_match_worker()
+    from app.services.match_list_cache import start_match_list_cache
+    from app.services.match_status_events import start_match_status_events
+    from app.services.pg_listener import start_pg_listener
+    start_match_status_events()
+    start_match_list_cache()
+    if settings.RUN_MATCH_WORKER:
+        from app.services.match_job_queue import start_match_worker
+        app.state.match_worker_task = start_match_worker()
+    else:
+        logger.info("RUN_MATCH_WORKER is off: match jobs are enqueued for app.worker processes.")
+    start_pg_listener()
+    from app.services.job_neighbors import start_neighbor_builder
+    app.state.neighbor_builder_task = start_neighbor_builder()
+    from app.services.job_expiry import start_job_archiver
+    app.state.job_archiver_task = start_job_archiver()
 
 
 @app.on_event("shutdown")
@@ -39,6 +53,20 @@ async def on_shutdown():
             await app.state.match_worker_task
         except Exception:
             pass
+    for name in ("neighbor_builder_task", "job_archiver_task"):
+        task = getattr(app.state, name, None)
+        if task:
+            task.cancel()
+            try:
+                await task
+            except Exception:
+                pass
+    from app.services.pg_listener import stop_pg_listener
+    await stop_pg_listener()
+    from app.services.reducto_parser import close_reducto_client
+    await close_reducto_client()
+    from app.services.ranking_executor import shutdown_ranking_executor
+    shutdown_ranking_executor()
 
 app.add_middleware(
     CORSMiddleware,
@@ -54,6 +82,13 @@ def health_check():
     return {"status": "ok"}
 
 
+@app.get("/metrics", tags=["health"], response_class=PlainTextResponse)
+def metrics():
+    """Prometheus text exposition of this process's metrics."""
+    from app.services.metrics import render_metrics
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
 app.include_router(auth_router)
 app.include_router(jobs_router)
 app.include_router(matching_router)
@@ -2,6 +2,28 @@ from app.models.user import User
 from app.models.job import Job
 from app.models.saved_job import SavedJob
 from app.models.match_result_cache import MatchResultCache
-from app.models.match_job import MatchJob
+from app.models.match_result_row import MatchResultRow
+from app.models.match_job import MatchJob, MatchJobPayload
+from app.models.user_match_profile import UserMatchProfile
+from app.models.job_neighbor import JobNeighbor
+from app.models.job_fingerprint import JobFingerprint, JobFingerprintBand
+from app.models.job_archive import JobArchive
+from app.models.resume_parse_cache import ResumeParseCache
+from app.models.embedding_cache import EmbeddingCache
 
-__all__ = ["User", "Job", "SavedJob", "MatchResultCache", "MatchJob"]
+__all__ = [
+    "User",
+    "Job",
+    "SavedJob",
+    "MatchResultCache",
+    "MatchResultRow",
+    "MatchJob",
+    "MatchJobPayload",
+    "UserMatchProfile",
+    "JobNeighbor",
+    "JobFingerprint",
+    "JobFingerprintBand",
+    "JobArchive",
+    "ResumeParseCache",
+    "EmbeddingCache",
+]
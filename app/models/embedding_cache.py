@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.config.database import Base
+from app.models.job import VECTOR_DIM
+
+
+class EmbeddingCache(Base):
+    """Embedding of an input text, keyed by model + sha256 of the text."""
+
+    __tablename__ = "embedding_cache"
+
+    model: Mapped[str] = mapped_column(String(100), primary_key=True)
+    text_sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    embedding: Mapped[list] = mapped_column(Vector(VECTOR_DIM), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
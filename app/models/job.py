@@ -4,8 +4,8 @@ from typing import List, Optional
 
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import DateTime, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from app.config.database import Base
 
@@ -13,6 +13,11 @@ from app.config.database import Base
 VECTOR_DIM = 1536
 
 
+def normalise_skills(skills: list | None) -> List[str]:
+    """Lowercased, stripped, de-duplicated skills (same rule as scoring._normalise_skill)."""
+    return sorted({s.strip().lower() for s in (skills or []) if s and s.strip()})
+
+
 class Job(Base):
     __tablename__ = "jobs"
 
@@ -32,6 +37,8 @@ class Job(Base):
     years_experience_max: Mapped[int] = mapped_column(Integer, default=99)
 
     skills_required: Mapped[list] = mapped_column(JSONB, default=list)
+    # Normalised copy of skills_required (GIN-indexed) for skill-overlap retrieval; kept in sync below
+    skills_normalized: Mapped[list] = mapped_column(ARRAY(Text), default=list)
 
     location: Mapped[str] = mapped_column(String(255), default="")
     country: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
@@ -43,9 +50,22 @@ class Job(Base):
     job_meaning: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     job_embedding: Mapped[Optional[list]] = mapped_column(Vector(VECTOR_DIM), nullable=True)
 
+    # Explicit expiry (NULL = only the JOB_MAX_AGE_DAYS age policy applies); expired jobs are archived
+    expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
+
+    # When job_neighbors was last built for this job (NULL = never); stale once updated_at passes it
+    neighbors_built_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+
+    @validates("skills_required")
+    def _sync_skills_normalized(self, key: str, value: list) -> list:
+        self.skills_normalized = normalise_skills(value)
+        return value
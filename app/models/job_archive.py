@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.config.database import Base
+
+
+class JobArchive(Base):
+    """Expired jobs moved out of the hot jobs table (no embedding/search columns).
+
+    Saved jobs keep resolving against this table after their posting expires.
+    """
+
+    __tablename__ = "jobs_archive"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    source: Mapped[str] = mapped_column(String(50), default="manual")
+
+    title: Mapped[str] = mapped_column(String(255))
+    company_name: Mapped[str] = mapped_column(String(255), default="")
+    description: Mapped[str] = mapped_column(Text, default="")
+
+    domain: Mapped[str] = mapped_column(String(100))
+    subdomain: Mapped[str] = mapped_column(String(100), default="")
+
+    years_experience_min: Mapped[int] = mapped_column(Integer, default=0)
+    years_experience_max: Mapped[int] = mapped_column(Integer, default=99)
+
+    skills_required: Mapped[list] = mapped_column(JSONB, default=list)
+
+    location: Mapped[str] = mapped_column(String(255), default="")
+    country: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    remote: Mapped[str] = mapped_column(String(20), default="onsite")
+    salary_min: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    salary_max: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
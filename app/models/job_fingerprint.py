@@ -0,0 +1,33 @@
+from sqlalchemy import BigInteger, ForeignKey, Integer, SmallInteger
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.config.database import Base
+
+
+class JobFingerprint(Base):
+    """MinHash signature of a job posting (near-duplicate detection at ingest)."""
+
+    __tablename__ = "job_fingerprints"
+
+    job_id: Mapped[str] = mapped_column(
+        ForeignKey("jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    signature: Mapped[list] = mapped_column(ARRAY(BigInteger), nullable=False)
+    # Ingested postings collapsed into this (canonical) job
+    duplicates_seen: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class JobFingerprintBand(Base):
+    """LSH index: one row per (band, bucket) of a signature, so candidate lookup is sublinear."""
+
+    __tablename__ = "job_fingerprint_bands"
+
+    band: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    bucket: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    job_id: Mapped[str] = mapped_column(
+        ForeignKey("jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
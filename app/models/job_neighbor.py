@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.config.database import Base
+
+
+class JobNeighbor(Base):
+    """Precomputed top-K similar jobs per job (rank 0 = most similar). Serves GET /api/jobs/{id}/similar."""
+
+    __tablename__ = "job_neighbors"
+
+    job_id: Mapped[str] = mapped_column(
+        ForeignKey("jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    rank: Mapped[int] = mapped_column(Integer, primary_key=True)
+    neighbor_id: Mapped[str] = mapped_column(
+        ForeignKey("jobs.id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+    )
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    built_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -1,13 +1,17 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.config.database import Base
 
 
 class MatchJob(Base):
-    """Status row for a background match job (in-memory queue; status in DB)."""
+    """Durable queue row for a background match job.
+
+    Workers claim rows with FOR UPDATE SKIP LOCKED and hold a lease while processing;
+    a row whose lease has expired (worker died) is claimable again.
+    """
 
     __tablename__ = "match_jobs"
 
@@ -16,11 +20,32 @@ class MatchJob(Base):
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
     )
-    status: Mapped[str] = mapped_column(String(20), nullable=False)  # pending | processing | completed | failed
+    status: Mapped[str] = mapped_column(String(20), nullable=False)  # pending | processing | completed | failed | superseded
+    stage: Mapped[str | None] = mapped_column(String(20), nullable=True)  # While processing: parse | embed | search | persist
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )  # Not claimable before this (retry backoff)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
+
+
+class MatchJobPayload(Base):
+    """Spooled resume upload for a queued match job; row and file go once the job is finished."""
+
+    __tablename__ = "match_job_payloads"
+
+    job_id: Mapped[str] = mapped_column(
+        ForeignKey("match_jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    filename: Mapped[str] = mapped_column(String(255), nullable=False)
+    spool_path: Mapped[str] = mapped_column(Text, nullable=False)  # File under MATCH_SPOOL_DIR
+    sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
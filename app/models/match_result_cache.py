@@ -8,7 +8,7 @@ from app.config.database import Base
 
 
 class MatchResultCache(Base):
-    """One row per user: latest full match list for cursor-based pagination."""
+    """One row per user: header of the latest match run (the ranked rows live in match_results)."""
 
     __tablename__ = "match_result_cache"
 
@@ -17,7 +17,7 @@ class MatchResultCache(Base):
         primary_key=True,
     )
     total_matches: Mapped[int] = mapped_column(default=0, nullable=False)
-    matches_json: Mapped[list] = mapped_column(JSONB, default=list, nullable=False)
+    resume_skills: Mapped[list] = mapped_column(JSONB, default=list, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
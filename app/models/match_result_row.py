@@ -0,0 +1,28 @@
+from typing import List, Optional
+
+from sqlalchemy import Float, ForeignKey, Integer, SmallInteger, String
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.config.database import Base
+
+
+class MatchResultRow(Base):
+    """One ranked match for a user (ids, scores, skill indices); job data is joined in on read."""
+
+    __tablename__ = "match_results"
+
+    user_id: Mapped[str] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    rank: Mapped[int] = mapped_column(Integer, primary_key=True)  # 0-based position (= page cursor)
+    job_id: Mapped[str] = mapped_column(String, nullable=False)
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    skills_score: Mapped[float] = mapped_column(Float, nullable=False)
+    semantic_score: Mapped[float] = mapped_column(Float, nullable=False)
+    yoe_score: Mapped[float] = mapped_column(Float, nullable=False)
+    # Explanation as positions in jobs.skills_required (top MATCH_MATERIALISE_TOP_N only);
+    # NULL means recompute from the header's resume_skills on read
+    matched_skill_idx: Mapped[Optional[List[int]]] = mapped_column(ARRAY(SmallInteger), nullable=True)
+    missing_skill_idx: Mapped[Optional[List[int]]] = mapped_column(ARRAY(SmallInteger), nullable=True)
@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.config.database import Base
+
+
+class ResumeParseCache(Base):
+    """Structured parse of a resume file ({domain, yoe, country, skills, summary}), keyed by file hash + pipeline."""
+
+    __tablename__ = "resume_parse_cache"
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    pipeline_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    result: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.config.database import Base
@@ -14,10 +14,8 @@ class SavedJob(Base):
         ForeignKey("users.id", ondelete="CASCADE"),
         primary_key=True,
     )
-    job_id: Mapped[str] = mapped_column(
-        ForeignKey("jobs.id", ondelete="CASCADE"),
-        primary_key=True,
-    )
+    # No FK to jobs: expired jobs move to jobs_archive and saved references must survive that
+    job_id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Optional
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.config.database import Base
+from app.models.job import VECTOR_DIM
+
+
+class UserMatchProfile(Base):
+    """One row per user: parsed profile + resume embedding from the latest upload.
+
+    Lets new/changed jobs be scored incrementally without re-parsing or re-embedding.
+    """
+
+    __tablename__ = "user_match_profiles"
+
+    user_id: Mapped[str] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    domain: Mapped[str] = mapped_column(String(100), nullable=False)
+    years_experience: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    country: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    skills: Mapped[list] = mapped_column(JSONB, default=list, nullable=False)
+    summary: Mapped[str] = mapped_column(Text, default="", nullable=False)
+    resume_embedding: Mapped[list] = mapped_column(Vector(VECTOR_DIM), nullable=False)
+    # Jobs updated after this instant have not been scored against this profile yet
+    matched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
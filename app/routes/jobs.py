@@ -4,6 +4,7 @@ Job ingestion is done only via the seed script with a JSON file (scripts/seed_jo
 
 GET  /api/jobs         — List jobs (cursor-based, next/prev)
 GET  /api/jobs/{id}    — Get a single job
+GET  /api/jobs/{id}/similar — Precomputed similar jobs (job_neighbors)
 """
 
 from __future__ import annotations
@@ -11,12 +12,16 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.config.database import get_db
 from app.models.job import Job
-from app.schemas.jobs import JobListCursorResponse, JobResponse
+from app.models.job_archive import JobArchive
+from app.schemas.jobs import JobListCursorResponse, JobResponse, SimilarJobsResponse
+from app.services.job_expiry import live_job_clause
+from app.services.job_neighbors import get_similar_jobs
+from app.services.job_summary_cache import job_response_json, jobs_json_array, json_value
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/jobs", tags=["jobs"])
@@ -49,8 +54,8 @@ async def list_jobs(
     country: str | None = Query(None),
     db: Session = Depends(get_db),
 ):
-    """List jobs with cursor-based pagination (next/prev). No total count."""
-    query = db.query(Job)
+    """List live jobs with cursor-based pagination (next/prev). No total count."""
+    query = db.query(Job).filter(live_job_clause())
     if domain:
         query = query.filter(Job.domain == domain)
     if country:
@@ -84,15 +89,17 @@ async def list_jobs(
         query = query.order_by(Job.created_at.desc(), Job.id.desc()).limit(limit)
         jobs = query.all()
 
-    out = [JobResponse.model_validate(j) for j in jobs]
     next_cursor = _encode_cursor(jobs[-1].created_at, jobs[-1].id) if jobs else None
     prev_cursor = _encode_cursor(jobs[0].created_at, jobs[0].id) if jobs else None
 
-    return JobListCursorResponse(
-        jobs=out,
-        next_cursor=next_cursor,
-        prev_cursor=prev_cursor,
+    # Body spliced from cached per-job JSON (same shape as JobListCursorResponse)
+    body = (
+        b'{"jobs":' + jobs_json_array(jobs)
+        + b',"next_cursor":' + json_value(next_cursor)
+        + b',"prev_cursor":' + json_value(prev_cursor)
+        + b"}"
     )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{job_id}", response_model=JobResponse)
@@ -100,8 +107,28 @@ async def get_job(
     job_id: str,
     db: Session = Depends(get_db),
 ):
-    """Get a single job by ID."""
+    """Get a single job by ID (expired jobs resolve from the archive, e.g. links from saved jobs)."""
     job = db.query(Job).filter(Job.id == job_id).first()
     if not job:
+        archived = db.query(JobArchive).filter(JobArchive.id == job_id).first()
+        if not archived:
+            raise HTTPException(status_code=404, detail="Job not found.")
+        return JobResponse.model_validate(archived)
+    return Response(content=job_response_json(job), media_type="application/json")
+
+
+@router.get("/{job_id}/similar", response_model=SimilarJobsResponse)
+async def get_similar(
+    job_id: str,
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+):
+    """Similar jobs from the precomputed neighbour table (empty until the builder has run for this job)."""
+    neighbors = get_similar_jobs(db, job_id, limit)
+    if not neighbors and not db.query(Job.id).filter(Job.id == job_id).first():
         raise HTTPException(status_code=404, detail="Job not found.")
-    return JobResponse.model_validate(job)
+    items = b",".join(
+        b'{"job":' + job_response_json(j) + b',"score":' + json_value(score) + b"}"
+        for j, score in neighbors
+    )
+    return Response(content=b'{"jobs":[' + items + b"]}", media_type="application/json")
@@ -1,54 +1,98 @@
 """Resume upload + job matching endpoint.
 
-POST /api/match/upload     — Enqueue match job, return 202 with job_id.
-GET  /api/match/status/{id} — Job status (pending | processing | completed | failed).
+POST /api/match/upload     — Enqueue match job, return 202 with job_id (429 + Retry-After when the queue is full).
+GET  /api/match/status/{id} — Job status (pending | processing | completed | failed | superseded).
+GET  /api/match/status/{id}/stream — Server-Sent Events: one event per status/stage transition until done.
 GET  /api/match/results    — Cursor-paginated read of latest match results (auth required). Returns empty list if none.
+POST /api/match/batch      — Match many already-parsed profiles in one pass (auth required; not persisted).
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.config.database import get_db
+from app.config.settings import settings
 from app.middleware.auth import get_current_user_id
 from app.models.match_job import MatchJob
-from app.schemas.matching import MatchJobAccepted, MatchJobStatus, MatchResultsCursorResponse
+from app.schemas.matching import (
+    BatchMatchRequest,
+    BatchMatchResponse,
+    MatchJobAccepted,
+    MatchJobStatus,
+    MatchResultsCursorResponse,
+)
+from app.services.batch_matching import build_batch_contexts, run_batch_matching
 from app.services.match_result_cache import get_match_results_page
-from app.services.match_job_queue import enqueue_match_job
+from app.services.match_job_queue import admit_match_job, enqueue_match_job
+from app.services.match_status_events import read_status, status_event, subscribe, unsubscribe
+from app.services.upload_spool import MalformedUpload, UploadTooLarge, remove_spooled, spool_multipart_upload
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/match", tags=["matching"])
 
 ALLOWED_EXTENSIONS = {"pdf", "docx", "txt"}
 MAX_FILE_BYTES = 10 * 1024 * 1024  # 10 MB
-
-
-@router.post("/upload", response_model=MatchJobAccepted, status_code=202)
+SSE_HEARTBEAT_SECONDS = 15.0
+
+
+# The body is parsed by hand (streamed into the spool), so describe the form for the OpenAPI docs
+_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                    "required": ["file"],
+                }
+            }
+        },
+    }
+}
+
+
+@router.post("/upload", response_model=MatchJobAccepted, status_code=202, openapi_extra=_UPLOAD_OPENAPI)
 async def upload_and_match(
-    file: UploadFile = File(...),
+    request: Request,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
-    """Upload a resume and enqueue a background match job. Returns 202 with job_id; poll GET /status/{job_id}."""
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="No file provided.")
+    """Upload a resume (multipart field "file") and enqueue a background match job.
 
-    file_bytes = await file.read()
-    if len(file_bytes) == 0:
-        raise HTTPException(status_code=400, detail="Empty file.")
-    if len(file_bytes) > MAX_FILE_BYTES:
-        raise HTTPException(status_code=400, detail="File too large (max 10 MB).")
+    Returns 202 with job_id; poll GET /status/{job_id}. Replaces the user's still-unfinished match
+    job, if any. 429 with Retry-After when the queue is full. No body parameters are declared, so
+    auth and admission run before any of the body is read, and the file streams into the spool.
+    """
+    admit_match_job(db)
 
-    ext = (file.filename or "").rsplit(".", 1)[-1].lower()
+    try:
+        upload, filename = await spool_multipart_upload(request, "file", MAX_FILE_BYTES)
+    except UploadTooLarge:
+        raise HTTPException(status_code=400, detail="File too large (max 10 MB).")
+    except MalformedUpload:
+        raise HTTPException(status_code=400, detail="No file provided.")
+    ext = filename.rsplit(".", 1)[-1].lower()
     if ext not in ALLOWED_EXTENSIONS:
+        remove_spooled(upload.path)
         raise HTTPException(status_code=400, detail="Allowed types: PDF, DOCX, TXT.")
+    if upload.size == 0:
+        remove_spooled(upload.path)
+        raise HTTPException(status_code=400, detail="Empty file.")
 
     job_id = uuid.uuid4().hex
-    enqueue_match_job(db, job_id, user_id, file_bytes, file.filename or "resume")
+    try:
+        enqueue_match_job(db, job_id, user_id, upload, filename)
+    except Exception:
+        remove_spooled(upload.path)
+        raise
     return MatchJobAccepted(job_id=job_id)
 
 
@@ -64,7 +108,58 @@ def get_job_status(
         raise HTTPException(status_code=404, detail="Job not found.")
     if row.user_id != user_id:
         raise HTTPException(status_code=404, detail="Job not found.")
-    return MatchJobStatus(job_id=row.id, status=row.status, error=row.error)
+    return MatchJobStatus(job_id=row.id, status=row.status, stage=row.stage, error=row.error)
+
+
+@router.get("/status/{job_id}/stream")
+async def stream_job_status(
+    job_id: str,
+    request: Request,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    """Stream status transitions as Server-Sent Events (data: MatchJobStatus JSON) until a terminal status."""
+    row = db.query(MatchJob).filter(MatchJob.id == job_id).first()
+    if not row or row.user_id != user_id:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    # Subscribe before reading the current state so no transition falls in between
+    queue = subscribe(job_id)
+    db.refresh(row)
+    current = status_event(row)
+    db.close()  # Don't hold a pooled connection for the life of the stream
+
+    async def events():
+        try:
+            sent = current
+            yield f"event: status\ndata: {sent.to_json()}\n\n"
+            while not sent.terminal:
+                try:
+                    await asyncio.wait_for(queue.get(), timeout=SSE_HEARTBEAT_SECONDS)
+                    while not queue.empty():
+                        queue.get_nowait()  # Coalesce a burst into one read
+                    quiet = False
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    quiet = True
+                # The row is the source of truth: an event only signals a change (it may be older
+                # than what a heartbeat re-read already sent), and a quiet heartbeat catches lost ones
+                latest = await asyncio.to_thread(read_status, job_id)
+                if latest is None:
+                    return
+                if latest != sent:
+                    sent = latest
+                    yield f"event: status\ndata: {sent.to_json()}\n\n"
+                elif quiet:
+                    yield ": keep-alive\n\n"
+        finally:
+            unsubscribe(job_id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/results", response_model=MatchResultsCursorResponse)
@@ -89,3 +184,21 @@ def get_results(
             prev_cursor=None,
         )
     return page
+
+
+@router.post("/batch", response_model=BatchMatchResponse)
+async def batch_match(
+    body: BatchMatchRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    """Match a list of already-parsed profiles together (grouped by filter key, one similarity pass per group)."""
+    if len(body.profiles) > settings.BATCH_MATCH_MAX_PROFILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.BATCH_MATCH_MAX_PROFILES} profiles per batch.",
+        )
+    contexts = await build_batch_contexts(body.profiles)
+    results = await run_batch_matching(db, contexts, limit=body.limit)
+    logger.info("Batch match for user %s: %d profiles", user_id, len(results))
+    return BatchMatchResponse(results=results)
@@ -1,14 +1,16 @@
 """Saved jobs endpoints: add, remove, list (all require auth)."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app.config.database import get_db
 from app.middleware.auth import get_current_user_id
 from app.models.job import Job
+from app.models.job_archive import JobArchive
 from app.models.saved_job import SavedJob
 from app.schemas.jobs import JobResponse
 from app.schemas.saved_jobs import SavedJobAddRequest, SavedJobListResponse
+from app.services.job_summary_cache import job_response_json
 
 router = APIRouter(prefix="/api/saved-jobs", tags=["saved-jobs"])
 
@@ -52,7 +54,7 @@ def list_saved_jobs(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
-    """List saved jobs for the current user (full job payloads, newest first)."""
+    """List saved jobs for the current user (full job payloads, newest first; includes archived jobs)."""
     saved = (
         db.query(SavedJob)
         .filter(SavedJob.user_id == user_id)
@@ -63,6 +65,15 @@ def list_saved_jobs(
     if not job_ids:
         return SavedJobListResponse(jobs=[])
     jobs = db.query(Job).filter(Job.id.in_(job_ids)).all()
-    job_by_id = {j.id: j for j in jobs}
-    ordered = [job_by_id[jid] for jid in job_ids if jid in job_by_id]
-    return SavedJobListResponse(jobs=[JobResponse.model_validate(j) for j in ordered])
+    fragments = {j.id: job_response_json(j) for j in jobs}
+    # Expired postings were moved to jobs_archive; saved references still resolve there
+    missing = [jid for jid in job_ids if jid not in fragments]
+    if missing:
+        for a in db.query(JobArchive).filter(JobArchive.id.in_(missing)).all():
+            fragments[a.id] = JobResponse.model_validate(a).model_dump_json().encode("utf-8")
+    # Body spliced from cached per-job JSON (same shape as SavedJobListResponse)
+    ordered = [fragments[jid] for jid in job_ids if jid in fragments]
+    return Response(
+        content=b'{"jobs":[' + b",".join(ordered) + b"]}",
+        media_type="application/json",
+    )
@@ -23,6 +23,7 @@ class JobResponse(BaseModel):
     remote: str
     salary_min: Optional[int] = None
     salary_max: Optional[int] = None
+    expires_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
@@ -35,3 +36,12 @@ class JobListCursorResponse(BaseModel):
     jobs: List[JobResponse]
     next_cursor: Optional[str] = None
     prev_cursor: Optional[str] = None
+
+
+class SimilarJob(BaseModel):
+    job: JobResponse
+    score: float  # cosine similarity 0-1
+
+
+class SimilarJobsResponse(BaseModel):
+    jobs: List[SimilarJob]
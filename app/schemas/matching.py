@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from app.config.settings import settings
 
 
 class ScoreBreakdown(BaseModel):
@@ -48,6 +50,47 @@ class MatchResponse(BaseModel):
     candidate_profile_id: str
     total_matches: int
     matches: List[MatchResult]
+    # Full ordering as compact ScoredJob records (matches holds only the materialised top page)
+    ranking: list = Field(default_factory=list, exclude=True)
+
+
+class BatchProfile(BaseModel):
+    """Already-parsed resume profile for batch matching (ResumeContext-like)."""
+    id: str = Field(..., min_length=1)
+    domain: str
+    years_experience: int = Field(0, ge=0)
+    country: Optional[str] = None
+    skills: List[str] = Field(default_factory=list)
+    summary: str = ""
+    resume_embedding: Optional[List[float]] = Field(
+        None, description="Resume vector; embedded from domain/yoe/skills/summary if omitted"
+    )
+
+    @field_validator("resume_embedding")
+    @classmethod
+    def _check_dimension(cls, v: Optional[List[float]]) -> Optional[List[float]]:
+        if v is not None and len(v) != settings.EMBEDDING_DIMENSION:
+            raise ValueError(f"resume_embedding must have {settings.EMBEDDING_DIMENSION} values, got {len(v)}")
+        return v
+
+
+class BatchMatchRequest(BaseModel):
+    profiles: List[BatchProfile] = Field(..., min_length=1)
+    limit: int = Field(50, ge=1, le=100, description="Matches returned per profile")
+
+    @model_validator(mode="after")
+    def _unique_ids(self) -> "BatchMatchRequest":
+        seen = set()
+        for p in self.profiles:
+            if p.id in seen:
+                raise ValueError(f"Duplicate profile id: {p.id}")
+            seen.add(p.id)
+        return self
+
+
+class BatchMatchResponse(BaseModel):
+    """One MatchResponse per profile, in request order."""
+    results: List[MatchResponse]
 
 
 class MatchResultsCursorResponse(BaseModel):
@@ -66,5 +109,6 @@ class MatchJobAccepted(BaseModel):
 class MatchJobStatus(BaseModel):
     """Status of a match job (GET /match/status/{job_id})."""
     job_id: str
-    status: str  # pending | processing | completed | failed
+    status: str  # pending | processing | completed | failed | superseded
+    stage: Optional[str] = None  # While processing: parse | embed | search | persist
     error: Optional[str] = None
@@ -0,0 +1,169 @@
+"""Batch matching: score many already-parsed resumes in one pass.
+
+Profiles are grouped by filter key (domain, YoE, country). Each group runs one SQL filter,
+one load of the candidate job vectors and one similarity matrix multiply; every profile in
+the group is then ranked against those shared candidates. Results are not persisted.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter, defaultdict
+from typing import Dict, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.job import Job, normalise_skills
+from app.schemas.matching import BatchProfile, MatchResponse
+from app.services.embedding import embed_texts
+from app.services.job_filter import filter_jobs
+from app.services.matching import ResumeContext
+from app.services.postgres_search import load_job_vectors
+from app.services.reducto_parser import build_resume_meaning
+from app.services.scoring import build_match_result, score_jobs, top_scored
+
+logger = logging.getLogger(__name__)
+
+
+async def build_batch_contexts(profiles: List[BatchProfile]) -> List[ResumeContext]:
+    """Convert request profiles to ResumeContext, embedding any without a vector in one batch call."""
+    missing = [p for p in profiles if not p.resume_embedding]
+    vectors: Dict[str, List[float]] = {}
+    if missing:
+        texts = [
+            build_resume_meaning(
+                domain=p.domain,
+                yoe=p.years_experience,
+                skills=p.skills,
+                summary=p.summary,
+            )
+            for p in missing
+        ]
+        embedded = await embed_texts(texts)
+        vectors = {p.id: [float(x) for x in vec] for p, vec in zip(missing, embedded)}
+
+    return [
+        ResumeContext(
+            id=p.id,
+            domain=p.domain,
+            years_experience=p.years_experience,
+            country=p.country or None,
+            skills=p.skills or [],
+            resume_embedding=p.resume_embedding or vectors.get(p.id, []),
+        )
+        for p in profiles
+    ]
+
+
+def _select_candidates(
+    profiles: List[ResumeContext],
+    job_ids: List[str],
+    matrix,
+    job_skills: List[List[str]],
+) -> List[Dict[str, float]]:
+    """One matrix pass: per profile, ANN-style top-K by cosine ∪ skill-overlap hits.
+
+    Returns, per profile, {job_id: cosine_similarity} ordered by similarity (descending).
+    """
+    import numpy as np
+
+    jobs_norm = np.linalg.norm(matrix, axis=1, keepdims=True)
+    jobs_unit = matrix / np.maximum(jobs_norm, 1e-12)
+    prof = np.asarray([p.resume_embedding for p in profiles], dtype=np.float32)
+    prof_unit = prof / np.maximum(np.linalg.norm(prof, axis=1, keepdims=True), 1e-12)
+    sims = prof_unit @ jobs_unit.T  # [profiles x jobs] cosine similarity
+
+    k = min(settings.ANN_TOP_K, len(job_ids))
+    top_idx = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+
+    # Inverted index (skill -> job positions) so skill overlap costs O(postings), not O(jobs)
+    postings: Dict[str, List[int]] = defaultdict(list)
+    if settings.HYBRID_SKILL_TOP_K > 0:
+        for j, skills in enumerate(job_skills):
+            for skill in skills:
+                postings[skill].append(j)
+
+    out: List[Dict[str, float]] = []
+    for row, profile in enumerate(profiles):
+        chosen = set(top_idx[row].tolist())
+        resume_skills = normalise_skills(profile.skills)
+        if postings and resume_skills:
+            min_overlap = max(1, min(settings.HYBRID_SKILL_MIN_OVERLAP, len(resume_skills)))
+            overlap = Counter(j for skill in resume_skills for j in postings.get(skill, ()))
+            hits = [j for j, n in overlap.most_common() if n >= min_overlap]
+            chosen.update(hits[: settings.HYBRID_SKILL_TOP_K])
+        ordered = sorted(chosen, key=lambda j: -sims[row, j])
+        out.append({job_ids[j]: float(sims[row, j]) for j in ordered})
+    return out
+
+
+def _match_group(
+    db: Session,
+    domain: str,
+    yoe: int,
+    country: str | None,
+    group: List[ResumeContext],
+    limit: int,
+) -> List[MatchResponse]:
+    """Blocking work of one filter group (SQL filter, vector load, matrix pass, scoring); run off the loop.
+
+    Returns one MatchResponse per profile in group, or [] if no job passed the filter.
+    """
+    job_ids = filter_jobs(
+        db=db,
+        candidate_domain=domain,
+        candidate_yoe=yoe,
+        candidate_country=country,
+    )
+    ids, matrix, job_skills = load_job_vectors(db, job_ids)
+    if not ids:
+        return []
+    selections = _select_candidates(group, ids, matrix, job_skills)
+    needed = {jid for sel in selections for jid in sel}
+    id_to_job = {j.id: j for j in db.query(Job).filter(Job.id.in_(needed)).all()}
+
+    responses: List[MatchResponse] = []
+    for profile, sel in zip(group, selections):
+        candidates = [id_to_job[jid] for jid in sel if jid in id_to_job]
+        scored = score_jobs(profile.skills, profile.years_experience, candidates, sel)
+        matches = [
+            build_match_result(id_to_job[s.job_id], s, profile.skills)
+            for s in top_scored(scored, limit)
+        ]
+        responses.append(
+            MatchResponse(
+                candidate_profile_id=profile.id,
+                total_matches=len(scored),
+                matches=matches,
+            )
+        )
+    return responses
+
+
+async def run_batch_matching(
+    db: Session,
+    profiles: List[ResumeContext],
+    limit: int = 50,
+) -> List[MatchResponse]:
+    """Match many profiles at once. Returns one MatchResponse per profile, in input order."""
+    responses: List[MatchResponse] = [
+        MatchResponse(candidate_profile_id=p.id, total_matches=0, matches=[]) for p in profiles
+    ]
+
+    groups: Dict[Tuple[str, int, str | None], List[int]] = defaultdict(list)
+    for i, p in enumerate(profiles):
+        if p.resume_embedding:
+            groups[(p.domain, p.years_experience, p.country or None)].append(i)
+
+    logger.info("Batch matching: %d profiles in %d filter groups", len(profiles), len(groups))
+
+    for (domain, yoe, country), idxs in groups.items():
+        group = [profiles[i] for i in idxs]
+        # Scoring hundreds of profiles is CPU-bound: it runs in the thread with the queries
+        matched = await asyncio.to_thread(_match_group, db, domain, yoe, country, group, limit)
+        for i, response in zip(idxs, matched):
+            responses[i] = response
+
+    return responses
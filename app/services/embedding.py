@@ -13,10 +13,15 @@ from typing import List
 import httpx
 
 from app.config.settings import settings
+from app.services.resilience import openrouter, openrouter_batch
 
 logger = logging.getLogger(__name__)
 
-OPENROUTER_EMBEDDINGS_URL = "https://openrouter.ai/api/v1/embeddings"
+BATCH_EMBED_DEADLINE_SECONDS = 60.0
+
+
+def _embeddings_url() -> str:
+    return f"{settings.OPENROUTER_BASE_URL.rstrip('/')}/embeddings"
 
 
 async def embed_text(text: str) -> List[float]:
@@ -43,13 +48,28 @@ async def embed_texts(texts: List[str]) -> List[List[float]]:
         "input": texts,
     }
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        resp = await client.post(
-            OPENROUTER_EMBEDDINGS_URL,
-            headers=headers,
-            json=payload,
+    async def _post() -> httpx.Response:
+        async with httpx.AsyncClient(timeout=BATCH_EMBED_DEADLINE_SECONDS) as client:
+            resp = await client.post(
+                _embeddings_url(),
+                headers=headers,
+                json=payload,
+            )
+            resp.raise_for_status()
+            return resp
+
+    if len(texts) == 1:
+        # Interactive path (resume upload): deadline + hedging on slow calls
+        resp = await openrouter.call(_post, op="embed")
+    else:
+        # Ingest/API batches: own breaker, no hedging (duplicate large requests), explicit deadline
+        resp = await openrouter_batch.call(
+            _post,
+            op="embed_batch",
+            hedge=False,
+            deadline=BATCH_EMBED_DEADLINE_SECONDS,
+            track_latency=False,
         )
-        resp.raise_for_status()
 
     data = resp.json()
     # Sort by index to preserve order (OpenRouter returns same shape as OpenAI)
@@ -0,0 +1,178 @@
+"""Incremental re-match: score only new/changed jobs against stored user profiles.
+
+_run_one_job persists each user's parsed profile + resume embedding (user_match_profiles).
+After an ingest, refresh_all_matches scores the jobs updated since each profile's matched_at
+and merges them into the user's existing ranked list, so cost tracks the job delta rather
+than the full parse → embed → search pipeline.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.job import Job
+from app.models.match_result_cache import MatchResultCache
+from app.models.user_match_profile import UserMatchProfile
+from app.services.job_expiry import live_job_clause
+from app.services.job_filter import filter_jobs
+from app.services.match_result_cache import load_ranking, save_match_results
+from app.services.matching import ResumeContext, retrieve_candidates
+from app.services.scoring import ScoredJob, build_match_result, order_scored, score_jobs
+
+logger = logging.getLogger(__name__)
+
+
+def db_now(db: Session) -> datetime:
+    """Database clock (used as the matched_at snapshot so app/DB clock skew can't drop jobs)."""
+    return db.execute(select(func.now())).scalar_one()
+
+
+def save_match_profile(
+    db: Session,
+    user_id: str,
+    resume: ResumeContext,
+    summary: str,
+    matched_at: datetime,
+    commit: bool = True,
+) -> None:
+    """Upsert the user's parsed profile + embedding. matched_at = snapshot the results were computed at."""
+    row = db.query(UserMatchProfile).filter(UserMatchProfile.user_id == user_id).first()
+    if row is None:
+        row = UserMatchProfile(user_id=user_id)
+        db.add(row)
+    row.domain = resume.domain
+    row.years_experience = resume.years_experience
+    row.country = resume.country
+    row.skills = list(resume.skills or [])
+    row.summary = summary or ""
+    row.resume_embedding = [float(x) for x in resume.resume_embedding]
+    row.matched_at = matched_at
+    if commit:
+        db.commit()
+
+
+def _merge_rankings(existing: List[ScoredJob], fresh: List[ScoredJob], limit: int) -> List[ScoredJob]:
+    """Merge two score-descending lists (fresh entries replace existing ones for the same job); top limit kept."""
+    fresh_ids = {s.job_id for s in fresh}
+    kept = [s for s in existing if s.job_id not in fresh_ids]
+    return list(itertools.islice(heapq.merge(kept, fresh, key=lambda s: s.score, reverse=True), limit))
+
+
+def _still_valid(db: Session, ranking: List[ScoredJob], matched_at: datetime | None) -> set[str]:
+    """Ids from ranking whose stored score still holds: job is live and unchanged since matched_at.
+
+    Changed jobs only come back through the fresh delta (if they still pass the filter).
+    """
+    ids = [s.job_id for s in ranking]
+    if not ids:
+        return set()
+    query = db.query(Job.id).filter(Job.id.in_(ids)).filter(live_job_clause())
+    if matched_at is not None:
+        query = query.filter(Job.updated_at <= matched_at)
+    return {row[0] for row in query.all()}
+
+
+def refresh_user_matches(db: Session, profile: UserMatchProfile) -> int:
+    """Score jobs changed since profile.matched_at and merge into the user's cached ranking.
+
+    Stored entries for jobs that expired, were removed or changed (re-scored or no longer passing
+    the filter) are dropped first. Nothing is committed; the caller commits (holding its row lock).
+    Returns the number of delta jobs scored. Users without a cached list (e.g. logged out) are skipped.
+    """
+    cache = db.query(MatchResultCache).filter(MatchResultCache.user_id == profile.user_id).first()
+    if cache is None:
+        return 0
+
+    snapshot = db_now(db)
+    delta_ids = filter_jobs(
+        db=db,
+        candidate_domain=profile.domain,
+        candidate_yoe=profile.years_experience,
+        candidate_country=profile.country,
+        changed_since=profile.matched_at,
+    )
+    existing = load_ranking(db, profile.user_id)
+    valid = _still_valid(db, existing, profile.matched_at)
+    kept = [s for s in existing if s.job_id in valid]
+    if not delta_ids and len(kept) == len(existing):
+        profile.matched_at = snapshot
+        return 0
+
+    fresh: List[ScoredJob] = []
+    skills = list(profile.skills or [])
+    if delta_ids:
+        resume = ResumeContext(
+            id=profile.user_id,
+            domain=profile.domain,
+            years_experience=profile.years_experience,
+            country=profile.country,
+            skills=skills,
+            resume_embedding=[float(x) for x in profile.resume_embedding],
+        )
+        # Same retrieval as a full run (ANN top-K ∪ skill-overlap hits), over the changed jobs only
+        jobs, semantic_scores = retrieve_candidates(db, resume, delta_ids)
+        fresh = order_scored(score_jobs(skills, profile.years_experience, jobs, semantic_scores))
+    # Capped at a full run's candidate budget (ANN top-K + skill-overlap hits), so the stored list
+    # can't grow with every refresh
+    merged = _merge_rankings(kept, fresh, settings.ANN_TOP_K + max(0, settings.HYBRID_SKILL_TOP_K))
+
+    top = merged[: settings.MATCH_MATERIALISE_TOP_N]
+    top_jobs = db.query(Job).filter(Job.id.in_([s.job_id for s in top])).all()
+    id_to_job = {j.id: j for j in top_jobs}
+    matches = [build_match_result(id_to_job[s.job_id], s, skills) for s in top if s.job_id in id_to_job]
+
+    save_match_results(
+        db,
+        profile.user_id,
+        len(merged),
+        matches,
+        ranking=merged,
+        resume_skills=skills,
+        commit=False,
+    )
+    profile.matched_at = snapshot
+    logger.info(
+        "Refreshed matches for user %s: %d delta jobs, %d dropped, %d total",
+        profile.user_id,
+        len(delta_ids),
+        len(existing) - len(kept),
+        len(merged),
+    )
+    return len(delta_ids)
+
+
+def refresh_all_matches(db: Session) -> tuple[int, int]:
+    """Refresh every stored profile. Returns (profiles refreshed, delta jobs scored in total)."""
+    user_ids = [row[0] for row in db.query(UserMatchProfile.user_id).all()]
+    refreshed = 0
+    scored = 0
+    for user_id in user_ids:
+        # Row lock (held until the single commit below) so a concurrent upload can't interleave
+        profile = (
+            db.query(UserMatchProfile)
+            .filter(UserMatchProfile.user_id == user_id)
+            .with_for_update()
+            .first()
+        )
+        if profile is None:
+            db.rollback()
+            continue
+        try:
+            n = refresh_user_matches(db, profile)
+        except Exception:
+            logger.exception("Refresh failed for user %s", user_id)
+            db.rollback()
+            continue
+        db.commit()
+        if n:
+            refreshed += 1
+            scored += n
+    return refreshed, scored
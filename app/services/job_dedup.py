@@ -0,0 +1,153 @@
+"""Near-duplicate job detection at ingest (MinHash + LSH, confirmed by embedding similarity).
+
+Each posting is fingerprinted as a MinHash signature over word shingles of its title, company,
+location and description. Signatures are split into LSH bands stored in job_fingerprint_bands,
+so finding candidates is an indexed lookup on (band, bucket) rather than a scan. A candidate is a
+duplicate when its estimated Jaccard similarity passes DEDUP_MINHASH_THRESHOLD and, when both
+jobs have embeddings, their cosine similarity passes DEDUP_EMBEDDING_THRESHOLD.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import random
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.job import Job
+from app.models.job_fingerprint import JobFingerprint, JobFingerprintBand
+from app.models.saved_job import SavedJob
+from app.services.job_neighbors import mark_dependents_stale
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 64
+BANDS = 16  # 16 bands x 4 rows: candidate probability ~50% at Jaccard 0.5, ~99% at 0.8
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+_MERSENNE_PRIME = (1 << 61) - 1
+
+_rng = random.Random(0x10B5)  # fixed seed: signatures must be stable across processes/runs
+_PERMUTATIONS: List[Tuple[int, int]] = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERM)
+]
+_TOKEN_RE = re.compile(r"[a-z0-9+#.]+")
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _shingles(job: Job) -> set[str]:
+    text = " ".join(
+        [job.title or "", job.company_name or "", job.location or "", job.description or ""]
+    ).lower()
+    tokens = _TOKEN_RE.findall(text)
+    if len(tokens) < SHINGLE_SIZE:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i : i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+
+
+def minhash_signature(job: Job) -> List[int]:
+    """MinHash signature (NUM_PERM values < 2^61, so they fit a signed BIGINT)."""
+    hashes = [_hash64(s) % _MERSENNE_PRIME for s in _shingles(job)]
+    if not hashes:
+        return [_MERSENNE_PRIME - 1] * NUM_PERM
+    return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def band_buckets(signature: List[int]) -> List[Tuple[int, int]]:
+    """(band, bucket) LSH keys for a signature; bucket is a signed 64-bit hash of the band's rows."""
+    out = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(",".join(map(str, rows)).encode("ascii"), digest_size=8).digest()
+        out.append((band, int.from_bytes(digest, "big", signed=True)))
+    return out
+
+
+def estimated_jaccard(a: List[int], b: List[int]) -> float:
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_PERM
+
+
+def _cosine(a, b) -> float:
+    dot = sum(float(x) * float(y) for x, y in zip(a, b))
+    na = math.sqrt(sum(float(x) * float(x) for x in a))
+    nb = math.sqrt(sum(float(y) * float(y) for y in b))
+    return dot / (na * nb) if na and nb else 0.0
+
+
+def find_duplicate(
+    db: Session,
+    signature: List[int],
+    embedding: Optional[list] = None,
+    exclude_id: str | None = None,
+) -> Optional[str]:
+    """Return the canonical job id this posting duplicates, or None."""
+    buckets = band_buckets(signature)
+    query = db.query(JobFingerprintBand.job_id).filter(
+        tuple_(JobFingerprintBand.band, JobFingerprintBand.bucket).in_(buckets)
+    )
+    if exclude_id:
+        query = query.filter(JobFingerprintBand.job_id != exclude_id)
+    candidate_ids = {row[0] for row in query.distinct().all()}
+    if not candidate_ids:
+        return None
+
+    best: Tuple[float, str] | None = None
+    rows = (
+        db.query(JobFingerprint.job_id, JobFingerprint.signature, Job.job_embedding)
+        .join(Job, Job.id == JobFingerprint.job_id)
+        .filter(JobFingerprint.job_id.in_(candidate_ids))
+        .all()
+    )
+    for job_id, cand_sig, cand_emb in rows:
+        jaccard = estimated_jaccard(signature, cand_sig)
+        if jaccard < settings.DEDUP_MINHASH_THRESHOLD:
+            continue
+        if embedding is not None and cand_emb is not None:
+            if _cosine(embedding, cand_emb) < settings.DEDUP_EMBEDDING_THRESHOLD:
+                continue
+        if best is None or jaccard > best[0]:
+            best = (jaccard, job_id)
+    return best[1] if best else None
+
+
+def add_fingerprint(db: Session, job_id: str, signature: List[int]) -> None:
+    """Index a (canonical) job's signature. Caller commits."""
+    db.add(JobFingerprint(job_id=job_id, signature=signature, duplicates_seen=0))
+    db.add_all(
+        JobFingerprintBand(band=band, bucket=bucket, job_id=job_id)
+        for band, bucket in band_buckets(signature)
+    )
+
+
+def record_duplicate(db: Session, canonical_id: str) -> None:
+    """Count an ingested posting collapsed into canonical_id. Caller commits."""
+    db.query(JobFingerprint).filter(JobFingerprint.job_id == canonical_id).update(
+        {JobFingerprint.duplicates_seen: JobFingerprint.duplicates_seen + 1}
+    )
+
+
+def collapse_into(db: Session, duplicate_id: str, canonical_id: str) -> None:
+    """Fold an existing duplicate job into its canonical job: move saves, then delete it. Caller commits."""
+    saved_by = [
+        row[0]
+        for row in db.query(SavedJob.user_id).filter(SavedJob.job_id == canonical_id).all()
+    ]
+    db.query(SavedJob).filter(
+        SavedJob.job_id == duplicate_id, SavedJob.user_id.notin_(saved_by)
+    ).update({SavedJob.job_id: canonical_id}, synchronize_session=False)
+    # Users who had saved both keep the canonical save; saved_jobs has no FK to clean up the rest
+    db.query(SavedJob).filter(SavedJob.job_id == duplicate_id).delete(synchronize_session=False)
+    mark_dependents_stale(db, [duplicate_id])  # Lists thinned by the cascade get refilled
+    duplicate = db.get(Job, duplicate_id)
+    if duplicate is not None:
+        db.delete(duplicate)  # ORM delete, so job_summary_cache's after_delete hook evicts it
+    record_duplicate(db, canonical_id)
@@ -0,0 +1,123 @@
+"""Job expiry policy and archival.
+
+A job is live while its explicit expires_at (if any) is in the future and, when
+JOB_MAX_AGE_DAYS > 0, it was created within that many days. Hot-path queries (filters,
+vector search, listing) only consider live jobs; archive_expired_jobs periodically moves
+expired rows into jobs_archive so the jobs table and its HNSW/GIN indexes hold live postings only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import and_, func, or_, text
+from sqlalchemy.orm import Session
+
+from app.config.database import SessionLocal, try_advisory_lock
+from app.config.settings import settings
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+_ARCHIVE_COLUMNS = (
+    "id, source, title, company_name, description, domain, subdomain, "
+    "years_experience_min, years_experience_max, skills_required, location, country, "
+    "remote, salary_min, salary_max, expires_at, created_at, updated_at"
+)
+
+
+def live_job_clause():
+    """SQLAlchemy filter for live (non-expired) jobs."""
+    clause = or_(Job.expires_at.is_(None), Job.expires_at > func.now())
+    if settings.JOB_MAX_AGE_DAYS > 0:
+        clause = and_(clause, Job.created_at > func.now() - timedelta(days=settings.JOB_MAX_AGE_DAYS))
+    return clause
+
+
+def live_job_sql(alias: str = "") -> str:
+    """Raw-SQL form of live_job_clause (for psycopg2 queries)."""
+    p = f"{alias}." if alias else ""
+    sql = f"({p}expires_at IS NULL OR {p}expires_at > now())"
+    if settings.JOB_MAX_AGE_DAYS > 0:
+        sql += f" AND {p}created_at > now() - make_interval(days => {int(settings.JOB_MAX_AGE_DAYS)})"
+    return sql
+
+
+def archive_expired_jobs(db: Session, batch_size: int | None = None) -> int:
+    """Move expired jobs to jobs_archive in batches (one DELETE ... RETURNING → INSERT each). Returns count."""
+    batch_size = batch_size or settings.JOB_ARCHIVE_BATCH_SIZE
+    sql = text(
+        f"""
+        WITH moved AS (
+            DELETE FROM jobs
+            WHERE id IN (
+                SELECT id FROM jobs
+                WHERE NOT ({live_job_sql()})
+                ORDER BY created_at
+                LIMIT :batch_size
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING {_ARCHIVE_COLUMNS}
+        ),
+        -- Neighbour lists thinned by the cascade are rebuilt on the next job_neighbors pass
+        thinned AS (
+            UPDATE jobs SET neighbors_built_at = NULL
+            WHERE id IN (SELECT job_id FROM job_neighbors WHERE neighbor_id IN (SELECT id FROM moved))
+              AND id NOT IN (SELECT id FROM moved)
+        )
+        INSERT INTO jobs_archive ({_ARCHIVE_COLUMNS})
+        SELECT {_ARCHIVE_COLUMNS} FROM moved
+        ON CONFLICT (id) DO NOTHING
+        """
+    )
+    total = 0
+    while True:
+        moved = db.execute(sql, {"batch_size": batch_size}).rowcount
+        db.commit()
+        total += moved
+        if moved < batch_size:
+            break
+    if total:
+        logger.info("Archived %d expired job(s).", total)
+    return total
+
+
+def archive_expired_jobs_standalone() -> int:
+    """Run archive_expired_jobs with its own DB session. Use from a thread.
+
+    Only one process archives per cycle (advisory lock); the others skip.
+    """
+    with try_advisory_lock("job_archiver") as held:
+        if not held:
+            return 0
+        db = SessionLocal()
+        try:
+            return archive_expired_jobs(db)
+        finally:
+            db.close()
+
+
+async def _archiver_loop(interval: float) -> None:
+    """Long-lived task: periodically archive expired jobs."""
+    logger.info("Job archiver started (every %.0fs).", interval)
+    while True:
+        try:
+            await asyncio.to_thread(archive_expired_jobs_standalone)
+            await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            logger.info("Job archiver cancelled.")
+            break
+        except Exception as e:
+            logger.exception("Job archiver error: %s", e)
+            await asyncio.sleep(interval)
+
+
+def start_job_archiver() -> asyncio.Task[Any] | None:
+    """Start the background archiver task (None if disabled). Call from app startup."""
+    interval = settings.JOB_ARCHIVE_INTERVAL_SECONDS
+    if interval <= 0:
+        return None
+    return asyncio.create_task(_archiver_loop(interval))
@@ -7,12 +7,14 @@ YoE band: job range overlaps [candidate_yoe - 2, candidate_yoe + 2].
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from typing import List
 
 from sqlalchemy.orm import Session
 
 from app.config.database import SessionLocal
 from app.models.job import Job
+from app.services.job_expiry import live_job_clause
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +26,15 @@ def filter_jobs(
     candidate_domain: str,
     candidate_yoe: int,
     candidate_country: str | None = None,
+    changed_since: datetime | None = None,
 ) -> List[str]:
     """Return job IDs that pass country (if set), domain, and YoE band.
 
     - Country: job.country IS NULL OR job.country = candidate_country
     - Domain: exact match
     - YoE: job range overlaps [candidate_yoe - 2, candidate_yoe + 2]
+    - Live only: not past expires_at / JOB_MAX_AGE_DAYS
+    - changed_since (optional): only jobs added/updated after this instant (incremental re-match)
     """
     delta_min = max(0, candidate_yoe - YOE_WINDOW)
     delta_max = candidate_yoe + YOE_WINDOW
@@ -40,11 +45,14 @@ def filter_jobs(
         .filter(Job.years_experience_min <= delta_max)
         .filter(Job.years_experience_max >= delta_min)
         .filter(Job.job_embedding.isnot(None))
+        .filter(live_job_clause())
     )
     if candidate_country:
         query = query.filter(
             (Job.country.is_(None)) | (Job.country == candidate_country)
         )
+    if changed_since is not None:
+        query = query.filter(Job.updated_at > changed_since)
 
     rows = query.all()
     job_ids = [row[0] for row in rows]
@@ -0,0 +1,193 @@
+"""Precomputed job-to-job nearest neighbours (job_neighbors table).
+
+For each job, the top JOB_NEIGHBORS_K jobs by cosine similarity of job_embedding, restricted
+by the same rules as job_filter: same domain, and country compatible (either side NULL or equal).
+Built incrementally: only jobs that are new or updated since their neighbours were built
+(jobs.neighbors_built_at, so jobs with no neighbours are not retried forever) are recomputed, and each new job is offered to its neighbours' lists so existing jobs pick it up.
+Lists that contain a deleted, archived or re-embedded job are marked stale (neighbors_built_at
+reset) so they are refilled / rescored on the next pass. Builders hold the "job_neighbors" lock.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, List, Tuple
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.config.database import SessionLocal, try_advisory_lock
+from app.config.settings import settings
+from app.models.job import Job
+from app.models.job_neighbor import JobNeighbor
+from app.services.job_expiry import live_job_clause, live_job_sql
+
+logger = logging.getLogger(__name__)
+
+
+def _compute_neighbors(db: Session, job: Job, k: int) -> List[Tuple[str, float]]:
+    """HNSW query: top k (neighbor_id, similarity) for a job under the domain/country rules."""
+    from pgvector import Vector
+    from pgvector.psycopg2 import register_vector
+
+    raw_conn = db.connection().connection
+    register_vector(raw_conn, globally=True)
+    vec_param = Vector([float(x) for x in job.job_embedding])
+
+    sql = f"""
+        SELECT id, (1 - (job_embedding <=> %(vec)s)) AS score
+        FROM jobs
+        WHERE id <> %(job_id)s
+          AND domain = %(domain)s
+          AND job_embedding IS NOT NULL
+          AND {live_job_sql()}
+          AND (%(country)s::text IS NULL OR country IS NULL OR country = %(country)s)
+        ORDER BY job_embedding <=> %(vec)s
+        LIMIT %(k)s
+    """
+    with raw_conn.cursor() as cursor:
+        # HNSW filters after the index scan; widen the search so filtered results still fill k
+        cursor.execute("SET LOCAL hnsw.ef_search = %s", (max(40, k * 4),))
+        cursor.execute(
+            sql,
+            {"vec": vec_param, "job_id": job.id, "domain": job.domain, "country": job.country, "k": k},
+        )
+        rows = cursor.fetchall()
+    return [(row[0], float(row[1])) for row in rows]
+
+
+def _store_neighbors(db: Session, job_id: str, neighbors: List[Tuple[str, float]]) -> None:
+    db.query(JobNeighbor).filter(JobNeighbor.job_id == job_id).delete()
+    db.add_all(
+        JobNeighbor(job_id=job_id, rank=rank, neighbor_id=nid, score=score)
+        for rank, (nid, score) in enumerate(neighbors)
+    )
+
+
+def _offer_neighbor(db: Session, job_id: str, candidate_id: str, score: float, k: int) -> None:
+    """Insert candidate into job_id's neighbour list if it ranks within the top k."""
+    rows = (
+        db.query(JobNeighbor)
+        .filter(JobNeighbor.job_id == job_id)
+        .order_by(JobNeighbor.rank)
+        .all()
+    )
+    current = [(r.neighbor_id, r.score) for r in rows if r.neighbor_id != candidate_id]
+    if len(current) >= k and score <= current[-1][1]:
+        return
+    merged = sorted(current + [(candidate_id, score)], key=lambda t: t[1], reverse=True)[:k]
+    db.query(JobNeighbor).filter(JobNeighbor.job_id == job_id).delete()
+    db.flush()
+    db.add_all(
+        JobNeighbor(job_id=job_id, rank=rank, neighbor_id=nid, score=s)
+        for rank, (nid, s) in enumerate(merged)
+    )
+
+
+def mark_dependents_stale(db: Session, job_ids: List[str]) -> None:
+    """Queue a rebuild of every other job whose neighbour list contains job_ids. Caller commits."""
+    dependents = select(JobNeighbor.job_id).where(JobNeighbor.neighbor_id.in_(job_ids))
+    db.execute(
+        update(Job)
+        .where(Job.id.in_(dependents), Job.id.notin_(job_ids))
+        .values(neighbors_built_at=None, updated_at=Job.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def stale_job_ids(db: Session) -> List[str]:
+    """Jobs with an embedding whose neighbours were never built or predate the job's last update."""
+    sql = f"""
+        SELECT j.id FROM jobs j
+        WHERE j.job_embedding IS NOT NULL
+          AND {live_job_sql("j")}
+          AND (j.neighbors_built_at IS NULL OR j.neighbors_built_at < j.updated_at)
+        ORDER BY j.created_at
+    """
+    raw_conn = db.connection().connection
+    with raw_conn.cursor() as cursor:
+        cursor.execute(sql)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def build_neighbors(db: Session, job_ids: List[str], k: int | None = None) -> int:
+    """(Re)build neighbour lists for job_ids and offer each job to its neighbours. Returns jobs built."""
+    k = k or settings.JOB_NEIGHBORS_K
+    built = 0
+    for job_id in job_ids:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if job is None or job.job_embedding is None:
+            continue
+        if job.neighbors_built_at is not None and job.updated_at > job.neighbors_built_at:
+            # Changed since its last build: other lists hold it with a stale score
+            mark_dependents_stale(db, [job.id])
+        neighbors = _compute_neighbors(db, job, k)
+        _store_neighbors(db, job.id, neighbors)
+        for nid, score in neighbors:
+            _offer_neighbor(db, nid, job.id, score, k)
+        # Core update naming updated_at so its onupdate doesn't fire (that would re-stale the job)
+        db.execute(
+            update(Job)
+            .where(Job.id == job.id)
+            .values(neighbors_built_at=func.now(), updated_at=Job.updated_at)
+        )
+        db.commit()
+        built += 1
+    if built:
+        logger.info("Built job neighbours for %d job(s) (k=%d)", built, k)
+    return built
+
+
+def build_stale_neighbors(k: int | None = None) -> int:
+    """Build neighbours for all new/updated jobs with its own DB session. Use from a thread.
+
+    Only one process builds per cycle (advisory lock); others skip rather than race on job_neighbors.
+    """
+    with try_advisory_lock("job_neighbors") as held:
+        if not held:
+            return 0
+        db = SessionLocal()
+        try:
+            return build_neighbors(db, stale_job_ids(db), k)
+        finally:
+            db.close()
+
+
+def get_similar_jobs(db: Session, job_id: str, limit: int) -> List[Tuple[Job, float]]:
+    """Single indexed lookup: precomputed neighbours of job_id joined to jobs, best first."""
+    rows = (
+        db.query(Job, JobNeighbor.score)
+        .join(JobNeighbor, JobNeighbor.neighbor_id == Job.id)
+        .filter(JobNeighbor.job_id == job_id, live_job_clause())
+        .order_by(JobNeighbor.rank)
+        .limit(limit)
+        .all()
+    )
+    return [(job, float(score)) for job, score in rows]
+
+
+async def _builder_loop(interval: float) -> None:
+    """Long-lived task: periodically build neighbours for new/updated jobs."""
+    logger.info("Job neighbour builder started (every %.0fs).", interval)
+    while True:
+        try:
+            await asyncio.to_thread(build_stale_neighbors)
+        except asyncio.CancelledError:
+            logger.info("Job neighbour builder cancelled.")
+            break
+        except Exception as e:
+            logger.exception("Job neighbour builder error: %s", e)
+        try:
+            await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            logger.info("Job neighbour builder cancelled.")
+            break
+
+
+def start_neighbor_builder() -> asyncio.Task[Any] | None:
+    """Start the background builder task (None if disabled). Call from app startup."""
+    interval = settings.JOB_NEIGHBORS_REFRESH_SECONDS
+    if interval <= 0:
+        return None
+    return asyncio.create_task(_builder_loop(interval))
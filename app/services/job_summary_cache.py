@@ -0,0 +1,90 @@
+"""In-process cache of serialised job payloads, keyed by job id and validated by updated_at.
+
+Listing, saved-jobs and ranking otherwise re-run pydantic validation over every ORM row on
+every request. Entries hold the JobResponse JSON bytes (spliced directly into list responses)
+and the JobSummary model (reused by MatchResult). An entry is only used when its updated_at
+matches the row just loaded, so updates from any process invalidate it; ORM updates/deletes in
+this process also evict eagerly. Bounded LRU (JOB_SUMMARY_CACHE_SIZE entries).
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import event
+
+from app.config.settings import settings
+from app.models.job import Job
+from app.schemas.jobs import JobResponse
+from app.schemas.matching import JobSummary
+
+
+class _Entry(NamedTuple):
+    updated_at: datetime | None
+    response_json: bytes
+    summary: JobSummary
+
+
+_cache: OrderedDict[str, _Entry] = OrderedDict()
+_lock = threading.Lock()  # sync routes run on the threadpool
+
+
+def _entry(job: Job) -> _Entry:
+    updated_at = job.updated_at
+    with _lock:
+        entry = _cache.get(job.id)
+        if entry is not None and entry.updated_at == updated_at:
+            _cache.move_to_end(job.id)
+            return entry
+
+    entry = _Entry(
+        updated_at=updated_at,
+        response_json=JobResponse.model_validate(job).model_dump_json().encode("utf-8"),
+        summary=JobSummary.model_validate(job),
+    )
+    with _lock:
+        _cache[job.id] = entry
+        _cache.move_to_end(job.id)
+        while len(_cache) > settings.JOB_SUMMARY_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return entry
+
+
+def job_summary(job: Job) -> JobSummary:
+    """JobSummary for a job (cached; do not mutate)."""
+    return _entry(job).summary
+
+
+def job_response_json(job: Job) -> bytes:
+    """Serialised JobResponse for a job (cached)."""
+    return _entry(job).response_json
+
+
+def jobs_json_array(jobs: Iterable[Job]) -> bytes:
+    """JSON array of JobResponse payloads built from cached fragments."""
+    return b"[" + b",".join(job_response_json(j) for j in jobs) + b"]"
+
+
+def json_value(value) -> bytes:
+    """Encode a scalar (cursor, score, ...) for splicing into a hand-built JSON body."""
+    return json.dumps(value).encode("utf-8")
+
+
+def invalidate_job(job_id: str) -> None:
+    with _lock:
+        _cache.pop(job_id, None)
+
+
+def invalidate_all() -> None:
+    with _lock:
+        _cache.clear()
+
+
+@event.listens_for(Job, "after_update")
+@event.listens_for(Job, "after_delete")
+def _evict_on_change(mapper, connection, target: Job) -> None:
+    invalidate_job(target.id)
@@ -0,0 +1,324 @@
+"""Parse resumes in-process (PyMuPDF / python-docx / plain text) with Reducto as fallback.
+
+Extracts the same shape as the Reducto pipeline: domain, yoe, country, skills[], summary.
+Skills come from a dictionary compiled from the skills jobs actually ask for (so every skill found
+can match something), which also votes for the domain. YoE, country and summary use heuristics.
+A confidence score decides whether the result is used or the resume goes to Reducto
+(RESUME_PARSER=auto, LOCAL_PARSER_MIN_CONFIDENCE); RESUME_PARSER=local never calls Reducto.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import logging
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import date
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import text
+
+from app.config.database import SessionLocal
+from app.config.settings import settings
+from app.services.reducto_parser import parse_resume_with_reducto
+from app.services.resilience import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+LOCAL_PARSER_VERSION = "1"
+VOCABULARY_REFRESH_SECONDS = 300
+MIN_TEXT_CHARS = 200  # Less than this is most likely a scanned PDF with no text layer
+SUMMARY_MAX_CHARS = 600
+
+# Fallback domain cues when the jobs table has no skills yet; also catch titles ("nurse", "attorney")
+DOMAIN_KEYWORDS: Dict[str, List[str]] = {
+    "Engineering": ["software engineer", "developer", "backend", "frontend", "devops", "programming", "full stack"],
+    "Finance": ["financial", "finance", "investment", "accounting", "valuation", "banking", "fp&a"],
+    "Healthcare": ["clinical", "nurse", "nursing", "patient", "medical", "hospital", "pharma"],
+    "Design": ["designer", "ux", "ui design", "figma", "prototyping", "visual design", "user research"],
+    "Legal": ["attorney", "counsel", "legal", "litigation", "paralegal", "law firm", "contract law"],
+    "Sales & Marketing": ["sales", "marketing", "seo", "campaigns", "account executive", "brand", "lead generation"],
+}
+
+# ISO 3166 alpha-3 (the codes jobs use) → names and major cities that identify it
+COUNTRY_ALIASES: Dict[str, List[str]] = {
+    "USA": ["united states", "usa", "u.s.a.", "san francisco", "new york", "seattle", "austin", "boston",
+            "chicago", "los angeles", "denver", "washington, dc", "houston"],
+    "GBR": ["united kingdom", "uk", "england", "scotland", "london", "manchester"],
+    "IND": ["india", "bangalore", "bengaluru", "mumbai", "hyderabad", "delhi", "pune", "chennai"],
+    "DEU": ["germany", "berlin", "munich"],
+    "CAN": ["canada", "toronto", "vancouver", "montreal"],
+    "AUS": ["australia", "sydney", "melbourne"],
+    "SGP": ["singapore"],
+    "JPN": ["japan", "tokyo"],
+    "FRA": ["france", "paris"],
+    "NLD": ["netherlands", "amsterdam"],
+    "IRL": ["ireland", "dublin"],
+    "ARE": ["united arab emirates", "uae", "dubai", "abu dhabi"],
+    "ISR": ["israel", "tel aviv"],
+    "SWE": ["sweden", "stockholm"],
+    "CHE": ["switzerland", "zurich", "geneva"],
+    "HKG": ["hong kong"],
+}
+
+_EXPLICIT_YOE_RE = re.compile(
+    r"(\d{1,2})\s*\+?\s*(?:years|yrs)\.?\s+(?:of\s+)?(?:professional\s+|industry\s+|work\s+|relevant\s+)?experience",
+    re.IGNORECASE,
+)
+_YEAR_RANGE_RE = re.compile(
+    r"\b((?:19|20)\d{2})\s*(?:-|–|—|to)\s*((?:19|20)\d{2}|present|current|now|today)\b",
+    re.IGNORECASE,
+)
+_SUMMARY_HEADING_RE = re.compile(
+    r"^\s*(?:professional\s+summary|summary|profile|about\s+me|objective|career\s+objective)\s*:?\s*$",
+    re.IGNORECASE,
+)
+
+
+def _alternation(terms: List[str]) -> str:
+    return "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+
+
+def _bounded(terms: List[str], flags: int = 0) -> re.Pattern[str] | None:
+    if not terms:
+        return None
+    return re.compile(rf"(?<![A-Za-z0-9])(?:{_alternation(terms)})(?![A-Za-z0-9])", flags)
+
+
+_COUNTRY_LOOKUP = {alias: code for code, aliases in COUNTRY_ALIASES.items() for alias in aliases}
+_COUNTRY_RE = _bounded(list(_COUNTRY_LOOKUP), re.IGNORECASE)
+_DOMAIN_KEYWORD_RES = {d: _bounded(words, re.IGNORECASE) for d, words in DOMAIN_KEYWORDS.items()}
+
+
+class _Vocabulary:
+    """Skill dictionary compiled from jobs: display form + per-domain counts per skill."""
+
+    def __init__(self, rows: List[Tuple[str, str, int]]) -> None:
+        self.display: Dict[str, str] = {}
+        self.domains: Dict[str, Counter] = defaultdict(Counter)
+        for domain, skill, count in rows:
+            key = skill.strip().lower()
+            if not key:
+                continue
+            self.display.setdefault(key, skill.strip())
+            self.domains[key][domain] += count
+        # Short skills ("R", "Go", "C#") only match with their exact casing to avoid English words
+        short = [self.display[k] for k in self.display if len(k) <= 3]
+        long = [k for k in self.display if len(k) > 3]
+        self.short_re = _bounded(short)
+        self.long_re = _bounded(long, re.IGNORECASE)
+        # Changes when a skill (or the domain it mostly belongs to) appears or disappears; part of
+        # the parse cache key so cached local parses don't outlive the dictionary they were made with
+        signature = "\n".join(
+            f"{key}\t{self.domains[key].most_common(1)[0][0]}" for key in sorted(self.display)
+        )
+        self.version = hashlib.sha256(signature.encode("utf-8")).hexdigest()[:12]
+
+    def find(self, resume_text: str) -> List[str]:
+        found: Dict[str, None] = {}
+        for pattern in (self.long_re, self.short_re):
+            if pattern is None:
+                continue
+            for m in pattern.finditer(resume_text):
+                found.setdefault(m.group(0).lower(), None)
+        return [self.display[k] for k in found if k in self.display]
+
+
+_vocabulary: _Vocabulary | None = None
+_vocabulary_loaded_at = 0.0
+_vocabulary_lock = threading.Lock()
+
+
+def _load_vocabulary() -> _Vocabulary:
+    global _vocabulary, _vocabulary_loaded_at
+    with _vocabulary_lock:
+        if _vocabulary is not None and time.monotonic() - _vocabulary_loaded_at < VOCABULARY_REFRESH_SECONDS:
+            return _vocabulary
+        with SessionLocal() as db:
+            rows = db.execute(
+                text(
+                    """
+                    SELECT j.domain, s.skill, count(*)
+                    FROM jobs j, jsonb_array_elements_text(j.skills_required) AS s(skill)
+                    GROUP BY j.domain, s.skill
+                    """
+                )
+            ).all()
+        _vocabulary = _Vocabulary([tuple(r) for r in rows])
+        _vocabulary_loaded_at = time.monotonic()
+        logger.info("Local parser skill dictionary: %d skills", len(_vocabulary.display))
+        return _vocabulary
+
+
+def extract_text(file_bytes: bytes, filename: str) -> str:
+    """Text of a PDF, DOCX or plain-text resume."""
+    lower = filename.lower()
+    if lower.endswith(".pdf"):
+        try:
+            import fitz
+        except ImportError as e:
+            raise ValueError("pymupdf package is not installed. pip install pymupdf") from e
+        with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+            return "\n".join(page.get_text() for page in doc)
+    if lower.endswith(".docx"):
+        try:
+            from docx import Document
+        except ImportError as e:
+            raise ValueError("python-docx package is not installed. pip install python-docx") from e
+        document = Document(io.BytesIO(file_bytes))
+        parts = [p.text for p in document.paragraphs]
+        for table in document.tables:
+            for row in table.rows:
+                parts.append(" | ".join(cell.text for cell in row.cells))
+        return "\n".join(parts)
+    try:
+        return file_bytes.decode("utf-8")
+    except UnicodeDecodeError:
+        return file_bytes.decode("latin-1")
+
+
+def _infer_domain(resume_text: str, skills: List[str], vocab: _Vocabulary) -> Tuple[str, float]:
+    """(domain, share of the evidence behind it); ("Engineering", 0.0) when there is none."""
+    scores: Counter = Counter()
+    for skill in skills:
+        per_domain = vocab.domains.get(skill.lower())
+        if per_domain:
+            total = sum(per_domain.values())
+            for domain, count in per_domain.items():
+                scores[domain] += count / total
+    for domain, pattern in _DOMAIN_KEYWORD_RES.items():
+        if pattern is not None:
+            scores[domain] += len(pattern.findall(resume_text))
+    if not scores:
+        return "Engineering", 0.0
+    domain, top = scores.most_common(1)[0]
+    return domain, top / sum(scores.values())
+
+
+def _infer_yoe(resume_text: str) -> int | None:
+    explicit = [int(m.group(1)) for m in _EXPLICIT_YOE_RE.finditer(resume_text)]
+    if explicit:
+        return min(max(explicit), 50)
+    this_year = date.today().year
+    spans = []
+    for start, end in _YEAR_RANGE_RE.findall(resume_text):
+        start_year = int(start)
+        end_year = this_year if not end[:1].isdigit() else int(end)
+        if start_year <= end_year <= this_year:
+            spans.append((start_year, end_year))
+    if not spans:
+        return None
+    # Union of employment spans, so overlapping roles aren't double counted
+    spans.sort()
+    total, cur_start, cur_end = 0, spans[0][0], spans[0][1]
+    for s, e in spans[1:]:
+        if s > cur_end:
+            total += cur_end - cur_start
+            cur_start, cur_end = s, e
+        else:
+            cur_end = max(cur_end, e)
+    total += cur_end - cur_start
+    return min(total, 50)
+
+
+def _infer_country(resume_text: str) -> str:
+    # Contact details are at the top; only fall back to the whole text if the header has nothing
+    for chunk in (resume_text[:1000], resume_text):
+        m = _COUNTRY_RE.search(chunk)
+        if m:
+            return _COUNTRY_LOOKUP[m.group(0).lower()]
+    return ""
+
+
+def _extract_summary(resume_text: str) -> str:
+    lines = [line.strip() for line in resume_text.splitlines()]
+    for i, line in enumerate(lines):
+        if _SUMMARY_HEADING_RE.match(line):
+            body = []
+            for nxt in lines[i + 1:]:
+                if not nxt:
+                    if body:
+                        break
+                    continue
+                if nxt.isupper() and len(nxt) < 40:  # Next section heading
+                    break
+                body.append(nxt)
+            if body:
+                return " ".join(body)[:SUMMARY_MAX_CHARS]
+    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", resume_text) if len(p.strip()) >= 100]
+    return " ".join((paragraphs[0] if paragraphs else resume_text).split())[:SUMMARY_MAX_CHARS]
+
+
+def parse_resume_locally(file_bytes: bytes, filename: str) -> Tuple[Dict[str, Any], float]:
+    """Structured resume dict (Reducto shape) and a 0-1 confidence in it."""
+    resume_text = extract_text(file_bytes, filename)
+    vocab = _load_vocabulary()
+    skills = vocab.find(resume_text)
+    domain, domain_share = _infer_domain(resume_text, skills, vocab)
+    yoe = _infer_yoe(resume_text)
+    country = _infer_country(resume_text)
+    data = {
+        "domain": domain,
+        "yoe": yoe or 0,
+        "country": country,
+        "skills": skills,
+        "summary": _extract_summary(resume_text),
+    }
+    if len(resume_text.strip()) < MIN_TEXT_CHARS:
+        return data, 0.0
+    confidence = (
+        0.4 * min(len(skills) / 5, 1.0)
+        + 0.3 * domain_share
+        + (0.2 if yoe is not None else 0.0)
+        + (0.1 if country else 0.0)
+    )
+    return data, round(confidence, 3)
+
+
+def parser_cache_key() -> str:
+    """Identifies the parser configuration for the parse cache (results differ per mode/pipeline).
+
+    Local modes include the skill dictionary version, so a dictionary rebuild retires old parses.
+    Compute it once per job, before parsing, and use that value for both the lookup and the save.
+    The auto key hashes the pipeline id so it fits resume_parse_cache.pipeline_id (100 chars).
+    """
+    mode = settings.RESUME_PARSER
+    pipeline_id = (settings.REDUCTO_PIPELINE_ID or "").strip()
+    if mode == "reducto":
+        return pipeline_id
+    vocab = _load_vocabulary().version
+    if mode == "local":
+        return f"local-v{LOCAL_PARSER_VERSION}-{vocab}"
+    pipeline = hashlib.sha256(pipeline_id.encode("utf-8")).hexdigest()[:12]
+    return f"auto-v{LOCAL_PARSER_VERSION}-{vocab}-{settings.LOCAL_PARSER_MIN_CONFIDENCE:g}-{pipeline}"
+
+
+async def parse_resume(file_bytes: bytes, filename: str) -> Dict[str, Any]:
+    """Parse per RESUME_PARSER: auto (local, Reducto when unsure) | local | reducto."""
+    mode = settings.RESUME_PARSER
+    if mode == "reducto":
+        return await parse_resume_with_reducto(file_bytes, filename)
+    try:
+        data, confidence = await asyncio.to_thread(parse_resume_locally, file_bytes, filename)
+    except Exception as e:
+        if mode == "local":
+            raise
+        logger.warning("Local parse of %s failed (%s); using Reducto", filename, e)
+        return await parse_resume_with_reducto(file_bytes, filename)
+    if mode == "local" or confidence >= settings.LOCAL_PARSER_MIN_CONFIDENCE:
+        logger.info("Parsed %s locally (confidence %.2f)", filename, confidence)
+        return data
+    if not (settings.REDUCTO_API_KEY or "").strip():
+        logger.info("Local parse of %s has low confidence (%.2f) but Reducto is not configured", filename, confidence)
+        return data
+    logger.info("Local parse of %s has low confidence (%.2f); using Reducto", filename, confidence)
+    try:
+        return await parse_resume_with_reducto(file_bytes, filename)
+    except CircuitOpenError:
+        # Reducto is degraded: a low-confidence local parse beats failing the match
+        logger.warning("Reducto circuit open; using local parse of %s (confidence %.2f)", filename, confidence)
+        return data
@@ -1,73 +1,436 @@
-"""In-memory queue + background worker for match jobs. Status stored in DB (match_jobs)."""
+"""Durable Postgres-backed queue + pool of background workers for match jobs.
+
+Queue state lives in match_jobs (status, attempts, available_at, lease_expires_at) with the
+spooled upload referenced from match_job_payloads, so jobs survive restarts and any number of processes can run
+workers. Workers claim one row at a time with FOR UPDATE SKIP LOCKED, extend their lease while
+processing, and are woken by NOTIFY match_jobs (with a poll fallback for retries and stale leases).
+
+Each worker process runs a staged pipeline: claim → parse → embed → search/rank → persist, joined by
+bounded asyncio queues with a worker count per stage, so network-bound (Reducto, OpenRouter) and
+DB-bound stages overlap across jobs (all DB work runs in worker threads, off the event loop). A full queue blocks the stage feeding it, back to the claimer,
+which stops claiming; unclaimed jobs stay pending in match_jobs, where admission control sees them.
+A job superseded by a newer upload has its running stage cancelled (NOTIFY match_status) and is
+dropped at the next stage boundary otherwise.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from typing import Any
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple
 
+from fastapi import HTTPException
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.config.database import SessionLocal
-from app.models.match_job import MatchJob
+from app.config.settings import settings
+from app.models.match_job import MatchJob, MatchJobPayload
 from app.schemas.matching import MatchResponse
-from app.services.embedding import embed_text
+from app.services.incremental_rematch import db_now, save_match_profile
 from app.services.job_filter import filter_jobs_standalone
 from app.services.match_result_cache import save_match_results
+from app.services.match_status_events import STATUS_CHANNEL, announce
 from app.services.matching import ResumeContext, run_matching_pipeline
-from app.services.reducto_parser import build_resume_meaning, parse_resume_with_reducto
+from app.services.metrics import match_jobs_superseded, match_queue_depth, match_uploads
+from app.services.resume_cache import embed_text_cached, get_cached_parse, save_parse
+from app.services.pg_listener import listen, notify, on_reconnect
+from app.services.local_resume_parser import parse_resume, parser_cache_key
+from app.services.reducto_parser import build_resume_meaning
+from app.services.sharded_matching import check_shard_config, run_sharded_matching, sharding_enabled
+from app.services.upload_spool import SpooledUpload, read_spooled, remove_spooled, sweep_orphaned_spool_files
 
 logger = logging.getLogger(__name__)
 
-# In-memory queue: (job_id, user_id, file_bytes, filename)
-_match_queue: asyncio.Queue[tuple[str, str, bytes, str]] = asyncio.Queue()
+NOTIFY_CHANNEL = "match_jobs"
+
+# Claim the oldest available pending row, or a processing row whose worker stopped renewing its lease
+_CLAIM_SQL = text(
+    """
+    UPDATE match_jobs
+    SET status = 'processing',
+        stage = NULL,
+        attempts = attempts + 1,
+        lease_expires_at = now() + make_interval(secs => :lease),
+        updated_at = now()
+    WHERE id = (
+        SELECT id FROM match_jobs
+        WHERE (status = 'pending' AND available_at <= now())
+           OR (status = 'processing' AND lease_expires_at < now())
+        ORDER BY available_at, created_at
+        FOR UPDATE SKIP LOCKED
+        LIMIT 1
+    )
+    RETURNING id, user_id, attempts
+    """
+)
+
+# Every update on a claimed job is fenced by attempts (bumped per claim): a worker whose lease lapsed
+# and whose job was re-claimed can no longer extend, requeue, release or finish it
+_EXTEND_LEASE_SQL = text(
+    """
+    UPDATE match_jobs
+    SET lease_expires_at = now() + make_interval(secs => :lease)
+    WHERE id = :id AND status = 'processing' AND attempts = :attempts
+    """
+)
+
+_RETRY_SQL = text(
+    """
+    UPDATE match_jobs
+    SET status = 'pending',
+        stage = NULL,
+        error = :error,
+        lease_expires_at = NULL,
+        available_at = now() + make_interval(secs => :delay),
+        updated_at = now()
+    WHERE id = :id AND status = 'processing' AND attempts = :attempts
+    """
+)
+
+
+# Hand a job back untouched (worker shutting down): claimable immediately, attempt not counted
+_RELEASE_SQL = text(
+    """
+    UPDATE match_jobs
+    SET status = 'pending',
+        stage = NULL,
+        attempts = GREATEST(attempts - 1, 0),
+        lease_expires_at = NULL,
+        available_at = now(),
+        updated_at = now()
+    WHERE id = :id AND status = 'processing' AND attempts = :attempts
+    """
+)
+
+
+# One in-flight job per user: a new upload replaces whatever the user still has queued or running
+_SUPERSEDE_SQL = text(
+    """
+    UPDATE match_jobs
+    SET status = 'superseded',
+        stage = NULL,
+        error = :error,
+        lease_expires_at = NULL,
+        updated_at = now()
+    WHERE user_id = :user_id AND status IN ('pending', 'processing')
+    RETURNING id
+    """
+)
+
+# Stage boundary: record the stage, or report that the job is no longer ours (superseded)
+_ENTER_STAGE_SQL = text(
+    """
+    UPDATE match_jobs
+    SET stage = :stage
+    WHERE id = :id AND status = 'processing' AND attempts = :attempts
+    RETURNING id
+    """
+)
+
+SUPERSEDED_ERROR = "Superseded by a newer upload"
+
+_QUEUE_DEPTH_SQL = text("SELECT count(*) FROM match_jobs WHERE status IN ('pending', 'processing')")
+
+_RECENT_COMPLETIONS_SQL = text(
+    """
+    SELECT count(*) FROM match_jobs
+    WHERE status = 'completed' AND updated_at > now() - make_interval(secs => :window)
+    """
+)
+
+
+class ClaimedJob(NamedTuple):
+    id: str
+    user_id: str
+    attempts: int
+
+
+def retry_after_seconds(db: Session, excess: int) -> int:
+    """Seconds until `excess` queued jobs drain, from completions over MATCH_THROUGHPUT_WINDOW_SECONDS."""
+    window = settings.MATCH_THROUGHPUT_WINDOW_SECONDS
+    completed = db.execute(_RECENT_COMPLETIONS_SQL, {"window": window}).scalar() or 0
+    if completed == 0:
+        return settings.MATCH_RETRY_AFTER_MAX_SECONDS
+    seconds = excess * window / completed
+    return int(min(max(seconds, settings.MATCH_RETRY_AFTER_MIN_SECONDS), settings.MATCH_RETRY_AFTER_MAX_SECONDS))
+
+
+def admit_match_job(db: Session) -> None:
+    """Raise 429 with Retry-After when the queue is at MATCH_MAX_PENDING. Call before reading the upload."""
+    if settings.MATCH_MAX_PENDING <= 0:
+        return
+    depth = db.execute(_QUEUE_DEPTH_SQL).scalar() or 0
+    match_queue_depth.set(depth)
+    if depth < settings.MATCH_MAX_PENDING:
+        return
+    retry_after = retry_after_seconds(db, depth - settings.MATCH_MAX_PENDING + 1)
+    db.rollback()
+    match_uploads.inc(outcome="rejected_queue_full")
+    logger.warning("Match queue full (%d jobs); rejecting upload, Retry-After %ds", depth, retry_after)
+    raise HTTPException(
+        status_code=429,
+        detail="Matching is busy right now. Please retry shortly.",
+        headers={"Retry-After": str(retry_after)},
+    )
 
 
 def enqueue_match_job(
     db: Session,
     job_id: str,
     user_id: str,
-    file_bytes: bytes,
+    upload: SpooledUpload,
     filename: str,
 ) -> None:
-    """Insert status row and put work item on the in-memory queue. Call from async route (same thread as loop)."""
-    row = MatchJob(
-        id=job_id,
-        user_id=user_id,
-        status="pending",
-        error=None,
+    """Supersede the user's unfinished job, insert the queue row and payload, and wake a worker on commit."""
+    # Serialise uploads per user so two concurrent ones can't both stay in flight
+    db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:user_id))"), {"user_id": user_id})
+    superseded = db.execute(
+        _SUPERSEDE_SQL, {"user_id": user_id, "error": SUPERSEDED_ERROR}
+    ).scalars().all()
+    stale_files: List[str] = []
+    for old_id in superseded:
+        announce(db, old_id, "superseded", error=SUPERSEDED_ERROR)
+    if superseded:
+        stale_files = _drop_payloads(db, superseded)
+        match_jobs_superseded.inc(len(superseded))
+        logger.info("Upload %s supersedes match job(s) %s", job_id, ", ".join(superseded))
+    db.add(
+        MatchJob(
+            id=job_id,
+            user_id=user_id,
+            status="pending",
+            error=None,
+        )
+    )
+    db.add(
+        MatchJobPayload(
+            job_id=job_id,
+            filename=filename,
+            spool_path=upload.path,
+            sha256=upload.sha256,
+            size_bytes=upload.size,
+        )
+    )
+    notify(db, NOTIFY_CHANNEL, job_id)
+    announce(db, job_id, "pending")
+    db.commit()
+    remove_spooled(*stale_files)
+    match_uploads.inc(outcome="accepted")
+
+
+def _drop_payloads(db: Session, job_ids: List[str]) -> List[str]:
+    """Delete payload rows; return their spool paths for removal once the caller has committed."""
+    rows = db.query(MatchJobPayload).filter(MatchJobPayload.job_id.in_(job_ids)).all()
+    for row in rows:
+        db.delete(row)
+    return [row.spool_path for row in rows]
+
+
+def _owned_row(db: Session, job: ClaimedJob) -> MatchJob | None:
+    """Lock the job's row if this claim still owns it (processing, same attempt), else None."""
+    return (
+        db.query(MatchJob)
+        .filter(
+            MatchJob.id == job.id,
+            MatchJob.status == "processing",
+            MatchJob.attempts == job.attempts,
+        )
+        .with_for_update()
+        .first()
     )
-    db.add(row)
+
+
+def _set_job_status(db: Session, job: ClaimedJob, status: str, error: str | None = None) -> bool:
+    """Finish a claimed job and commit; False (rolled back) if the claim no longer owns it."""
+    row = _owned_row(db, job)
+    if row is None:
+        db.rollback()
+        return False
+    row.status = status
+    row.stage = None
+    row.error = error
+    row.lease_expires_at = None
+    stale_files = _drop_payloads(db, [job.id]) if status in ("completed", "failed") else []
+    announce(db, job.id, status, error=error)
     db.commit()
-    _match_queue.put_nowait((job_id, user_id, file_bytes, filename))
+    remove_spooled(*stale_files)
+    return True
 
 
-def _set_job_status(db: Session, job_id: str, status: str, error: str | None = None) -> None:
-    row = db.query(MatchJob).filter(MatchJob.id == job_id).first()
-    if row:
-        row.status = status
-        row.error = error
+def _enter_stage(job: ClaimedJob, stage: str) -> bool:
+    """Record the job's current stage; False if this claim no longer owns it (superseded, re-claimed)."""
+    with SessionLocal() as db:
+        params = {"id": job.id, "attempts": job.attempts, "stage": stage}
+        if db.execute(_ENTER_STAGE_SQL, params).first() is None:
+            db.rollback()
+            return False
+        announce(db, job.id, "processing", stage=stage)
         db.commit()
+        return True
 
 
-async def _run_one_job(job_id: str, user_id: str, file_bytes: bytes, filename: str) -> None:
-    """Parse, embed, match, save; update match_jobs status. Uses its own DB session."""
+def _claim_next() -> ClaimedJob | None:
+    """Claim one job (own session, run in a thread). None if nothing is claimable."""
     db = SessionLocal()
     try:
-        _set_job_status(db, job_id, "processing")
+        row = db.execute(_CLAIM_SQL, {"lease": settings.MATCH_LEASE_SECONDS}).first()
+        if row is not None:
+            announce(db, row.id, "processing")
+        db.commit()
+        return ClaimedJob(*row) if row else None
+    finally:
+        db.close()
 
-        resume_data = await asyncio.to_thread(
-            parse_resume_with_reducto, file_bytes, filename
-        )
-        resume_meaning = build_resume_meaning(
-            domain=resume_data["domain"],
-            yoe=resume_data["yoe"],
-            skills=resume_data["skills"],
-            summary=resume_data["summary"],
+
+def _extend_lease(job: ClaimedJob) -> bool:
+    """Renew the lease; False if this claim no longer owns the job."""
+    db = SessionLocal()
+    try:
+        params = {"id": job.id, "attempts": job.attempts, "lease": settings.MATCH_LEASE_SECONDS}
+        extended = db.execute(_EXTEND_LEASE_SQL, params).rowcount > 0
+        db.commit()
+        return extended
+    finally:
+        db.close()
+
+
+async def _lease_heartbeat(job: ClaimedJob) -> None:
+    """Renew the lease every third of its length until cancelled or the claim is lost."""
+    interval = max(1.0, settings.MATCH_LEASE_SECONDS / 3)
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if not await asyncio.to_thread(_extend_lease, job):
+                logger.warning("Match job %s lease lost (attempt %d); heartbeat stopped", job.id, job.attempts)
+                return
+        except Exception as e:
+            logger.warning("Could not extend lease for match job %s: %s", job.id, e)
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff before the next attempt (attempts = tries made so far)."""
+    delay = settings.MATCH_RETRY_BASE_SECONDS * (2 ** max(0, attempts - 1))
+    return float(min(delay, settings.MATCH_RETRY_MAX_SECONDS))
+
+
+def _fail_or_retry(job: ClaimedJob, error: str) -> None:
+    """Requeue with backoff, or mark failed once attempts are used up. Uses its own DB session."""
+    with SessionLocal() as db:
+        if job.attempts < settings.MATCH_MAX_ATTEMPTS:
+            delay = retry_delay(job.attempts)
+            params = {"id": job.id, "attempts": job.attempts, "error": error, "delay": delay}
+            if db.execute(_RETRY_SQL, params).rowcount:
+                announce(db, job.id, "pending", error=error)
+            db.commit()
+            logger.info(
+                "Match job %s will retry in %.0fs (attempt %d/%d)",
+                job.id, delay, job.attempts, settings.MATCH_MAX_ATTEMPTS,
+            )
+        else:
+            _set_job_status(db, job, "failed", error=error)
+
+
+@dataclass
+class _InFlight:
+    """A claimed job moving through the stages; each stage fills in its outputs."""
+
+    job: ClaimedJob
+    heartbeat: asyncio.Task[Any]
+    resume_data: Dict[str, Any] = field(default_factory=dict)
+    parser_key: str | None = None  # Parse cache key, fixed before parsing (lookup and save agree)
+    matched_at: datetime | None = None
+    resume_ctx: ResumeContext | None = None
+    filtered_job_ids: List[str] | None = None
+    response: MatchResponse | None = None
+    task: asyncio.Future[bool] | None = None  # Stage handler currently running for this job
+    superseded: bool = False
+
+
+# Claimed, unfinished jobs in this process (released back to the queue on shutdown)
+_inflight: Dict[str, _InFlight] = {}
+_inflight_slots: asyncio.Semaphore | None = None
+# Set by NOTIFY match_jobs; wakes the idle claimer
+_wakeup: asyncio.Event | None = None
+
+_Stage = Callable[[_InFlight], Awaitable[bool]]
+
+
+class _ParseInput(NamedTuple):
+    spool_path: str
+    filename: str
+    sha256: str
+    matched_at: datetime
+    parser_key: str
+    cached: Dict[str, Any] | None
+
+
+def _load_parse_input(job: ClaimedJob) -> _ParseInput | None:
+    """Parse stage's DB work (payload, clock, parse cache); None if the job was failed instead."""
+    with SessionLocal() as db:
+        if job.attempts > settings.MATCH_MAX_ATTEMPTS:
+            # Reclaimed from a worker that kept dying mid-job: don't loop forever
+            _set_job_status(db, job, "failed", error="Exceeded max attempts")
+            return None
+        payload = db.get(MatchJobPayload, job.id)
+        if payload is None:
+            _set_job_status(db, job, "failed", error="Resume payload missing")
+            return None
+        parser_key = parser_cache_key()  # May reload the skill dictionary
+        return _ParseInput(
+            payload.spool_path,
+            payload.filename,
+            payload.sha256,
+            db_now(db),
+            parser_key,
+            get_cached_parse(db, payload.sha256, parser_key),
         )
+
+
+def _save_parse(sha256: str, parser_key: str, resume_data: Dict[str, Any]) -> None:
+    with SessionLocal() as db:
+        save_parse(db, sha256, parser_key, resume_data)
+
+
+async def _parse_stage(state: _InFlight) -> bool:
+    job_id = state.job.id
+    loaded = await asyncio.to_thread(_load_parse_input, state.job)
+    if loaded is None:
+        return False
+    state.matched_at = loaded.matched_at
+    state.parser_key = loaded.parser_key
+    if loaded.cached is not None:
+        # Same file parsed before: skip parsing
+        logger.info("Match job %s: parse cache hit", job_id)
+        state.resume_data = loaded.cached
+        return True
+    file_bytes = await asyncio.to_thread(read_spooled, loaded.spool_path)
+    state.resume_data = await parse_resume(file_bytes, loaded.filename)
+    try:
+        await asyncio.to_thread(_save_parse, loaded.sha256, state.parser_key, state.resume_data)
+    except Exception as e:
+        logger.warning("Could not cache parse for match job %s: %s", job_id, e)
+    return True
+
+
+async def _embed_stage(state: _InFlight) -> bool:
+    resume_data = state.resume_data
+    resume_meaning = build_resume_meaning(
+        domain=resume_data["domain"],
+        yoe=resume_data["yoe"],
+        skills=resume_data["skills"],
+        summary=resume_data["summary"],
+    )
+    if sharding_enabled():
+        # Shards hold their own filtered candidate sets: no local SQL filter needed
+        raw_embedding = await embed_text_cached(resume_meaning)
+    else:
         # Run embed and SQL filter in parallel to overlap I/O
-        raw_embedding, filtered_job_ids = await asyncio.gather(
-            embed_text(resume_meaning),
+        raw_embedding, state.filtered_job_ids = await asyncio.gather(
+            embed_text_cached(resume_meaning),
             asyncio.to_thread(
                 filter_jobs_standalone,
                 resume_data["domain"],
@@ -75,48 +438,247 @@ async def _run_one_job(job_id: str, user_id: str, file_bytes: bytes, filename: s
                 resume_data.get("country"),
             ),
         )
-        resume_embedding = [float(x) for x in raw_embedding]
-
-        resume_ctx = ResumeContext(
-            id="ephemeral",
-            domain=resume_data["domain"],
-            years_experience=resume_data["yoe"],
-            country=resume_data.get("country") or None,
-            skills=resume_data["skills"] or [],
-            resume_embedding=resume_embedding,
+    state.resume_ctx = ResumeContext(
+        id="ephemeral",
+        domain=resume_data["domain"],
+        years_experience=resume_data["yoe"],
+        country=resume_data.get("country") or None,
+        skills=resume_data["skills"] or [],
+        resume_embedding=[float(x) for x in raw_embedding],
+    )
+    return True
+
+
+async def _search_stage(state: _InFlight) -> bool:
+    # Both pipelines run their DB work in worker threads on their own sessions
+    if sharding_enabled():
+        state.response = await run_sharded_matching(state.resume_ctx)
+    else:
+        state.response = await run_matching_pipeline(state.resume_ctx, filtered_job_ids=state.filtered_job_ids)
+    return True
+
+
+def _persist_results(state: _InFlight) -> bool:
+    """Persist stage's DB work; False if this claim no longer owns the job.
+
+    Results, profile and completion commit together, and only while this claim owns the job.
+    """
+    job_id, user_id = state.job.id, state.job.user_id
+    response, resume_ctx = state.response, state.resume_ctx
+    with SessionLocal() as db:
+        if _owned_row(db, state.job) is None:
+            db.rollback()
+            logger.info("Match job %s no longer owned by this claim; results discarded", job_id)
+            return False
+        save_match_results(
+            db,
+            user_id,
+            response.total_matches,
+            response.matches,
+            ranking=response.ranking,
+            resume_skills=resume_ctx.skills,
+            commit=False,
         )
-        response: MatchResponse = await run_matching_pipeline(
-            db, resume_ctx, filtered_job_ids=filtered_job_ids
+        save_match_profile(
+            db, user_id, resume_ctx, state.resume_data["summary"], state.matched_at, commit=False
         )
-        save_match_results(db, user_id, response.total_matches, response.matches)
-        _set_job_status(db, job_id, "completed")
-        logger.info("Match job %s completed: %d matches", job_id, response.total_matches)
-    except Exception as e:
-        logger.exception("Match job %s failed", job_id)
-        _set_job_status(db, job_id, "failed", error=str(e))
-    finally:
-        db.close()
+        return _set_job_status(db, state.job, "completed")
+
+
+async def _persist_stage(state: _InFlight) -> bool:
+    if not await asyncio.to_thread(_persist_results, state):
+        return False
+    logger.info("Match job %s completed: %d matches", state.job.id, state.response.total_matches)
+    return True
+
 
+def _finish(state: _InFlight) -> None:
+    state.heartbeat.cancel()
+    if _inflight.pop(state.job.id, None) is not None:
+        _inflight_slots.release()
 
-async def _worker_loop() -> None:
-    """Long-lived task: pull from queue and run the matching pipeline."""
-    logger.info("Match job worker started.")
+
+async def _stage_worker(
+    name: str,
+    handler: _Stage,
+    inbox: asyncio.Queue[_InFlight],
+    outbox: asyncio.Queue[_InFlight] | None,
+) -> None:
+    """Run one stage for jobs from inbox; hand them to outbox (blocks while it is full)."""
     while True:
         try:
-            job_id, user_id, file_bytes, filename = await _match_queue.get()
-            await _run_one_job(job_id, user_id, file_bytes, filename)
+            state = await inbox.get()
+            # Frees the in-flight slot and heartbeat whatever happens, unless the job moves on
+            finish = True
+            try:
+                # Stage boundary: drop the job if a newer upload superseded it meanwhile
+                if not await asyncio.to_thread(_enter_stage, state.job, name):
+                    logger.info("Match job %s no longer processing; dropped before %s", state.job.id, name)
+                    continue
+                state.task = asyncio.ensure_future(handler(state))
+                try:
+                    proceed = await state.task
+                except asyncio.CancelledError:
+                    if not state.superseded:
+                        raise
+                    # A newer upload superseded the job mid-stage (see _on_status_notify)
+                    logger.info("Match job %s superseded; %s stage cancelled", state.job.id, name)
+                    proceed = False
+                finally:
+                    state.task = None
+                if proceed and outbox is not None:
+                    await outbox.put(state)
+                    finish = False
+            except asyncio.CancelledError:
+                finish = False  # Shutting down: the job stays in _inflight and is released to the queue
+                raise
+            except Exception as e:
+                logger.exception(
+                    "Match job %s failed in %s stage (attempt %d)", state.job.id, name, state.job.attempts
+                )
+                await asyncio.to_thread(_fail_or_retry, state.job, str(e))
+            finally:
+                if finish:
+                    _finish(state)
         except asyncio.CancelledError:
-            logger.info("Match job worker cancelled.")
             break
         except Exception as e:
-            logger.exception("Worker loop error: %s", e)
+            logger.exception("Match %s stage error: %s", name, e)
 
 
-def get_match_queue() -> asyncio.Queue[tuple[str, str, bytes, str]]:
-    """Return the in-memory queue (for enqueue from route)."""
-    return _match_queue
+async def _wait_for_work() -> None:
+    try:
+        await asyncio.wait_for(_wakeup.wait(), timeout=settings.MATCH_QUEUE_POLL_SECONDS)
+    except asyncio.TimeoutError:
+        pass
+    _wakeup.clear()
+
+
+async def _claimer(outbox: asyncio.Queue[_InFlight]) -> None:
+    """Claim jobs while the pipeline has room (in-flight cap and a full parse queue both block)."""
+    while True:
+        try:
+            await _inflight_slots.acquire()
+            try:
+                job = await asyncio.to_thread(_claim_next)
+            except Exception:
+                _inflight_slots.release()
+                raise
+            if job is None:
+                _inflight_slots.release()
+                await _wait_for_work()
+                continue
+            state = _InFlight(job=job, heartbeat=asyncio.create_task(_lease_heartbeat(job)))
+            _inflight[job.id] = state
+            await outbox.put(state)
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.exception("Match job claim error: %s", e)
+            await asyncio.sleep(settings.MATCH_QUEUE_POLL_SECONDS)
+
+
+def _sweep_spool() -> int:
+    with SessionLocal() as db:
+        return sweep_orphaned_spool_files(db)
+
+
+async def _spool_sweeper(interval: float) -> None:
+    """Periodically remove spool files left behind by uploads that never reached the queue."""
+    while True:
+        try:
+            await asyncio.to_thread(_sweep_spool)
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning("Spool sweep failed: %s", e)
+        try:
+            await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            break
+
+
+def _release_inflight() -> None:
+    """Hand every unfinished job back to the queue (shutdown)."""
+    with SessionLocal() as db:
+        for state in list(_inflight.values()):
+            state.heartbeat.cancel()
+            if db.execute(_RELEASE_SQL, {"id": state.job.id, "attempts": state.job.attempts}).rowcount:
+                announce(db, state.job.id, "pending")
+            logger.info("Match job %s released back to the queue", state.job.id)
+        db.commit()
+    _inflight.clear()
+
+
+async def _worker_pool() -> None:
+    """Claimer plus per-stage workers; cancelling the pool cancels them and releases claimed jobs."""
+    size = settings.MATCH_STAGE_QUEUE_SIZE
+    parse_q: asyncio.Queue[_InFlight] = asyncio.Queue(maxsize=size)
+    embed_q: asyncio.Queue[_InFlight] = asyncio.Queue(maxsize=size)
+    search_q: asyncio.Queue[_InFlight] = asyncio.Queue(maxsize=size)
+    persist_q: asyncio.Queue[_InFlight] = asyncio.Queue(maxsize=size)
+    stages = (
+        ("parse", _parse_stage, parse_q, embed_q, settings.MATCH_PARSE_CONCURRENCY),
+        ("embed", _embed_stage, embed_q, search_q, settings.MATCH_EMBED_CONCURRENCY),
+        ("search", _search_stage, search_q, persist_q, settings.MATCH_DB_CONCURRENCY),
+        ("persist", _persist_stage, persist_q, None, settings.MATCH_PERSIST_CONCURRENCY),
+    )
+    tasks = [asyncio.create_task(_claimer(parse_q))]
+    if settings.MATCH_SPOOL_SWEEP_SECONDS > 0:
+        tasks.append(asyncio.create_task(_spool_sweeper(settings.MATCH_SPOOL_SWEEP_SECONDS)))
+    for name, handler, inbox, outbox, count in stages:
+        tasks += [
+            asyncio.create_task(_stage_worker(name, handler, inbox, outbox))
+            for _ in range(max(1, count))
+        ]
+    try:
+        await asyncio.gather(*tasks)
+    except asyncio.CancelledError:
+        pass
+    finally:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            _release_inflight()
+        except Exception as e:
+            logger.warning("Could not release in-flight match jobs: %s", e)
+        logger.info("Match worker pool stopped.")
+
+
+def _on_status_notify(payload: str) -> None:
+    """Cancel the running stage of a job this process holds once it is superseded."""
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return
+    if data.get("status") != "superseded":
+        return
+    state = _inflight.get(data.get("job_id"))
+    if state is not None:
+        state.superseded = True
+        if state.task is not None:
+            state.task.cancel()
 
 
 def start_match_worker() -> asyncio.Task[Any]:
-    """Start the background worker task. Call from app startup."""
-    return asyncio.create_task(_worker_loop())
+    """Start the staged match pipeline for this process. Call from app/worker startup."""
+    global _inflight_slots, _wakeup
+    check_shard_config()
+    _wakeup = asyncio.Event()
+    listen(NOTIFY_CHANNEL, lambda _payload: _wakeup.set())
+    listen(STATUS_CHANNEL, _on_status_notify)
+    # Wake-ups sent while LISTEN was down were lost: look for work now rather than at the next poll
+    # (a lost supersede is still caught at the job's next stage boundary)
+    on_reconnect(_wakeup.set)
+    _inflight_slots = asyncio.Semaphore(settings.MATCH_WORKER_CONCURRENCY)
+    logger.info(
+        "Starting match pipeline: in-flight=%d, queue=%d, parse=%d, embed=%d, search=%d, persist=%d",
+        settings.MATCH_WORKER_CONCURRENCY,
+        settings.MATCH_STAGE_QUEUE_SIZE,
+        settings.MATCH_PARSE_CONCURRENCY,
+        settings.MATCH_EMBED_CONCURRENCY,
+        settings.MATCH_DB_CONCURRENCY,
+        settings.MATCH_PERSIST_CONCURRENCY,
+    )
+    return asyncio.create_task(_worker_pool())
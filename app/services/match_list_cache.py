@@ -0,0 +1,196 @@
+"""In-process cache of each user's decoded, ranked match list, so paging skips the database.
+
+An entry holds the full compact ranking plus the MatchResults decoded so far (a prefix; saves in
+this process hand over their materialised top page, reads extend it page by page).
+save_match_results replaces the entry and clear_match_results_for_user drops it, once their
+transaction commits; both also send NOTIFY match_list so other API processes drop their copy
+(their own echo is ignored). Fills from database reads are fenced by a per-user version.
+Entries expire after MATCH_LIST_CACHE_TTL_SECONDS; least recently used entries are evicted past
+MATCH_LIST_CACHE_MAX_MB (estimated size). Inactive until start_match_list_cache() runs, because
+without the NOTIFY bridge another process's save would be masked until the TTL; for the same
+reason the whole cache is flushed when the LISTEN connection comes back after a drop.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config.database import SessionLocal
+from app.config.settings import settings
+from app.schemas.matching import MatchResult
+from app.services.pg_listener import listen, notify, on_reconnect
+from app.services.scoring import ScoredJob
+
+INVALIDATE_CHANNEL = "match_list"
+COMPACT_ROW_BYTES = 120  # Rough size of one ScoredJob
+DECODED_RESULT_BYTES = 2048  # Rough size of one MatchResult with its JobSummary
+
+MAX_TRACKED_VERSIONS = 10_000
+
+_ORIGIN = uuid.uuid4().hex
+_PENDING_KEY = "match_list_cache"
+
+
+@dataclass(frozen=True)
+class DecodedMatches:
+    total: int
+    ranking: Tuple[ScoredJob, ...]
+    resume_skills: Tuple[str, ...]
+    # Decoded prefix aligned with ranking; None where the job no longer exists
+    results: Tuple[Optional[MatchResult], ...] = ()
+
+    @property
+    def decoded_upto(self) -> int:
+        return len(self.results)
+
+    def size_bytes(self) -> int:
+        return len(self.ranking) * COMPACT_ROW_BYTES + len(self.results) * DECODED_RESULT_BYTES
+
+
+class _Entry(NamedTuple):
+    value: DecodedMatches
+    expires_at: float
+    size: int
+
+
+_cache: OrderedDict[str, _Entry] = OrderedDict()
+_bytes = 0
+# Per-user version, bumped by that user's writes/invalidations; guards fills that raced one.
+# Bounded LRU: a forgotten user reads as _version_floor (>= any version it had), so a fill that
+# started before the eviction still sees a change and is skipped.
+_versions: OrderedDict[str, int] = OrderedDict()
+_version_counter = 0
+_version_floor = 0
+_lock = threading.Lock()  # sync routes run on the threadpool
+_enabled = False
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def version(user_id: str) -> int:
+    """user_id's current version; pass it to put() when filling from a database read."""
+    with _lock:
+        return _versions.get(user_id, _version_floor)
+
+
+def _bump(user_id: str) -> None:
+    global _version_counter, _version_floor
+    _version_counter += 1
+    _versions[user_id] = _version_counter
+    _versions.move_to_end(user_id)
+    while len(_versions) > MAX_TRACKED_VERSIONS:
+        _, forgotten = _versions.popitem(last=False)
+        _version_floor = max(_version_floor, forgotten)
+
+
+def _drop(user_id: str) -> None:
+    global _bytes
+    entry = _cache.pop(user_id, None)
+    if entry is not None:
+        _bytes -= entry.size
+
+
+def get(user_id: str) -> DecodedMatches | None:
+    if not _enabled:
+        return None
+    with _lock:
+        entry = _cache.get(user_id)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            _drop(user_id)
+            return None
+        _cache.move_to_end(user_id)
+        return entry.value
+
+
+def put(user_id: str, value: DecodedMatches, seen_version: int | None = None) -> None:
+    """Store value. Without seen_version it is a new list (bumps the user's version); with it, a
+    fill from a read, skipped if the user's list was written/invalidated since version() returned it.
+    """
+    global _bytes
+    if not _enabled:
+        return
+    size = value.size_bytes()
+    limit = settings.MATCH_LIST_CACHE_MAX_MB * 1024 * 1024
+    with _lock:
+        if seen_version is None:
+            _bump(user_id)
+        elif seen_version != _versions.get(user_id, _version_floor):
+            return
+        _drop(user_id)
+        if size <= limit:
+            _cache[user_id] = _Entry(value, time.monotonic() + settings.MATCH_LIST_CACHE_TTL_SECONDS, size)
+            _bytes += size
+            while _bytes > limit:
+                _drop(next(iter(_cache)))
+
+
+def invalidate(user_id: str) -> None:
+    with _lock:
+        _bump(user_id)
+        _drop(user_id)
+
+
+def replace_on_commit(db: Session, user_id: str, value: DecodedMatches | None) -> None:
+    """user_id's list changed in db's transaction: NOTIFY other processes, and on commit store
+    value here (None just drops the entry). Nothing happens locally if the transaction rolls back.
+    """
+    notify(db, INVALIDATE_CHANNEL, json.dumps({"origin": _ORIGIN, "user_id": user_id}))
+    db.info.setdefault(_PENDING_KEY, {})[user_id] = value
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _apply_committed(session: Session) -> None:
+    for user_id, value in session.info.pop(_PENDING_KEY, {}).items():
+        if value is None:
+            invalidate(user_id)
+        else:
+            put(user_id, value)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _drop_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _on_notify(payload: str) -> None:
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return
+    if data.get("origin") != _ORIGIN and data.get("user_id"):
+        invalidate(data["user_id"])
+
+
+def _on_reconnect() -> None:
+    """Invalidations sent while LISTEN was down were lost: drop every entry and fence in-flight fills."""
+    global _bytes, _version_counter, _version_floor
+    with _lock:
+        _cache.clear()
+        _bytes = 0
+        # Above every version handed out so far, tracked or not
+        _version_counter += 1
+        _version_floor = _version_counter
+        _versions.clear()
+
+
+def start_match_list_cache() -> None:
+    """Enable the cache and subscribe to invalidations. Call on the event loop at app startup."""
+    global _enabled
+    if settings.MATCH_LIST_CACHE_MAX_MB <= 0:
+        return
+    listen(INVALIDATE_CHANNEL, _on_notify)
+    on_reconnect(_on_reconnect)
+    _enabled = True
@@ -1,16 +1,36 @@
-"""Save and paginate match results from match_result_cache table."""
+"""Save and paginate match results (match_result_cache header + match_results rows).
+
+Each ranked match is one match_results row keyed (user_id, rank); rank is the page cursor, so a
+page is a keyset range scan on the primary key. Rows are compact (job id, scores, and for the top
+MATCH_MATERIALISE_TOP_N the matched/missing skills as indices into jobs.skills_required); job
+summaries are joined in at read time with one batched jobs lookup via job_summary_cache.
+When match_list_cache is active, a user's list is decoded once and later pages come from memory.
+"""
 
 from __future__ import annotations
 
+from dataclasses import replace
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.orm import Session
 
+from app.models.job import Job
 from app.models.match_result_cache import MatchResultCache
+from app.models.match_result_row import MatchResultRow
 from app.schemas.matching import MatchResult, MatchResultsCursorResponse
+from app.services import match_list_cache
+from app.services.match_list_cache import DecodedMatches
+from app.services.scoring import ScoredJob, build_match_result, hydrate_match_result, skill_indices
+
+MAX_PREFIX_EXTEND = 200  # Ranks one read may add to a cached list's decoded prefix
 
 
 def clear_match_results_for_user(db: Session, user_id: str) -> None:
     """Delete the cached match result for this user (e.g. on logout)."""
+    db.execute(delete(MatchResultRow).where(MatchResultRow.user_id == user_id))
     db.query(MatchResultCache).filter(MatchResultCache.user_id == user_id).delete()
+    match_list_cache.replace_on_commit(db, user_id, None)
     db.commit()
 
 
@@ -19,21 +39,226 @@ def save_match_results(
     user_id: str,
     total_matches: int,
     matches: list[MatchResult],
+    ranking: list[ScoredJob] | None = None,
+    resume_skills: list[str] | None = None,
+    commit: bool = True,
 ) -> None:
-    """Upsert latest match result for user. Replaces any existing row."""
-    payload = [m.model_dump() for m in matches]
-    row = db.query(MatchResultCache).filter(MatchResultCache.user_id == user_id).first()
-    if row:
-        row.total_matches = total_matches
-        row.matches_json = payload
+    """Replace the user's stored matches in one transaction (header upsert + bulk row insert).
+
+    matches is the materialised top page (only its skill indices are kept); ranking (if given) is
+    the full compact ordering. commit=False leaves the commit to the caller (e.g. to hold a lock).
+    """
+    if ranking is None:
+        ranking = [
+            ScoredJob(m.job.id, m.score, m.breakdown.skills, m.breakdown.semantic, m.breakdown.yoe)
+            for m in matches
+        ]
+    explained = {
+        m.job.id: (
+            skill_indices(m.job.skills_required, m.explanation.matched_skills),
+            skill_indices(m.job.skills_required, m.explanation.missing_required),
+        )
+        for m in matches
+    }
+    rows = []
+    for rank, s in enumerate(ranking):
+        matched_idx, missing_idx = explained.get(s.job_id, (None, None))
+        rows.append(
+            {
+                "user_id": user_id,
+                "rank": rank,
+                "job_id": s.job_id,
+                "score": s.score,
+                "skills_score": s.skills,
+                "semantic_score": s.semantic,
+                "yoe_score": s.yoe,
+                "matched_skill_idx": matched_idx,
+                "missing_skill_idx": missing_idx,
+            }
+        )
+    header = db.query(MatchResultCache).filter(MatchResultCache.user_id == user_id).first()
+    if header:
+        header.total_matches = total_matches
+        header.resume_skills = resume_skills or []
+        header.created_at = func.now()
     else:
-        row = MatchResultCache(
-            user_id=user_id,
-            total_matches=total_matches,
-            matches_json=payload,
+        db.add(
+            MatchResultCache(
+                user_id=user_id,
+                total_matches=total_matches,
+                resume_skills=resume_skills or [],
+            )
         )
-        db.add(row)
-    db.commit()
+    db.execute(delete(MatchResultRow).where(MatchResultRow.user_id == user_id))
+    if rows:
+        db.execute(insert(MatchResultRow), rows)  # executemany, batched into multi-row INSERTs
+    by_id = {m.job.id: m for m in matches}
+    decoded_upto = max((rank + 1 for rank, s in enumerate(ranking) if s.job_id in by_id), default=0)
+    match_list_cache.replace_on_commit(
+        db,
+        user_id,
+        DecodedMatches(
+            total=total_matches,
+            ranking=tuple(ranking),
+            resume_skills=tuple(resume_skills or []),
+            results=tuple(by_id.get(s.job_id) for s in ranking[:decoded_upto]),
+        ),
+    )
+    if commit:
+        db.commit()
+
+
+def load_ranking(db: Session, user_id: str) -> List[ScoredJob]:
+    """Full stored ordering for the user (compact columns only), best first."""
+    rows = db.execute(
+        select(
+            MatchResultRow.job_id,
+            MatchResultRow.score,
+            MatchResultRow.skills_score,
+            MatchResultRow.semantic_score,
+            MatchResultRow.yoe_score,
+        )
+        .where(MatchResultRow.user_id == user_id)
+        .order_by(MatchResultRow.rank)
+    ).all()
+    return [ScoredJob.from_row(r) for r in rows]
+
+
+def _read_slice(db: Session, header: MatchResultCache, start: int, end: int) -> List[Optional[MatchResult]]:
+    """MatchResults for ranks [start, end) via a keyset range on (user_id, rank).
+
+    Aligned with the ranks read: None where the job no longer exists (deleted or archived).
+    """
+    if end <= start:
+        return []
+    rows = (
+        db.query(MatchResultRow)
+        .filter(
+            MatchResultRow.user_id == header.user_id,
+            MatchResultRow.rank >= start,
+            MatchResultRow.rank < end,
+        )
+        .order_by(MatchResultRow.rank)
+        .limit(end - start)
+        .all()
+    )
+    jobs = db.query(Job).filter(Job.id.in_([r.job_id for r in rows])).all() if rows else []
+    id_to_job = {j.id: j for j in jobs}
+    resume_skills = header.resume_skills or []
+    out: List[Optional[MatchResult]] = []
+    for r in rows:
+        job = id_to_job.get(r.job_id)
+        if job is None:
+            out.append(None)
+            continue
+        scored = ScoredJob(r.job_id, r.score, r.skills_score, r.semantic_score, r.yoe_score)
+        # Indices point into the skill list as it was at save time; recompute if the job changed since
+        if r.matched_skill_idx is not None and (job.updated_at is None or job.updated_at <= header.created_at):
+            out.append(hydrate_match_result(job, scored, r.matched_skill_idx, r.missing_skill_idx or []))
+        else:
+            out.append(build_match_result(job, scored, resume_skills))
+    return out
+
+
+def _cached_matches(db: Session, user_id: str) -> Tuple[DecodedMatches | None, int]:
+    """User's list from match_list_cache, loading the compact ranking on a miss.
+
+    Returns (decoded or None if no stored result, the user's cache version seen before reading).
+    """
+    seen = match_list_cache.version(user_id)
+    decoded = match_list_cache.get(user_id)
+    if decoded is not None:
+        return decoded, seen
+    header = db.query(MatchResultCache).filter(MatchResultCache.user_id == user_id).first()
+    if not header:
+        return None, seen
+    decoded = DecodedMatches(
+        total=header.total_matches,
+        ranking=tuple(load_ranking(db, user_id)),
+        resume_skills=tuple(header.resume_skills or []),
+    )
+    match_list_cache.put(user_id, decoded, seen)
+    return decoded, seen
+
+
+def _decode(
+    db: Session, scored: Sequence[ScoredJob], resume_skills: List[str]
+) -> Tuple[Optional[MatchResult], ...]:
+    """MatchResults for scored (one batched jobs lookup); None where the job no longer exists."""
+    jobs = db.query(Job).filter(Job.id.in_([s.job_id for s in scored])).all() if scored else []
+    id_to_job = {j.id: j for j in jobs}
+    return tuple(
+        build_match_result(id_to_job[s.job_id], s, resume_skills) if s.job_id in id_to_job else None
+        for s in scored
+    )
+
+
+def _decode_range(
+    db: Session, user_id: str, decoded: DecodedMatches, seen: int, start: int, end: int
+) -> Tuple[DecodedMatches, Tuple[Optional[MatchResult], ...]]:
+    """Ranks [start, end) decoded, and the list with its decoded prefix extended if it was close.
+
+    The prefix is only grown by up to MAX_PREFIX_EXTEND ranks at a time; a deep jump decodes just
+    the requested ranks (uncached), so one request never decodes the whole list.
+    """
+    if end <= decoded.decoded_upto:
+        return decoded, decoded.results[start:end]
+    resume_skills = list(decoded.resume_skills)
+    if end - decoded.decoded_upto > MAX_PREFIX_EXTEND:
+        return decoded, _decode(db, decoded.ranking[start:end], resume_skills)
+    decoded = replace(
+        decoded,
+        results=decoded.results + _decode(db, decoded.ranking[decoded.decoded_upto:end], resume_skills),
+    )
+    match_list_cache.put(user_id, decoded, seen)
+    return decoded, decoded.results[start:end]
+
+
+def _parse_cursor(cursor: str | None, dir: str) -> int | None:
+    """Rank offset encoded in cursor, or None if invalid (dir=prev requires one)."""
+    if dir == "prev":
+        if not cursor:
+            return None
+        try:
+            return max(0, int(cursor))
+        except ValueError:
+            return None
+    if not cursor:
+        return 0
+    try:
+        return max(0, int(cursor))
+    except ValueError:
+        return 0
+
+
+def _fill_page(
+    fetch: Callable[[int, int], Sequence[Optional[MatchResult]]],
+    total: int,
+    start: int,
+    limit: int,
+    dir: str,
+) -> Tuple[List[MatchResult], str | None, str | None]:
+    """(matches, next_cursor, prev_cursor) for up to limit live matches next to start.
+
+    fetch(lo, hi) returns ranks [lo, hi) with None for jobs that are gone; those ranks are skipped
+    and the page is topped up from the following (dir=next) or preceding (dir=prev) ranks, so the
+    cursors point past the ranks actually consumed rather than start +/- limit.
+    """
+    out: List[MatchResult] = []
+    if dir == "prev":
+        pos = min(start, total)
+        while len(out) < limit and pos > 0:
+            lo = max(0, pos - (limit - len(out)))
+            out[:0] = [m for m in fetch(lo, pos) if m is not None]
+            pos = lo
+        next_cursor = str(start) if start < total else None
+        return out, next_cursor, (str(pos) if pos > 0 else None)
+    pos = start
+    while len(out) < limit and pos < total:
+        hi = min(total, pos + limit - len(out))
+        out.extend(m for m in fetch(pos, hi) if m is not None)
+        pos = hi
+    return out, (str(pos) if pos < total else None), (str(start) if start > 0 else None)
 
 
 def get_match_results_page(
@@ -45,48 +270,47 @@ def get_match_results_page(
     dir: str = "next",
 ) -> MatchResultsCursorResponse | None:
     """
-    Return one page of matches for the user. Cursor is integer offset as string.
-    dir=next: slice from cursor (default 0); dir=prev: cursor is current start, return previous page.
+    Return one page of matches for the user. Cursor is integer offset (rank) as string.
+    dir=next: page from cursor (default 0); dir=prev: cursor is current start, return previous page.
+    Jobs deleted or archived since the save are skipped and the page is filled from further ranks.
     Returns None if no cached result for user.
     """
-    row = db.query(MatchResultCache).filter(MatchResultCache.user_id == user_id).first()
-    if not row:
-        return None
-    if not row.matches_json:
+    header = decoded = None
+    if match_list_cache.enabled():
+        decoded, seen = _cached_matches(db, user_id)
+        if decoded is None:
+            return None
+        total = decoded.total
+    else:
+        header = db.query(MatchResultCache).filter(MatchResultCache.user_id == user_id).first()
+        if not header:
+            return None
+        total = header.total_matches
+    if not total:
         return MatchResultsCursorResponse(
             total_matches=0,
             matches=[],
             next_cursor=None,
             prev_cursor=None,
         )
-    total = row.total_matches
-    matches_list = [MatchResult.model_validate(d) for d in row.matches_json]
     limit = max(1, min(limit, 100))
 
-    if dir == "prev":
-        if not cursor:
-            return None
-        try:
-            start = int(cursor)
-        except ValueError:
-            return None
-        # Previous page: [max(0, start - limit) : start]
-        page_start = max(0, start - limit)
-        page_end = start
-        slice_matches = matches_list[page_start:page_end]
-        next_cursor = str(start) if start < total else None
-        prev_cursor = str(page_start) if page_start > 0 else None
+    start = _parse_cursor(cursor, dir)
+    if start is None:
+        return None
+    if decoded is not None:
+
+        def fetch(lo: int, hi: int) -> Sequence[Optional[MatchResult]]:
+            nonlocal decoded
+            decoded, results = _decode_range(db, user_id, decoded, seen, lo, hi)
+            return results
+
     else:
-        start = 0
-        if cursor:
-            try:
-                start = int(cursor)
-            except ValueError:
-                start = 0
-        page_end = min(start + limit, total)
-        slice_matches = matches_list[start:page_end]
-        next_cursor = str(start + limit) if start + limit < total else None
-        prev_cursor = str(start) if start > 0 else None
+
+        def fetch(lo: int, hi: int) -> Sequence[Optional[MatchResult]]:
+            return _read_slice(db, header, lo, hi)
+
+    slice_matches, next_cursor, prev_cursor = _fill_page(fetch, total, start, limit, dir)
 
     return MatchResultsCursorResponse(
         total_matches=total,
@@ -0,0 +1,147 @@
+"""Match job status transitions as events, for push delivery (SSE) instead of status polling.
+
+Queue code calls announce(db, event) inside the transaction that changes match_jobs. On commit the
+event is published to in-process subscribers directly; it is also sent as NOTIFY match_status so
+API processes receive transitions made by workers in other processes (their own echo is ignored).
+Delivery is best effort (a NOTIFY sent while the listener reconnects, or a full subscriber queue,
+loses the event), so long-lived subscribers should re-read the row with read_status() now and then.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import uuid
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config.database import SessionLocal
+from app.models.match_job import MatchJob
+from app.services.pg_listener import listen, notify
+
+logger = logging.getLogger(__name__)
+
+STATUS_CHANNEL = "match_status"
+TERMINAL_STATUSES = frozenset({"completed", "failed", "superseded"})
+SUBSCRIBER_QUEUE_SIZE = 32
+MAX_ERROR_CHARS = 500  # NOTIFY payloads are capped at 8000 bytes
+
+_ORIGIN = uuid.uuid4().hex  # This process, so it can skip its own NOTIFY echo
+_PENDING_KEY = "match_status_events"
+
+
+@dataclass(frozen=True)
+class MatchStatusEvent:
+    job_id: str
+    status: str
+    stage: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def terminal(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+
+def status_event(row: MatchJob) -> MatchStatusEvent:
+    """Event for a match_jobs row's current state (error truncated like announced events)."""
+    return MatchStatusEvent(row.id, row.status, row.stage, row.error[:MAX_ERROR_CHARS] if row.error else None)
+
+
+def read_status(job_id: str) -> MatchStatusEvent | None:
+    """job_id's current state from match_jobs, on a short-lived session (blocking)."""
+    with SessionLocal() as db:
+        row = db.get(MatchJob, job_id)
+        return status_event(row) if row is not None else None
+
+
+_subscribers: Dict[str, Set[asyncio.Queue[MatchStatusEvent]]] = defaultdict(set)
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def announce(
+    db: Session,
+    job_id: str,
+    status: str,
+    stage: str | None = None,
+    error: str | None = None,
+) -> None:
+    """Queue a status event in db's transaction: NOTIFY now, local publish after commit."""
+    evt = MatchStatusEvent(job_id, status, stage, error[:MAX_ERROR_CHARS] if error else None)
+    notify(db, STATUS_CHANNEL, json.dumps({"origin": _ORIGIN, **asdict(evt)}))
+    db.info.setdefault(_PENDING_KEY, []).append(evt)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _publish_committed(session: Session) -> None:
+    for evt in session.info.pop(_PENDING_KEY, ()):
+        _publish_local(evt)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _drop_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _dispatch(evt: MatchStatusEvent) -> None:
+    for queue in list(_subscribers.get(evt.job_id, ())):
+        try:
+            queue.put_nowait(evt)
+        except asyncio.QueueFull:
+            logger.warning("Status subscriber for match job %s is not keeping up; event dropped", evt.job_id)
+
+
+def _publish_local(evt: MatchStatusEvent) -> None:
+    """Deliver to this process's subscribers (safe to call from worker threads)."""
+    loop = _loop
+    if loop is None or evt.job_id not in _subscribers:
+        return
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        _dispatch(evt)
+    else:
+        loop.call_soon_threadsafe(_dispatch, evt)
+
+
+def _on_notify(payload: str) -> None:
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return
+    if data.pop("origin", None) == _ORIGIN:
+        return  # Already published locally on commit
+    _dispatch(MatchStatusEvent(**data))
+
+
+def start_match_status_events() -> None:
+    """Bridge NOTIFY match_status into local subscribers. Call on the event loop at app startup."""
+    global _loop
+    _loop = asyncio.get_running_loop()
+    listen(STATUS_CHANNEL, _on_notify)
+
+
+def subscribe(job_id: str) -> asyncio.Queue[MatchStatusEvent]:
+    global _loop
+    if _loop is None:
+        _loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[MatchStatusEvent] = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    _subscribers[job_id].add(queue)
+    return queue
+
+
+def unsubscribe(job_id: str, queue: asyncio.Queue[MatchStatusEvent]) -> None:
+    subscribers = _subscribers.get(job_id)
+    if subscribers is not None:
+        subscribers.discard(queue)
+        if not subscribers:
+            del _subscribers[job_id]
@@ -1,18 +1,22 @@
-"""Matching pipeline: SQL filter (country, domain, YoE) → pgvector top-K → rank by semantic + skill score."""
+"""Matching pipeline: SQL filter (country, domain, YoE) → pgvector top-K ∪ skill-overlap (GIN) → rank by semantic + skill score."""
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Tuple
 
 from sqlalchemy.orm import Session
 
+from app.config.database import SessionLocal
 from app.config.settings import settings
+from app.models.job import Job
 from app.schemas.matching import MatchResponse, MatchResult
 from app.services.job_filter import filter_jobs
-from app.services.postgres_search import load_jobs_with_semantic_scores
-from app.services.scoring import rank_jobs
+from app.services.postgres_search import load_jobs_with_semantic_scores, query_jobs_by_skill_overlap
+from app.services.ranking_executor import score_and_order_jobs
+from app.services.scoring import build_match_result
 
 logger = logging.getLogger(__name__)
 
@@ -29,31 +33,16 @@ class ResumeContext:
     resume_embedding: List[float]
 
 
-async def run_matching_pipeline(
+def retrieve_candidates(
     db: Session,
     resume: ResumeContext,
-    filtered_job_ids: List[str] | None = None,
-) -> MatchResponse:
-    """Execute the matching pipeline: SQL filter → semantic search (pgvector) → score and rank.
+    filtered_job_ids: List[str] | None,
+) -> Tuple[List[Job], Dict[str, float]]:
+    """Candidate jobs + semantic scores: SQL filter, pgvector top-K ∪ skill-overlap hits (blocking).
 
-    If filtered_job_ids is provided (e.g. from parallel filter), the filter step is skipped.
+    filtered_job_ids, when given, replaces the SQL filter (e.g. only jobs changed since a snapshot).
     """
-    logger.info(
-        "Starting matching pipeline (domain=%s, yoe=%d, country=%s)",
-        resume.domain,
-        resume.years_experience,
-        resume.country or "any",
-    )
-
-    resume_vec = resume.resume_embedding
-    if not resume_vec:
-        logger.warning("No resume_embedding; cannot run semantic search.")
-        return MatchResponse(
-            candidate_profile_id=resume.id,
-            total_matches=0,
-            matches=[],
-        )
-    resume_embedding_list = [float(x) for x in resume_vec]
+    resume_embedding_list = [float(x) for x in resume.resume_embedding]
 
     # A. SQL filters: country, domain, YoE band (or use precomputed IDs from parallel step)
     if filtered_job_ids is None:
@@ -66,11 +55,7 @@ async def run_matching_pipeline(
 
     if not filtered_job_ids:
         logger.info("No jobs passed SQL filter.")
-        return MatchResponse(
-            candidate_profile_id=resume.id,
-            total_matches=0,
-            matches=[],
-        )
+        return [], {}
 
     # B. Semantic search: top K by cosine similarity among filtered IDs
     jobs, semantic_scores = load_jobs_with_semantic_scores(
@@ -80,25 +65,97 @@ async def run_matching_pipeline(
         top_k=settings.ANN_TOP_K,
     )
 
+    # B2. Hybrid: union jobs sharing >= N resume skills (GIN index) that ANN missed
+    if settings.HYBRID_SKILL_TOP_K > 0 and resume.skills:
+        skill_hits = query_jobs_by_skill_overlap(
+            db=db,
+            resume_skills=resume.skills,
+            job_ids=filtered_job_ids,
+            min_overlap=settings.HYBRID_SKILL_MIN_OVERLAP,
+            limit=settings.HYBRID_SKILL_TOP_K,
+        )
+        extra_ids = [jid for jid, _ in skill_hits if jid not in semantic_scores]
+        if extra_ids:
+            extra_jobs, extra_scores = load_jobs_with_semantic_scores(
+                db=db,
+                resume_embedding=resume_embedding_list,
+                job_ids=extra_ids,
+                top_k=len(extra_ids),
+            )
+            jobs.extend(extra_jobs)
+            semantic_scores.update(extra_scores)
+        logger.info(
+            "Hybrid retrieval: %d skill-overlap hits, %d added beyond ANN",
+            len(skill_hits),
+            len(extra_ids),
+        )
+    return jobs, semantic_scores
+
+
+def _retrieve_candidates_standalone(
+    resume: ResumeContext,
+    filtered_job_ids: List[str] | None,
+) -> Tuple[List[Job], Dict[str, float]]:
+    """Run retrieve_candidates with its own DB session. Use from a thread."""
+    db = SessionLocal()
+    try:
+        return retrieve_candidates(db, resume, filtered_job_ids)
+    finally:
+        db.close()
+
+
+async def run_matching_pipeline(
+    resume: ResumeContext,
+    filtered_job_ids: List[str] | None = None,
+) -> MatchResponse:
+    """Execute the matching pipeline: SQL filter → semantic search (pgvector) + skill-overlap hits → score and rank.
+
+    If filtered_job_ids is provided (e.g. from parallel filter), the filter step is skipped.
+    Database work runs in a worker thread on its own session, so the event loop stays free.
+    """
+    logger.info(
+        "Starting matching pipeline (domain=%s, yoe=%d, country=%s)",
+        resume.domain,
+        resume.years_experience,
+        resume.country or "any",
+    )
+
+    if not resume.resume_embedding:
+        logger.warning("No resume_embedding; cannot run semantic search.")
+        return MatchResponse(
+            candidate_profile_id=resume.id,
+            total_matches=0,
+            matches=[],
+        )
+
+    jobs, semantic_scores = await asyncio.to_thread(_retrieve_candidates_standalone, resume, filtered_job_ids)
+
     if not jobs:
-        logger.info("No jobs returned from semantic search.")
+        logger.info("No jobs returned from semantic or skill search.")
         return MatchResponse(
             candidate_profile_id=resume.id,
             total_matches=0,
             matches=[],
         )
 
-    # C. Skill check and rank
-    results: List[MatchResult] = rank_jobs(
+    # C. Skill check and rank: compact scores for all, materialise only the top page
+    # (large candidate sets are scored on the ranking executor so the event loop stays responsive)
+    ranking = await score_and_order_jobs(
         resume_skills=resume.skills or [],
         candidate_yoe=resume.years_experience,
         jobs=jobs,
         semantic_scores=semantic_scores,
     )
+    id_to_job = {j.id: j for j in jobs}
+    results: List[MatchResult] = [
+        build_match_result(id_to_job[s.job_id], s, resume.skills or [])
+        for s in ranking[: settings.MATCH_MATERIALISE_TOP_N]
+    ]
 
-    logger.info("Matching pipeline complete: %d results", len(results))
+    logger.info("Matching pipeline complete: %d results (%d materialised)", len(ranking), len(results))
     return MatchResponse(
         candidate_profile_id=resume.id,
-        total_matches=len(results),
+        total_matches=len(ranking),
         matches=results,
+        ranking=ranking,
     )
@@ -0,0 +1,128 @@
+"""In-process metrics with Prometheus text exposition (served at GET /metrics).
+
+Counters and gauges are per process: scrape API and worker processes separately.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Tuple
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help_text = help_text
+        self._values: Dict[_LabelKey, float] = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(_key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(key)} {value:g}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[_key(labels)] = float(value)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...]) -> None:
+        super().__init__(name, help_text)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: Dict[_LabelKey, List[int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            counts[-1] += 1
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted((key, list(counts), self._values.get(key, 0.0)) for key, counts in self._counts.items())
+        for key, counts, total in items:
+            for bound, count in zip(self.buckets, counts):
+                lines.append(f"{self.name}_bucket{_format_labels(key + (('le', f'{bound:g}'),))} {count}")
+            lines.append(f"{self.name}_bucket{_format_labels(key + (('le', '+Inf'),))} {counts[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {total:g}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {counts[-1]}")
+        return lines
+
+
+_registry: List[_Metric] = []
+
+
+def _key(labels: Dict[str, str]) -> _LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: _LabelKey) -> str:
+    if not key:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in key
+    )
+    return "{" + body + "}"
+
+
+def render_metrics() -> str:
+    lines: List[str] = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ── Match queue ──
+match_uploads = Counter("match_uploads_total", "Resume uploads by admission outcome")
+match_jobs_superseded = Counter(
+    "match_jobs_superseded_total", "Pending/processing match jobs replaced by a newer upload"
+)
+match_queue_depth = Gauge("match_queue_depth", "Unfinished match jobs seen at the last admission check")
+
+# ── External calls (OpenRouter, Reducto) ──
+external_call_seconds = Histogram(
+    "external_call_seconds",
+    "Latency of successful external calls (winning attempt when hedged)",
+    (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+external_call_failures = Counter("external_call_failures_total", "Failed external calls by reason")
+external_call_hedges = Counter("external_call_hedges_total", "Hedged duplicate requests sent")
+external_call_hedge_wins = Counter("external_call_hedge_wins_total", "Calls answered first by the hedge")
+circuit_breaker_trips = Counter("circuit_breaker_trips_total", "Times a provider circuit opened")
+circuit_breaker_rejections = Counter(
+    "circuit_breaker_rejections_total", "Calls failed fast because the provider circuit was open"
+)
+circuit_breaker_state = Gauge("circuit_breaker_state", "Provider circuit state: 0 closed, 1 half-open, 2 open")
@@ -0,0 +1,145 @@
+"""Postgres LISTEN/NOTIFY for the event loop.
+
+One dedicated psycopg2 connection per process, registered with loop.add_reader, so
+notifications cost no threads or polling. Callbacks run on the event loop thread; the
+connection is re-established (and all channels re-LISTENed) if it drops. Notifications sent
+while it was down are lost: on_reconnect() callbacks run after each re-connection so state kept
+in sync by NOTIFY (caches, wakeups) can resynchronise.
+Send with notify(db, channel, payload) inside a transaction: delivery happens on commit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+
+import psycopg2
+import psycopg2.extensions
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config.database import engine
+
+logger = logging.getLogger(__name__)
+
+RECONNECT_DELAY_SECONDS = 5.0
+
+_callbacks: Dict[str, List[Callable[[str], None]]] = defaultdict(list)
+_reconnect_callbacks: List[Callable[[], None]] = []
+_conn: Any = None
+_task: asyncio.Task[Any] | None = None
+
+
+def notify(db: Session, channel: str, payload: str = "") -> None:
+    """Queue a NOTIFY in db's current transaction (sent when the caller commits)."""
+    db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": channel, "payload": payload})
+
+
+def _listen_sql(channel: str) -> str:
+    return f'LISTEN "{channel}"'
+
+
+def listen(channel: str, callback: Callable[[str], None]) -> None:
+    """Register callback(payload) for a channel (call on the event loop thread)."""
+    first = channel not in _callbacks
+    _callbacks[channel].append(callback)
+    if first and _conn is not None:
+        with _conn.cursor() as cur:
+            cur.execute(_listen_sql(channel))
+
+
+def on_reconnect(callback: Callable[[], None]) -> None:
+    """Register callback() to run on the event loop whenever the connection is re-established after a drop."""
+    _reconnect_callbacks.append(callback)
+
+
+def unlisten(channel: str, callback: Callable[[str], None]) -> None:
+    if callback in _callbacks.get(channel, []):
+        _callbacks[channel].remove(callback)
+
+
+def _connect():
+    url = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+    conn = psycopg2.connect(url)
+    conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+    with conn.cursor() as cur:
+        for channel in list(_callbacks):
+            cur.execute(_listen_sql(channel))
+    return conn
+
+
+def _dispatch(conn) -> None:
+    conn.poll()
+    while conn.notifies:
+        n = conn.notifies.pop(0)
+        for callback in list(_callbacks.get(n.channel, ())):
+            try:
+                callback(n.payload)
+            except Exception:
+                logger.exception("NOTIFY callback failed (channel=%s)", n.channel)
+
+
+def _run_reconnect_callbacks() -> None:
+    for callback in list(_reconnect_callbacks):
+        try:
+            callback()
+        except Exception:
+            logger.exception("LISTEN reconnect callback failed")
+
+
+async def _listener_loop() -> None:
+    global _conn
+    loop = asyncio.get_running_loop()
+    connected_before = False
+    while True:
+        try:
+            conn = await asyncio.to_thread(_connect)
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning("LISTEN connection failed (%s); retrying in %.0fs", e, RECONNECT_DELAY_SECONDS)
+            try:
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+            except asyncio.CancelledError:
+                break
+            continue
+
+        _conn = conn
+        readable = asyncio.Event()
+        loop.add_reader(conn.fileno(), readable.set)
+        logger.info("Listening for Postgres notifications on: %s", ", ".join(_callbacks) or "(none yet)")
+        if connected_before:
+            # Channels are LISTENed again; anything sent while we were down is gone
+            _run_reconnect_callbacks()
+        connected_before = True
+        try:
+            while True:
+                await readable.wait()
+                readable.clear()
+                _dispatch(conn)
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning("LISTEN connection lost (%s); reconnecting", e)
+        finally:
+            loop.remove_reader(conn.fileno())
+            _conn = None
+            conn.close()
+
+
+def start_pg_listener() -> asyncio.Task[Any]:
+    """Start the process-wide listener task (idempotent). Call from app/worker startup."""
+    global _task
+    if _task is None or _task.done():
+        _task = asyncio.create_task(_listener_loop())
+    return _task
+
+
+async def stop_pg_listener() -> None:
+    global _task
+    if _task is not None:
+        _task.cancel()
+        await asyncio.gather(_task, return_exceptions=True)
+        _task = None
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Tuple
 
 from sqlalchemy.orm import Session
 
 from app.config.settings import settings
-from app.models.job import Job
+from app.models.job import VECTOR_DIM, Job, normalise_skills
+from app.services.job_expiry import live_job_sql
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +76,80 @@ def load_jobs_with_semantic_scores(
     return ordered_jobs, scores
 
 
+def query_jobs_by_skill_overlap(
+    db: Session,
+    resume_skills: List[str],
+    job_ids: List[str],
+    min_overlap: int,
+    limit: int,
+) -> List[Tuple[str, int]]:
+    """Among jobs with given IDs, return up to `limit` sharing at least `min_overlap` resume skills.
+
+    Uses the GIN index on jobs.skills_normalized (&& = any shared skill), then counts the overlap.
+    Returns list of (job_id, overlap_count), most overlapping first.
+    """
+    skills = normalise_skills(resume_skills)
+    if not job_ids or not skills or limit <= 0:
+        return []
+    min_overlap = max(1, min(min_overlap, len(skills)))
+
+    sql = """
+        SELECT id, overlap FROM (
+            SELECT id,
+                   (SELECT count(*) FROM unnest(skills_normalized) AS s WHERE s = ANY(%(skills)s)) AS overlap
+            FROM jobs
+            WHERE skills_normalized && %(skills)s::text[]
+              AND id = ANY(%(job_ids)s)
+              AND job_embedding IS NOT NULL
+        ) AS t
+        WHERE overlap >= %(min_overlap)s
+        ORDER BY overlap DESC, id
+        LIMIT %(limit)s
+    """
+    raw_conn = db.connection().connection
+    with raw_conn.cursor() as cursor:
+        cursor.execute(
+            sql,
+            {"skills": skills, "job_ids": job_ids, "min_overlap": min_overlap, "limit": limit},
+        )
+        rows = cursor.fetchall()
+
+    return [(row[0], int(row[1])) for row in rows]
+
+
+def load_job_vectors(
+    db: Session,
+    job_ids: List[str],
+) -> Tuple[List[str], np.ndarray, List[List[str]]]:
+    """Fetch (ids, embedding matrix [n x dim] float32, normalised skills) for the given job IDs.
+
+    Used by batch matching to score many resumes against one candidate set in a single matrix pass.
+    """
+    import numpy as np
+    from pgvector.psycopg2 import register_vector
+
+    if not job_ids:
+        return [], np.zeros((0, VECTOR_DIM), dtype=np.float32), []
+
+    raw_conn = db.connection().connection
+    register_vector(raw_conn, globally=True)
+    sql = """
+        SELECT id, job_embedding, skills_normalized
+        FROM jobs
+        WHERE id = ANY(%s) AND job_embedding IS NOT NULL
+    """
+    with raw_conn.cursor() as cursor:
+        cursor.execute(sql, (job_ids,))
+        rows = cursor.fetchall()
+
+    if not rows:
+        return [], np.zeros((0, VECTOR_DIM), dtype=np.float32), []
+    ids = [row[0] for row in rows]
+    matrix = np.vstack([np.asarray(row[1], dtype=np.float32) for row in rows])
+    skills = [list(row[2] or []) for row in rows]
+    return ids, matrix, skills
+
+
 def query_similar_jobs_postgres_full_table(
     db: Session,
     resume_embedding: List[float],
@@ -91,10 +169,10 @@ def query_similar_jobs_postgres_full_table(
     register_vector(raw_conn, globally=True)
     vec_param = Vector(vec)
 
-    sql = """
+    sql = f"""
         SELECT id, (1 - (job_embedding <=> %s)) AS score
         FROM jobs
-        WHERE job_embedding IS NOT NULL
+        WHERE job_embedding IS NOT NULL AND {live_job_sql()}
         ORDER BY job_embedding <=> %s
         LIMIT %s
     """
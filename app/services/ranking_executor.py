@@ -0,0 +1,75 @@
+"""Executor-backed scoring for large candidate sets.
+
+Scoring thousands of jobs is pure CPU; running it on the event loop stalls every request
+served by the process (and the match worker). Above RANKING_OFFLOAD_THRESHOLD candidates,
+scoring + ordering runs on a thread or process pool using picklable JobRecord tuples.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List
+
+from app.config.settings import settings
+from app.models.job import Job
+from app.services.scoring import (
+    ScoredJob,
+    job_record,
+    order_scored,
+    score_and_order_records,
+    score_jobs,
+)
+
+logger = logging.getLogger(__name__)
+
+_executor: Executor | None = None
+
+
+def _get_executor() -> Executor:
+    """Lazily create the shared ranking executor (thread or process, per settings)."""
+    global _executor
+    if _executor is None:
+        workers = settings.RANKING_EXECUTOR_WORKERS or None
+        if settings.RANKING_EXECUTOR == "process":
+            # spawn: forking a process that already runs threads (uvicorn, anyio) is unsafe
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ranking")
+        logger.info("Ranking executor started (%s, workers=%s)", settings.RANKING_EXECUTOR, workers or "default")
+    return _executor
+
+
+async def score_and_order_jobs(
+    resume_skills: List[str],
+    candidate_yoe: int,
+    jobs: List[Job],
+    semantic_scores: Dict[str, float],
+) -> List[ScoredJob]:
+    """Score and order jobs; offload to the ranking executor when the set is large."""
+    if len(jobs) < settings.RANKING_OFFLOAD_THRESHOLD:
+        return order_scored(score_jobs(resume_skills, candidate_yoe, jobs, semantic_scores))
+
+    records = [job_record(j) for j in jobs]
+    # Ship only the scores the pool needs, not the caller's whole dict
+    scores = {r.job_id: semantic_scores.get(r.job_id, 0.0) for r in records}
+    loop = asyncio.get_running_loop()
+    logger.info("Offloading ranking of %d jobs to %s executor", len(records), settings.RANKING_EXECUTOR)
+    return await loop.run_in_executor(
+        _get_executor(),
+        partial(score_and_order_records, list(resume_skills or []), candidate_yoe, records, scores),
+    )
+
+
+def shutdown_ranking_executor() -> None:
+    """Shut down the ranking executor (call from app shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
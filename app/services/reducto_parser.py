@@ -5,13 +5,17 @@ Returns structured resume dict: domain, yoe, country, skills[], summary.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Dict, List
 
 from app.config.settings import settings
+from app.services.resilience import reducto
 
 logger = logging.getLogger(__name__)
 
+REDUCTO_POLL_MAX_INTERVAL_SECONDS = 5.0
+
 
 def _mimetype_from_filename(filename: str) -> str:
     lower = filename.lower()
@@ -22,13 +26,18 @@ def _mimetype_from_filename(filename: str) -> str:
     return "application/octet-stream"
 
 
-def parse_resume_with_reducto(file_bytes: bytes, filename: str) -> Dict[str, Any]:
-    """Upload file to Reducto, run resume pipeline, return structured resume dict.
+# One client per process (per event loop): keeps the HTTP connection pool warm across parses
+_client: Any = None
+_client_loop: asyncio.AbstractEventLoop | None = None
 
-    Expected pipeline output shape: { domain, yoe, country, skills (list), summary }.
-    """
+
+def _get_client() -> Any:
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is not None and _client_loop is loop:
+        return _client
     try:
-        from reducto import Reducto
+        from reducto import AsyncReducto
     except ImportError as e:
         raise ValueError(
             "reductoai package is not installed. pip install reductoai"
@@ -39,23 +48,45 @@ def parse_resume_with_reducto(file_bytes: bytes, filename: str) -> Dict[str, Any
         raise ValueError(
             "REDUCTO_API_KEY is not set. Add it to your .env file."
         )
-
-    pipeline_id = (settings.REDUCTO_PIPELINE_ID or "").strip()
-    if not pipeline_id:
-        raise ValueError(
-            "REDUCTO_PIPELINE_ID is not set. Add it to your .env file."
-        )
-
-    client = Reducto(api_key=api_key)
-    mimetype = _mimetype_from_filename(filename)
-    upload = client.upload(file=(filename, file_bytes, mimetype))
-    result = client.pipeline.run(input=upload.file_id, pipeline_id=pipeline_id)
-
-    # PipelineResponse.result.extract.result is a list of extracted records (one per doc)
-    extract_result = getattr(result, "result", None)
-    extract_response = getattr(extract_result, "extract", None) if extract_result else None
-    result_list = getattr(extract_response, "result", None) if extract_response else None
-
+    options: Dict[str, Any] = {}
+    if settings.REDUCTO_BASE_URL:
+        options["base_url"] = settings.REDUCTO_BASE_URL
+    _client = AsyncReducto(
+        api_key=api_key,
+        timeout=settings.REDUCTO_TIMEOUT_SECONDS,
+        max_retries=settings.REDUCTO_MAX_RETRIES,
+        **options,
+    )
+    _client_loop = loop
+    return _client
+
+
+async def close_reducto_client() -> None:
+    """Close the shared client (app/worker shutdown)."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.close()
+    _client, _client_loop = None, None
+
+
+def _field(obj: Any, name: str) -> Any:
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _extract_records(result: Any) -> Any:
+    """Extract record list from a pipeline result (run response or finished job result; model or dict)."""
+    for candidate in (_field(result, "result"), result):
+        records = _field(_field(candidate, "extract"), "result")
+        if records:
+            return records
+    return None
+
+
+def _resume_from_records(result_list: Any) -> Dict[str, Any]:
     if not result_list or not isinstance(result_list, list):
         raise ValueError("Reducto pipeline did not return extract result list.")
 
@@ -84,6 +115,53 @@ def parse_resume_with_reducto(file_bytes: bytes, filename: str) -> Dict[str, Any
     }
 
 
+async def parse_resume_with_reducto(file_bytes: bytes, filename: str) -> Dict[str, Any]:
+    """Upload file to Reducto, submit the resume pipeline as an async job and poll until done.
+
+    Expected pipeline output shape: { domain, yoe, country, skills (list), summary }.
+    Waiting costs a coroutine, not a thread; gives up after REDUCTO_JOB_TIMEOUT_SECONDS.
+    Each HTTP call goes through the resilience layer (deadline, hedging, circuit breaker).
+    """
+    pipeline_id = (settings.REDUCTO_PIPELINE_ID or "").strip()
+    if not pipeline_id:
+        raise ValueError(
+            "REDUCTO_PIPELINE_ID is not set. Add it to your .env file."
+        )
+
+    client = _get_client()
+    mimetype = _mimetype_from_filename(filename)
+    upload = await reducto.call(lambda: client.upload(file=(filename, file_bytes, mimetype)), op="upload")
+    # Submitting twice would run (and bill) the pipeline twice: never hedged
+    submitted = await reducto.call(
+        lambda: client.pipeline.run_job(input=upload.file_id, pipeline_id=pipeline_id),
+        op="submit",
+        hedge=False,
+    )
+    job_id = submitted.job_id
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.REDUCTO_JOB_TIMEOUT_SECONDS
+    interval = settings.REDUCTO_POLL_INTERVAL_SECONDS
+    while True:
+        job = await reducto.call(lambda: client.job.get(job_id), op="poll")
+        status = (_field(job, "status") or "").lower()
+        if status == "completed":
+            return _resume_from_records(_extract_records(_field(job, "result")))
+        if status == "failed":
+            reason = _field(job, "reason") or "unknown reason"
+            raise ValueError(f"Reducto job {job_id} failed: {reason}")
+        if loop.time() + interval > deadline:
+            try:
+                await client.job.cancel(job_id)
+            except Exception:
+                pass
+            raise TimeoutError(
+                f"Reducto job {job_id} not finished after {settings.REDUCTO_JOB_TIMEOUT_SECONDS}s"
+            )
+        await asyncio.sleep(interval)
+        interval = min(interval * 1.5, REDUCTO_POLL_MAX_INTERVAL_SECONDS)
+
+
 def build_resume_meaning(domain: str, yoe: int, skills: List[str], summary: str) -> str:
     """Build the concatenated string used for resume embedding."""
     parts = [
@@ -0,0 +1,198 @@
+"""Deadlines, hedging and circuit breaking for external calls (OpenRouter, Reducto).
+
+Each provider gets a ResilientClient:
+- every call runs under a deadline (asyncio.TimeoutError past it);
+- if a call hasn't answered after the recent p95 latency of that operation (op: upload, poll,
+  embed, ...; kept apart so fast polls don't drag the p95 of slow uploads down), an identical
+  hedge request is sent and whichever answers first wins (only for idempotent calls);
+- after CIRCUIT_FAILURE_THRESHOLD consecutive provider failures the circuit opens and calls fail
+  fast with CircuitOpenError for CIRCUIT_OPEN_SECONDS, then a single trial call is let through.
+Latency, hedges and breaker trips are exported via app.services.metrics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict, deque
+from typing import Awaitable, Callable, DefaultDict, Deque, TypeVar
+
+from app.config.settings import settings
+from app.services.metrics import (
+    circuit_breaker_rejections,
+    circuit_breaker_state,
+    circuit_breaker_trips,
+    external_call_failures,
+    external_call_hedge_wins,
+    external_call_hedges,
+    external_call_seconds,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LATENCY_WINDOW = 200  # Recent successful calls kept for the p95 estimate
+MIN_SAMPLES_FOR_HEDGE = 20  # No hedging until the p95 means something
+
+_CLOSED, _HALF_OPEN, _OPEN = "closed", "half_open", "open"
+_STATE_VALUE = {_CLOSED: 0, _HALF_OPEN: 1, _OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """Provider circuit is open: failing fast instead of waiting on a degraded service."""
+
+
+def _is_provider_failure(exc: BaseException) -> bool:
+    """Timeouts, connection errors, 429 and 5xx count against the provider; other 4xx are our fault."""
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+    return not isinstance(exc, ValueError)
+
+
+class CircuitBreaker:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.state = _CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        circuit_breaker_state.set(0, provider=name)
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        circuit_breaker_state.set(_STATE_VALUE[state], provider=self.name)
+
+    def before_call(self) -> None:
+        if self.state == _OPEN:
+            if time.monotonic() - self.opened_at < settings.CIRCUIT_OPEN_SECONDS:
+                circuit_breaker_rejections.inc(provider=self.name)
+                raise CircuitOpenError(f"{self.name} circuit is open")
+            self._set_state(_HALF_OPEN)
+        if self.state == _HALF_OPEN:
+            if self._trial_in_flight:
+                circuit_breaker_rejections.inc(provider=self.name)
+                raise CircuitOpenError(f"{self.name} circuit is half-open (trial call in flight)")
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        self._trial_in_flight = False
+        self.failures = 0
+        if self.state != _CLOSED:
+            logger.info("%s circuit closed", self.name)
+            self._set_state(_CLOSED)
+
+    def record_failure(self) -> None:
+        self._trial_in_flight = False
+        self.failures += 1
+        if self.state == _HALF_OPEN or self.failures >= settings.CIRCUIT_FAILURE_THRESHOLD:
+            if self.state != _OPEN:
+                circuit_breaker_trips.inc(provider=self.name)
+                logger.warning("%s circuit opened after %d failure(s)", self.name, self.failures)
+            self.opened_at = time.monotonic()
+            self._set_state(_OPEN)
+
+    def release(self) -> None:
+        """Call ended without a verdict (cancelled or not a provider failure)."""
+        self._trial_in_flight = False
+
+
+class ResilientClient:
+    def __init__(self, name: str, deadline_seconds: Callable[[], float]) -> None:
+        self.name = name
+        self._deadline_seconds = deadline_seconds
+        # One latency window per operation; the breaker is shared by all of the provider's calls
+        self._latencies: DefaultDict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=LATENCY_WINDOW)
+        )
+        self.breaker = CircuitBreaker(name)
+
+    def hedge_delay(self, op: str) -> float | None:
+        """Seconds to wait before hedging op (its recent p95, clamped), or None if hedging is off."""
+        latencies = self._latencies[op]
+        if not settings.EXTERNAL_HEDGE_ENABLED or len(latencies) < MIN_SAMPLES_FOR_HEDGE:
+            return None
+        ordered = sorted(latencies)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        low = settings.EXTERNAL_HEDGE_MIN_DELAY_MS / 1000
+        high = settings.EXTERNAL_HEDGE_MAX_DELAY_MS / 1000
+        return min(max(p95, low), high)
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        op: str = "call",
+        hedge: bool = True,
+        deadline: float | None = None,
+        track_latency: bool = True,
+    ) -> T:
+        """Run fn() under a deadline, hedged if hedge=True (fn must be safe to run twice).
+
+        op names the operation whose latency window drives the hedge delay (and labels metrics).
+        track_latency=False keeps atypical calls (large batches) out of the p95 used for hedging.
+        """
+        self.breaker.before_call()
+        deadline = self._deadline_seconds() if deadline is None else deadline
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(self._race(fn, op, hedge), timeout=deadline)
+        except asyncio.TimeoutError:
+            external_call_failures.inc(provider=self.name, reason="deadline")
+            self.breaker.record_failure()
+            raise
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
+        except Exception as e:
+            if _is_provider_failure(e):
+                external_call_failures.inc(provider=self.name, reason=type(e).__name__)
+                self.breaker.record_failure()
+            else:
+                self.breaker.release()
+            raise
+        elapsed = time.monotonic() - started
+        if track_latency:
+            self._latencies[op].append(elapsed)
+        external_call_seconds.observe(elapsed, provider=self.name, op=op)
+        self.breaker.record_success()
+        return result
+
+    async def _race(self, fn: Callable[[], Awaitable[T]], op: str, hedge: bool) -> T:
+        primary = asyncio.ensure_future(fn())
+        delay = self.hedge_delay(op) if hedge else None
+        if delay is None:
+            return await primary
+        attempts = [primary]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done:
+                external_call_hedges.inc(provider=self.name, op=op)
+                attempts.append(asyncio.ensure_future(fn()))
+            # First successful attempt wins; an error only counts once every attempt has failed
+            pending = set(attempts)
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            external_call_hedge_wins.inc(provider=self.name, op=op)
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in attempts:
+                if not task.done():
+                    task.cancel()
+
+
+openrouter = ResilientClient("openrouter", lambda: settings.EMBEDDING_CALL_DEADLINE_SECONDS)
+# Batch embeddings (ingest, /match/batch) get their own breaker: a failing batch must not open the
+# circuit for interactive resume uploads
+openrouter_batch = ResilientClient("openrouter_batch", lambda: settings.EMBEDDING_CALL_DEADLINE_SECONDS)
+reducto = ResilientClient("reducto", lambda: settings.REDUCTO_CALL_DEADLINE_SECONDS)
@@ -0,0 +1,96 @@
+"""Cache of structured resume parses and resume embeddings.
+
+Re-uploading the same file skips parsing (keyed by file sha256 + parser configuration, i.e.
+REDUCTO_PIPELINE_ID and the local parser mode, with PARSE_CACHE_TTL_SECONDS), and an unchanged resume meaning skips the embeddings call (keyed by
+EMBEDDING_MODEL + sha256 of the text). Changing the pipeline or model naturally misses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from datetime import timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config.database import SessionLocal
+from app.config.settings import settings
+from app.models.embedding_cache import EmbeddingCache
+from app.models.resume_parse_cache import ResumeParseCache
+from app.services.embedding import embed_text
+
+logger = logging.getLogger(__name__)
+
+_PARSE_FIELDS = ("domain", "yoe", "country", "skills", "summary")
+
+
+def get_cached_parse(db: Session, sha256: str, parser_key: str) -> Dict[str, Any] | None:
+    """Cached parse for this file under parser_key (parser_cache_key()), or None if missing/expired."""
+    ttl = settings.PARSE_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        return None
+    row = (
+        db.query(ResumeParseCache)
+        .filter(
+            ResumeParseCache.sha256 == sha256,
+            ResumeParseCache.pipeline_id == parser_key,
+            ResumeParseCache.created_at > func.now() - timedelta(seconds=ttl),
+        )
+        .first()
+    )
+    return dict(row.result) if row else None
+
+
+def save_parse(db: Session, sha256: str, parser_key: str, resume_data: Dict[str, Any]) -> None:
+    """Cache a parse under the parser_key it was looked up with (not one recomputed after parsing)."""
+    if settings.PARSE_CACHE_TTL_SECONDS <= 0:
+        return
+    result = {k: resume_data.get(k) for k in _PARSE_FIELDS}
+    stmt = insert(ResumeParseCache).values(sha256=sha256, pipeline_id=parser_key, result=result)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["sha256", "pipeline_id"],
+            set_={"result": stmt.excluded.result, "created_at": func.now()},
+        )
+    )
+    db.commit()
+
+
+def _text_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _get_cached_embedding(text_sha256: str) -> List[float] | None:
+    with SessionLocal() as db:
+        row = db.get(EmbeddingCache, (settings.EMBEDDING_MODEL, text_sha256))
+        return [float(x) for x in row.embedding] if row else None
+
+
+def _save_embedding(text_sha256: str, embedding: List[float]) -> None:
+    with SessionLocal() as db:
+        stmt = insert(EmbeddingCache).values(
+            model=settings.EMBEDDING_MODEL, text_sha256=text_sha256, embedding=embedding
+        )
+        db.execute(stmt.on_conflict_do_nothing(index_elements=["model", "text_sha256"]))
+        db.commit()
+
+
+async def embed_text_cached(text: str) -> List[float]:
+    """embed_text with a Postgres-backed cache (EMBEDDING_CACHE_ENABLED)."""
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return await embed_text(text)
+    key = _text_key(text)
+    cached = await asyncio.to_thread(_get_cached_embedding, key)
+    if cached is not None:
+        logger.info("Embedding cache hit (%s)", key[:12])
+        return cached
+    embedding = await embed_text(text)
+    try:
+        await asyncio.to_thread(_save_embedding, key, [float(x) for x in embedding])
+    except Exception as e:
+        logger.warning("Could not cache embedding: %s", e)
+    return embedding
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
-from typing import Dict, List, Set, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Set, Tuple
 
 from app.config.settings import settings
 from app.models.job import Job
-from app.schemas.matching import MatchExplanation, MatchResult, ScoreBreakdown, JobSummary
+from app.schemas.matching import MatchExplanation, MatchResult, ScoreBreakdown
+from app.services.job_summary_cache import job_summary
 
 logger = logging.getLogger(__name__)
 
@@ -75,11 +78,166 @@ def composite_score(
     )
 
 
+@dataclass(frozen=True, slots=True)
+class ScoredJob:
+    """Compact ranking record: job id + rounded scores. No job summary or explanation."""
+
+    job_id: str
+    score: float
+    skills: float
+    semantic: float
+    yoe: float
+
+    def to_row(self) -> list:
+        """Compact JSON-ready form: [job_id, score, skills, semantic, yoe]."""
+        return [self.job_id, self.score, self.skills, self.semantic, self.yoe]
+
+    @classmethod
+    def from_row(cls, row: list) -> "ScoredJob":
+        return cls(row[0], float(row[1]), float(row[2]), float(row[3]), float(row[4]))
+
+
+class JobRecord(NamedTuple):
+    """Picklable subset of a Job needed for scoring (safe to ship to a process pool)."""
+
+    job_id: str
+    skills_required: Tuple[str, ...]
+    years_experience_min: int
+    years_experience_max: int
+
+
+def job_record(job: Job) -> JobRecord:
+    return JobRecord(
+        job_id=job.id,
+        skills_required=tuple(job.skills_required or ()),
+        years_experience_min=job.years_experience_min,
+        years_experience_max=job.years_experience_max,
+    )
+
+
+def score_job_records(
+    resume_skills: List[str],
+    candidate_yoe: int,
+    records: List[JobRecord],
+    semantic_scores: Dict[str, float],
+) -> List[ScoredJob]:
+    """Compute composite scores only (input order). Explanations are built later per page."""
+    r_set = _canonicalise(resume_skills or [])
+    scored: List[ScoredJob] = []
+    for rec in records:
+        req_canon = _canonicalise(rec.skills_required)
+        skills_raw = (len(r_set & req_canon) / len(req_canon)) * 100.0 if req_canon else 0.0
+        sem_raw = semantic_scores.get(rec.job_id, 0.0) * 100.0
+        yoe_raw = yoe_fit_score(candidate_yoe, rec.years_experience_min, rec.years_experience_max)
+        comp = 0.5 * sem_raw + 0.5 * skills_raw
+        scored.append(
+            ScoredJob(
+                job_id=rec.job_id,
+                score=round(comp, 1),
+                skills=round(skills_raw, 1),
+                semantic=round(sem_raw, 1),
+                yoe=round(yoe_raw, 1),
+            )
+        )
+    return scored
+
+
+def score_and_order_records(
+    resume_skills: List[str],
+    candidate_yoe: int,
+    records: List[JobRecord],
+    semantic_scores: Dict[str, float],
+) -> List[ScoredJob]:
+    """Score + full ordering in one call (module-level so executors can pickle it)."""
+    return order_scored(score_job_records(resume_skills, candidate_yoe, records, semantic_scores))
+
+
+def score_jobs(
+    resume_skills: List[str],
+    candidate_yoe: int,
+    jobs: List[Job],
+    semantic_scores: Dict[str, float],
+) -> List[ScoredJob]:
+    """Compute composite scores for Job ORM objects (input order)."""
+    return score_job_records(
+        resume_skills, candidate_yoe, [job_record(j) for j in jobs], semantic_scores
+    )
+
+
+def order_scored(scored: List[ScoredJob]) -> List[ScoredJob]:
+    """Full ordering by composite score, descending (stable: ties keep retrieval order)."""
+    return sorted(scored, key=lambda s: s.score, reverse=True)
+
+
+def top_scored(scored: List[ScoredJob], n: int) -> List[ScoredJob]:
+    """Heap-based partial selection of the n best records; same order as order_scored(scored)[:n]."""
+    return heapq.nlargest(n, scored, key=lambda s: s.score)
+
+
+def _match_explanation(total_required: int, matched: List[str], missing_req: List[str]) -> MatchExplanation:
+    matched_count = total_required - len(missing_req) if total_required else 0
+    summary = ""
+    if total_required > 0:
+        summary = f"You match {matched_count} of {total_required} required skills."
+        if missing_req:
+            summary += f" Missing: {', '.join(missing_req)}."
+    else:
+        summary = f"Matched {len(matched)} skills." if matched else "No required skills listed."
+    return MatchExplanation(matched_skills=matched, missing_required=missing_req, summary=summary)
+
+
+def build_match_result(job: Job, scored: ScoredJob, resume_skills: List[str]) -> MatchResult:
+    """Materialise one MatchResult (job summary + explanation) for a scored job."""
+    job_req = job.skills_required or []
+    _, matched, missing_req = skills_score_required_only(resume_skills or [], job_req)
+    return MatchResult(
+        job=job_summary(job),
+        score=scored.score,
+        breakdown=ScoreBreakdown(
+            skills=scored.skills,
+            semantic=scored.semantic,
+            yoe=scored.yoe,
+        ),
+        explanation=_match_explanation(len(job_req), sorted(matched), sorted(missing_req)),
+    )
+
+
+def skill_indices(job_required: List[str], skills: List[str]) -> List[int]:
+    """Positions in job_required of explanation skills (display names come from the last occurrence)."""
+    last = {s: i for i, s in enumerate(job_required)}
+    return [last[s] for s in skills if s in last]
+
+
+def hydrate_match_result(
+    job: Job,
+    scored: ScoredJob,
+    matched_idx: List[int],
+    missing_idx: List[int],
+) -> MatchResult:
+    """Rebuild a MatchResult from stored skill indices into job.skills_required (no skill matching)."""
+    job_req = job.skills_required or []
+    return MatchResult(
+        job=job_summary(job),
+        score=scored.score,
+        breakdown=ScoreBreakdown(
+            skills=scored.skills,
+            semantic=scored.semantic,
+            yoe=scored.yoe,
+        ),
+        explanation=_match_explanation(
+            len(job_req),
+            sorted(job_req[i] for i in matched_idx),
+            sorted(job_req[i] for i in missing_idx),
+        ),
+    )
+
+
 def rank_jobs(
     resume_skills: List[str],
     candidate_yoe: int,
     jobs: List[Job],
     semantic_scores: Dict[str, float],
+    limit: int | None = None,
 ) -> List[MatchResult]:
     """Score and rank a list of jobs against a candidate's profile.
 
@@ -87,7 +245,8 @@ def rank_jobs(
         resume_skills: Candidate's canonical skills.
         candidate_yoe: Candidate's years of experience.
         jobs: Job ORM objects (already filtered by domain + YoE).
-        semantic_scores: {job_id: cosine_similarity_0_1} from Pinecone.
+        semantic_scores: {job_id: cosine_similarity_0_1} from pgvector.
+        limit: If set, only the top `limit` results are selected (heap) and materialised.
 
     Returns:
         Sorted list of MatchResult (highest composite score first).
@@ -98,65 +257,11 @@ def rank_jobs(
         candidate_yoe,
         len(resume_skills or []),
     )
-    results: List[MatchResult] = []
-
-    for job in jobs:
-        job_req = job.skills_required or []
-        skills_raw, matched, missing_req = skills_score_required_only(
-            resume_skills,
-            job_req,
-        )
-
-        sem_01 = semantic_scores.get(job.id, 0.0)
-        sem_raw = sem_01 * 100.0
-        yoe_raw = yoe_fit_score(candidate_yoe, job.years_experience_min, job.years_experience_max)
-        comp = 0.5 * sem_raw + 0.5 * skills_raw
-
-        total_required = len(job_req)
-        matched_count = total_required - len(missing_req) if total_required else 0
-
-        logger.info(
-            "[scoring] job=%s | company=%s | skills: %d/%d -> %.1f | semantic: %.4f -> %.1f | yoe: %.1f | composite: 0.5*%.1f + 0.5*%.1f = %.1f",
-            job.title,
-            job.company_name,
-            matched_count,
-            total_required,
-            skills_raw,
-            sem_01,
-            sem_raw,
-            yoe_raw,
-            skills_raw,
-            sem_raw,
-            comp,
-        )
-
-        summary = ""
-        if total_required > 0:
-            summary = f"You match {matched_count} of {total_required} required skills."
-            if missing_req:
-                summary += f" Missing: {', '.join(sorted(missing_req))}."
-        else:
-            summary = f"Matched {len(matched)} skills." if matched else "No required skills listed."
-
-        results.append(
-            MatchResult(
-                job=JobSummary.model_validate(job),
-                score=round(comp, 1),
-                breakdown=ScoreBreakdown(
-                    skills=round(skills_raw, 1),
-                    semantic=round(sem_raw, 1),
-                    yoe=round(yoe_raw, 1),
-                ),
-                explanation=MatchExplanation(
-                    matched_skills=sorted(matched),
-                    missing_required=sorted(missing_req),
-                    summary=summary,
-                ),
-            )
-        )
+    scored = score_jobs(resume_skills, candidate_yoe, jobs, semantic_scores)
+    ranked = top_scored(scored, limit) if limit is not None else order_scored(scored)
 
-    # Sort by composite score, descending
-    results.sort(key=lambda r: r.score, reverse=True)
+    id_to_job = {j.id: j for j in jobs}
+    results = [build_match_result(id_to_job[s.job_id], s, resume_skills) for s in ranked]
     if results:
         top = [(r.job.title, r.job.company_name, r.score) for r in results[:5]]
         logger.info("[scoring] rank_jobs done. top 5: %s", top)
@@ -0,0 +1,366 @@
+"""Sharded scatter-gather matching.
+
+Jobs are partitioned across shard worker processes (by hash of job id, or by domain). Each shard
+holds its jobs' embeddings and scoring fields in memory and answers a query with its local
+top-K ScoredJob rows; the coordinator fans the query out to the relevant shards, merges the
+per-shard lists into one global ranking and materialises a MatchResponse like the single-node
+pipeline. Shards talk over multiprocessing.connection (TCP + authkey), so they can run as
+several processes on one box (scripts/run_match_shard.py --local N) or on separate hosts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import heapq
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Dict, List, Tuple
+
+
+from app.config.database import SessionLocal
+from app.config.settings import settings
+from app.models.job import Job, normalise_skills
+from app.schemas.matching import MatchResponse
+from app.services.job_expiry import live_job_sql
+from app.services.job_filter import YOE_WINDOW
+from app.services.matching import ResumeContext
+from app.services.scoring import (
+    JobRecord,
+    ScoredJob,
+    build_match_result,
+    score_job_records,
+    top_scored,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _stable_hash(value: str) -> int:
+    """First 60 bits of md5 (same value as _stable_hash_sql in Postgres)."""
+    return int(hashlib.md5(value.encode("utf-8")).hexdigest()[:15], 16)
+
+
+def _stable_hash_sql(column: str) -> str:
+    return f"('x' || substr(md5({column}), 1, 15))::bit(60)::bigint"
+
+
+def shard_for_job(job_id: str, domain: str, n_shards: int, key: str = "hash") -> int:
+    """Owning shard of a job: by job id hash, or by domain (one domain lives on one shard)."""
+    return _stable_hash(domain if key == "domain" else job_id) % n_shards
+
+
+def shards_for_query(domain: str, n_shards: int, key: str = "hash") -> List[int]:
+    """Shards that can hold candidates for a query (domain sharding prunes to one)."""
+    if key == "domain":
+        return [_stable_hash(domain) % n_shards]
+    return list(range(n_shards))
+
+
+def _authkey() -> bytes:
+    """Shared secret for shard connections: a dedicated key, never another secret (e.g. JWT_SECRET)."""
+    key = (settings.MATCH_SHARD_AUTHKEY or "").strip()
+    if not key:
+        raise RuntimeError("MATCH_SHARD_AUTHKEY must be set to run or query match shards")
+    return key.encode("utf-8")
+
+
+def _parse_address(address: str) -> Tuple[str, int]:
+    host, _, port = address.strip().rpartition(":")
+    return (host or "127.0.0.1", int(port))
+
+
+# ── Shard side ──
+
+
+@dataclass
+class _ShardSnapshot:
+    """Immutable in-memory view of one shard's jobs (swapped wholesale on reload)."""
+
+    ids: List[str]
+    unit: Any  # np.ndarray [n x dim], L2-normalised embeddings
+    domains: Any  # np.ndarray[object]
+    countries: Any  # np.ndarray[object], None = any country
+    yoe_min: Any  # np.ndarray[int]
+    yoe_max: Any  # np.ndarray[int]
+    records: List[JobRecord]
+    postings: Dict[str, List[int]]  # normalised skill -> row positions
+
+
+def load_shard_snapshot(shard: int, n_shards: int, key: str) -> _ShardSnapshot:
+    """Load the jobs owned by this shard from Postgres (ownership is filtered in SQL)."""
+    import numpy as np
+    from pgvector.psycopg2 import register_vector
+
+    db = SessionLocal()
+    try:
+        raw_conn = db.connection().connection
+        register_vector(raw_conn, globally=True)
+        sql = f"""
+            SELECT id, job_embedding, domain, country, years_experience_min,
+                   years_experience_max, skills_required, skills_normalized
+            FROM jobs
+            WHERE job_embedding IS NOT NULL AND {live_job_sql()}
+              AND {_stable_hash_sql("domain" if key == "domain" else "id")} %% %(n_shards)s = %(shard)s
+        """
+        with raw_conn.cursor() as cursor:
+            cursor.execute(sql, {"n_shards": n_shards, "shard": shard})
+            rows = cursor.fetchall()
+    finally:
+        db.close()
+
+    if rows:
+        matrix = np.vstack([np.asarray(r[1], dtype=np.float32) for r in rows])
+        unit = matrix / np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+    else:
+        unit = np.zeros((0, 1), dtype=np.float32)
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for pos, r in enumerate(rows):
+        for skill in r[7] or []:
+            postings[skill].append(pos)
+    return _ShardSnapshot(
+        ids=[r[0] for r in rows],
+        unit=unit,
+        domains=np.array([r[2] for r in rows], dtype=object),
+        countries=np.array([r[3] for r in rows], dtype=object),
+        yoe_min=np.array([r[4] for r in rows], dtype=np.int64),
+        yoe_max=np.array([r[5] for r in rows], dtype=np.int64),
+        records=[JobRecord(r[0], tuple(r[6] or ()), r[4], r[5]) for r in rows],
+        postings=dict(postings),
+    )
+
+
+def query_shard(snapshot: _ShardSnapshot, query: Dict[str, Any]) -> Tuple[List[list], int]:
+    """Local match on one shard: filter → cosine top-K ∪ skill-overlap hits → score → local top_k.
+
+    Returns (ScoredJob rows, number of candidates scored).
+    """
+    import numpy as np
+
+    if not snapshot.ids:
+        return [], 0
+    yoe = int(query["yoe"])
+    delta_min, delta_max = max(0, yoe - YOE_WINDOW), yoe + YOE_WINDOW
+    mask = (
+        (snapshot.domains == query["domain"])
+        & (snapshot.yoe_min <= delta_max)
+        & (snapshot.yoe_max >= delta_min)
+    )
+    country = query.get("country")
+    if country:
+        mask &= (snapshot.countries == None) | (snapshot.countries == country)  # noqa: E711
+    positions = np.nonzero(mask)[0]
+    if positions.size == 0:
+        return [], 0
+
+    q = np.asarray(query["embedding"], dtype=np.float32)
+    q = q / max(float(np.linalg.norm(q)), 1e-12)
+    sims = snapshot.unit[positions] @ q
+    k = min(settings.ANN_TOP_K, positions.size)
+    chosen = {int(positions[i]): float(sims[i]) for i in np.argpartition(-sims, k - 1)[:k]}
+
+    resume_skills = normalise_skills(query.get("skills"))
+    if settings.HYBRID_SKILL_TOP_K > 0 and resume_skills:
+        min_overlap = max(1, min(settings.HYBRID_SKILL_MIN_OVERLAP, len(resume_skills)))
+        overlap = Counter(p for s in resume_skills for p in snapshot.postings.get(s, ()) if mask[p])
+        hits = [p for p, n in overlap.most_common() if n >= min_overlap][: settings.HYBRID_SKILL_TOP_K]
+        for p in hits:
+            if p not in chosen:
+                chosen[p] = float(snapshot.unit[p] @ q)
+
+    ordered = sorted(chosen, key=lambda p: -chosen[p])
+    records = [snapshot.records[p] for p in ordered]
+    semantic_scores = {snapshot.ids[p]: chosen[p] for p in ordered}
+    scored = score_job_records(query.get("skills") or [], yoe, records, semantic_scores)
+    local_top = top_scored(scored, int(query.get("top_k") or settings.MATCH_SHARD_TOP_K))
+    return [s.to_row() for s in local_top], len(scored)
+
+
+class ShardServer:
+    """Serves match queries for one shard; reloads its snapshot every MATCH_SHARD_RELOAD_SECONDS."""
+
+    def __init__(self, shard: int, n_shards: int, host: str, port: int, key: str | None = None):
+        self.shard = shard
+        self.n_shards = n_shards
+        self.address = (host, port)
+        self.key = key or settings.MATCH_SHARD_KEY
+        self._authkey = _authkey()  # Fail before loading the snapshot if it is missing
+        self._snapshot = load_shard_snapshot(shard, n_shards, self.key)
+
+    def _reload_loop(self) -> None:
+        interval = settings.MATCH_SHARD_RELOAD_SECONDS
+        while interval > 0:
+            time.sleep(interval)
+            try:
+                self._snapshot = load_shard_snapshot(self.shard, self.n_shards, self.key)
+                logger.info("Shard %d reloaded: %d jobs", self.shard, len(self._snapshot.ids))
+            except Exception:
+                logger.exception("Shard %d reload failed; keeping previous snapshot", self.shard)
+
+    def _handle(self, conn: Connection) -> None:
+        with conn:
+            while True:
+                try:
+                    op, payload = conn.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    if op == "query":
+                        conn.send(("ok", query_shard(self._snapshot, payload)))
+                    elif op == "ping":
+                        conn.send(("ok", len(self._snapshot.ids)))
+                    else:
+                        conn.send(("error", f"unknown op {op!r}"))
+                except Exception as e:
+                    logger.exception("Shard %d query failed", self.shard)
+                    conn.send(("error", str(e)))
+
+    def serve_forever(self) -> None:
+        threading.Thread(target=self._reload_loop, daemon=True).start()
+        with Listener(self.address, authkey=self._authkey) as listener:
+            logger.info(
+                "Shard %d/%d serving %d jobs on %s:%d",
+                self.shard,
+                self.n_shards,
+                len(self._snapshot.ids),
+                *self.address,
+            )
+            while True:
+                conn = listener.accept()
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+
+def run_shard_server(shard: int, n_shards: int, host: str, port: int, key: str | None = None) -> None:
+    """Process entry point for one shard (module-level so multiprocessing can spawn it)."""
+    logging.basicConfig(level=logging.INFO)
+    ShardServer(shard, n_shards, host, port, key).serve_forever()
+
+
+# ── Coordinator side ──
+
+
+class _ShardClient:
+    """One persistent connection per shard; calls are serialised and run off the event loop."""
+
+    def __init__(self, address: str):
+        self.address = _parse_address(address)
+        self._conn: Connection | None = None
+        self._lock = threading.Lock()
+
+    def _drop_conn(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except OSError:
+                pass
+            self._conn = None
+
+    def _call(self, op: str, payload: Any) -> Any:
+        timeout = settings.MATCH_SHARD_TIMEOUT_SECONDS
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    if self._conn is None:
+                        self._conn = Client(self.address, authkey=_authkey())
+                    self._conn.send((op, payload))
+                    if not self._conn.poll(timeout):
+                        # A late reply would be read by the next call: never reuse this connection
+                        self._drop_conn()
+                        raise TimeoutError(
+                            f"Shard {self.address[0]}:{self.address[1]} did not answer within {timeout}s"
+                        )
+                    status, result = self._conn.recv()
+                    break
+                except (EOFError, OSError):
+                    self._drop_conn()  # shard restarted; reconnect once
+                    if attempt:
+                        raise
+        if status != "ok":
+            raise RuntimeError(f"Shard {self.address[0]}:{self.address[1]} error: {result}")
+        return result
+
+    async def query(self, payload: Dict[str, Any]) -> Tuple[List[list], int]:
+        return await asyncio.to_thread(self._call, "query", payload)
+
+
+_clients: List[_ShardClient] | None = None
+
+
+def sharding_enabled() -> bool:
+    return bool((settings.MATCH_SHARD_ADDRESSES or "").strip())
+
+
+def check_shard_config() -> None:
+    """Raise at startup if shards are configured without MATCH_SHARD_AUTHKEY."""
+    if sharding_enabled():
+        _authkey()
+
+
+def _get_clients() -> List[_ShardClient]:
+    global _clients
+    if _clients is None:
+        addresses = [a for a in settings.MATCH_SHARD_ADDRESSES.split(",") if a.strip()]
+        _clients = [_ShardClient(a) for a in addresses]
+    return _clients
+
+
+def _load_jobs(job_ids: List[str]) -> List[Job]:
+    """Load jobs with their own DB session. Use from a thread."""
+    with SessionLocal() as db:
+        return db.query(Job).filter(Job.id.in_(job_ids)).all()
+
+
+async def run_sharded_matching(resume: ResumeContext) -> MatchResponse:
+    """Scatter a ResumeContext to the relevant shards, gather local top-Ks, merge globally."""
+    clients = _get_clients()
+    shard_ids = shards_for_query(resume.domain, len(clients), settings.MATCH_SHARD_KEY)
+    payload = {
+        "domain": resume.domain,
+        "yoe": resume.years_experience,
+        "country": resume.country,
+        "skills": list(resume.skills or []),
+        "embedding": [float(x) for x in resume.resume_embedding],
+        "top_k": settings.MATCH_SHARD_TOP_K,
+    }
+    outcomes = await asyncio.gather(
+        *(clients[i].query(payload) for i in shard_ids), return_exceptions=True
+    )
+    replies = []
+    for shard, outcome in zip(shard_ids, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.warning("Shard %d failed: %s", shard, outcome)
+        else:
+            replies.append(outcome)
+    if not replies:
+        # Nothing to merge: fail so the match job is retried
+        raise RuntimeError(f"All {len(shard_ids)} shard(s) failed") from outcomes[0]
+
+    # Each shard list is already score-descending: k-way merge into the global ranking
+    per_shard = [[ScoredJob.from_row(r) for r in rows] for rows, _ in replies]
+    ranking = list(heapq.merge(*per_shard, key=lambda s: s.score, reverse=True))
+    logger.info(
+        "Sharded match: %d/%d shard(s) answered, %d candidates scored, %d merged",
+        len(replies),
+        len(shard_ids),
+        sum(n for _, n in replies),
+        len(ranking),
+    )
+
+    top = ranking[: settings.MATCH_MATERIALISE_TOP_N]
+    jobs = await asyncio.to_thread(_load_jobs, [s.job_id for s in top])
+    id_to_job = {j.id: j for j in jobs}
+    matches = [
+        build_match_result(id_to_job[s.job_id], s, resume.skills or [])
+        for s in top
+        if s.job_id in id_to_job
+    ]
+    return MatchResponse(
+        candidate_profile_id=resume.id,
+        total_matches=len(ranking),
+        matches=matches,
+        ranking=ranking,
+    )
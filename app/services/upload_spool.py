@@ -0,0 +1,211 @@
+"""Spool resume uploads to disk so queued match jobs hold a file reference, not the bytes.
+
+spool_multipart_upload parses the raw request body (request.stream()) with python-multipart and
+writes the file part straight into the spool dir, with the size cap enforced and the sha256
+computed as bytes arrive: an oversized upload is cut off once it passes the cap (or up front from
+Content-Length) instead of being received in full first, and there is only one disk copy.
+Spool files no match_job_payloads row references (e.g. the process died between spooling and the
+enqueue commit) are removed by sweep_orphaned_spool_files. MATCH_SPOOL_DIR must be shared storage
+(e.g. a mounted volume) when app.worker processes run on other hosts than the API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import BinaryIO, Dict, List, NamedTuple, Tuple
+
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.match_job import MatchJobPayload
+
+logger = logging.getLogger(__name__)
+
+SPOOL_CHUNK_BYTES = 256 * 1024
+MULTIPART_OVERHEAD_BYTES = 64 * 1024  # Allowance for boundaries/headers in the Content-Length check
+MAX_FILENAME_CHARS = MatchJobPayload.__table__.c.filename.type.length  # match_job_payloads.filename
+
+
+class UploadTooLarge(Exception):
+    """Upload exceeded the size cap while streaming (partial spool file already removed)."""
+
+
+class MalformedUpload(Exception):
+    """Request body is not multipart/form-data with the expected file field."""
+
+
+class SpooledUpload(NamedTuple):
+    path: str
+    sha256: str
+    size: int
+
+
+def spool_dir() -> Path:
+    path = Path(settings.MATCH_SPOOL_DIR or os.path.join(tempfile.gettempdir(), "jobzie-match-spool"))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _clip_filename(name: str) -> str:
+    """Shorten a client-supplied filename to fit match_job_payloads.filename, keeping its extension."""
+    if len(name) <= MAX_FILENAME_CHARS:
+        return name
+    stem, dot, ext = name.rpartition(".")
+    if not dot or len(ext) + 1 >= MAX_FILENAME_CHARS:
+        return name[:MAX_FILENAME_CHARS]
+    return f"{stem[: MAX_FILENAME_CHARS - len(ext) - 1]}.{ext}"
+
+
+class _MultipartSpool:
+    """python-multipart callbacks that stream one file field into a spool file."""
+
+    def __init__(self, field: str, max_bytes: int) -> None:
+        self.field = field.encode("utf-8")
+        self.max_bytes = max_bytes
+        self.final = spool_dir() / f"{uuid.uuid4().hex}.upload"
+        self.partial = self.final.with_suffix(".part")
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.filename: str | None = None
+        self._out: BinaryIO | None = None
+        self._headers: Dict[bytes, bytes] = {}
+        self._name: List[bytes] = []
+        self._value: List[bytes] = []
+
+    def callbacks(self) -> Dict[str, object]:
+        return {
+            "on_part_begin": self._part_begin,
+            "on_header_field": lambda data, start, end: self._name.append(data[start:end]),
+            "on_header_value": lambda data, start, end: self._value.append(data[start:end]),
+            "on_header_end": self._header_end,
+            "on_headers_finished": self._headers_finished,
+            "on_part_data": self._part_data,
+            "on_part_end": self._part_end,
+        }
+
+    def _part_begin(self) -> None:
+        self._headers = {}
+
+    def _header_end(self) -> None:
+        self._headers[b"".join(self._name).lower()] = b"".join(self._value)
+        self._name.clear()
+        self._value.clear()
+
+    def _headers_finished(self) -> None:
+        from python_multipart.multipart import parse_options_header
+
+        _, options = parse_options_header(self._headers.get(b"content-disposition"))
+        if options.get(b"name") == self.field and b"filename" in options and self.filename is None:
+            self.filename = _clip_filename(options[b"filename"].decode("utf-8", "replace"))
+            self._out = open(self.partial, "wb")
+
+    def _part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._out is None:
+            return
+        self.size += end - start
+        if self.size > self.max_bytes:
+            raise UploadTooLarge(f"Upload exceeds {self.max_bytes} bytes")
+        chunk = data[start:end]
+        self.digest.update(chunk)
+        self._out.write(chunk)
+
+    def _part_end(self) -> None:
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+            os.replace(self.partial, self.final)
+
+    def discard(self) -> None:
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+        self.partial.unlink(missing_ok=True)
+        self.final.unlink(missing_ok=True)
+
+
+async def spool_multipart_upload(request: Request, field: str, max_bytes: int) -> Tuple[SpooledUpload, str]:
+    """Stream the multipart file field `field` into the spool dir. Returns (upload, filename).
+
+    Raises UploadTooLarge past max_bytes (checked against Content-Length before reading, then
+    while streaming) and MalformedUpload if the body is not multipart or lacks the file field.
+    """
+    from python_multipart.exceptions import MultipartParseError
+    from python_multipart.multipart import MultipartParser, parse_options_header
+
+    content_type, params = parse_options_header(request.headers.get("content-type"))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise MalformedUpload("Expected multipart/form-data")
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > max_bytes + MULTIPART_OVERHEAD_BYTES:
+        raise UploadTooLarge(f"Upload exceeds {max_bytes} bytes")
+
+    sink = _MultipartSpool(field, max_bytes)
+    parser = MultipartParser(params[b"boundary"], sink.callbacks())
+    try:
+        async for chunk in request.stream():
+            if chunk:
+                # Disk writes happen in the callbacks: keep them off the event loop
+                await asyncio.to_thread(parser.write, chunk)
+        await asyncio.to_thread(parser.finalize)
+    except MultipartParseError as e:
+        sink.discard()
+        raise MalformedUpload(str(e)) from e
+    except BaseException:
+        sink.discard()
+        raise
+    if sink.filename is None or not sink.final.exists():
+        sink.discard()
+        raise MalformedUpload(f"Missing file field {field!r}")
+    return SpooledUpload(path=str(sink.final), sha256=sink.digest.hexdigest(), size=sink.size), sink.filename
+
+
+def read_spooled(path: str) -> bytes:
+    return Path(path).read_bytes()
+
+
+def remove_spooled(*paths: str | None) -> None:
+    """Delete spool files; missing files are ignored (already cleaned up elsewhere)."""
+    for path in paths:
+        if not path:
+            continue
+        try:
+            Path(path).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Could not remove spooled upload %s: %s", path, e)
+
+
+def sweep_orphaned_spool_files(db: Session, min_age_seconds: float | None = None) -> int:
+    """Remove spool files older than min_age_seconds that no payload row references. Returns count.
+
+    The age floor leaves alone uploads that are still between spooling and the enqueue commit.
+    """
+    min_age = settings.MATCH_SPOOL_ORPHAN_SECONDS if min_age_seconds is None else min_age_seconds
+    cutoff = time.time() - min_age
+    candidates: List[str] = []
+    for entry in spool_dir().iterdir():
+        try:
+            if entry.suffix in (".upload", ".part") and entry.stat().st_mtime < cutoff:
+                candidates.append(str(entry))
+        except OSError:
+            continue  # Removed concurrently
+    if not candidates:
+        return 0
+    referenced = {
+        row[0]
+        for row in db.query(MatchJobPayload.spool_path)
+        .filter(MatchJobPayload.spool_path.in_(candidates))
+        .all()
+    }
+    orphans = [path for path in candidates if path not in referenced]
+    remove_spooled(*orphans)
+    if orphans:
+        logger.info("Removed %d orphaned spool file(s)", len(orphans))
+    return len(orphans)
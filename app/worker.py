@@ -0,0 +1,80 @@
+"""Standalone match worker process: claims match jobs from Postgres and runs the pipeline.
+
+    python -m app.worker --concurrency 8 --db-pool-size 12
+
+Lets API and worker fleets scale independently: run the API with RUN_MATCH_WORKER=false
+(enqueue only) and as many of these as the load needs. Options override the MATCH_*_CONCURRENCY
+and DB_POOL_* settings for this process only; keep the DB pool at least as large as the search
+and persist stage workers plus a few connections for claims, filters and lease heartbeats.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from app.config.settings import settings
+
+logger = logging.getLogger("app.worker")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the match-job worker pool without the API.")
+    parser.add_argument("--concurrency", type=int, default=settings.MATCH_WORKER_CONCURRENCY)
+    parser.add_argument("--parse-concurrency", type=int, default=settings.MATCH_PARSE_CONCURRENCY)
+    parser.add_argument("--embed-concurrency", type=int, default=settings.MATCH_EMBED_CONCURRENCY)
+    parser.add_argument("--db-concurrency", type=int, default=settings.MATCH_DB_CONCURRENCY)
+    parser.add_argument("--persist-concurrency", type=int, default=settings.MATCH_PERSIST_CONCURRENCY)
+    parser.add_argument("--queue-size", type=int, default=settings.MATCH_STAGE_QUEUE_SIZE)
+    parser.add_argument("--db-pool-size", type=int, default=settings.DB_POOL_SIZE)
+    parser.add_argument("--db-max-overflow", type=int, default=settings.DB_MAX_OVERFLOW)
+    return parser.parse_args()
+
+
+def _apply_overrides(args: argparse.Namespace) -> None:
+    # Must run before app.config.database is imported: the engine reads the pool size once
+    settings.MATCH_WORKER_CONCURRENCY = args.concurrency
+    settings.MATCH_PARSE_CONCURRENCY = args.parse_concurrency
+    settings.MATCH_EMBED_CONCURRENCY = args.embed_concurrency
+    settings.MATCH_DB_CONCURRENCY = args.db_concurrency
+    settings.MATCH_PERSIST_CONCURRENCY = args.persist_concurrency
+    settings.MATCH_STAGE_QUEUE_SIZE = args.queue_size
+    settings.DB_POOL_SIZE = args.db_pool_size
+    settings.DB_MAX_OVERFLOW = args.db_max_overflow
+
+
+async def _run() -> None:
+    from app.services.match_job_queue import start_match_worker
+    from app.services.pg_listener import start_pg_listener, stop_pg_listener
+    from app.services.ranking_executor import shutdown_ranking_executor
+    from app.services.reducto_parser import close_reducto_client
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    worker_task = start_match_worker()
+    start_pg_listener()
+    stopper = asyncio.create_task(stop.wait())
+    await asyncio.wait({worker_task, stopper}, return_when=asyncio.FIRST_COMPLETED)
+
+    logger.info("Shutting down match worker...")
+    stopper.cancel()
+    worker_task.cancel()
+    await asyncio.gather(worker_task, return_exceptions=True)
+    await stop_pg_listener()
+    await close_reducto_client()
+    shutdown_ranking_executor()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    _apply_overrides(_parse_args())
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Move expired jobs (expires_at passed, or older than JOB_MAX_AGE_DAYS) into jobs_archive.
+
+The API also does this periodically (JOB_ARCHIVE_INTERVAL_SECONDS); run manually or from cron:
+
+    python -m scripts.archive_jobs
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+_backend_root = Path(__file__).resolve().parent.parent
+if str(_backend_root) not in sys.path:
+    sys.path.insert(0, str(_backend_root))
+
+from app.services.job_expiry import archive_expired_jobs_standalone
+
+
+def main() -> None:
+    n = archive_expired_jobs_standalone()
+    print(f"Archived {n} expired job(s).")
+
+
+if __name__ == "__main__":
+    main()
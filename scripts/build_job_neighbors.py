@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Build precomputed similar-job lists (job_neighbors) for new or updated jobs.
+
+The API also runs this periodically (JOB_NEIGHBORS_REFRESH_SECONDS); use the script for a
+one-off build, or --all to rebuild every job (e.g. after changing JOB_NEIGHBORS_K):
+
+    python -m scripts.build_job_neighbors [--all]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+_backend_root = Path(__file__).resolve().parent.parent
+if str(_backend_root) not in sys.path:
+    sys.path.insert(0, str(_backend_root))
+
+from app.config.database import SessionLocal, try_advisory_lock
+from app.models.job import Job
+from app.services.job_neighbors import build_neighbors, stale_job_ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build job_neighbors for new/updated jobs.")
+    parser.add_argument("--all", action="store_true", help="Rebuild neighbours for every job")
+    args = parser.parse_args()
+
+    # Same lock as the API's builder: concurrent builders collide on job_neighbors' primary key
+    with try_advisory_lock("job_neighbors") as held:
+        if not held:
+            print("Another process is building job neighbours; try again shortly.")
+            sys.exit(1)
+        db = SessionLocal()
+        try:
+            if args.all:
+                job_ids = [row[0] for row in db.query(Job.id).filter(Job.job_embedding.isnot(None)).all()]
+            else:
+                job_ids = stale_job_ids(db)
+            print(f"Building neighbours for {len(job_ids)} job(s)...")
+            built = build_neighbors(db, job_ids)
+        finally:
+            db.close()
+    print(f"Done. Built {built}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Fingerprint existing jobs and collapse near-duplicates into their oldest canonical posting.
+
+New ingests are deduplicated by seed_jobs; run this once to backfill job_fingerprints for
+jobs ingested before dedup existed. Saved-job references move to the canonical job.
+
+    python -m scripts.dedup_jobs [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+_backend_root = Path(__file__).resolve().parent.parent
+if str(_backend_root) not in sys.path:
+    sys.path.insert(0, str(_backend_root))
+
+from app.config.database import SessionLocal
+from app.models.job import Job
+from app.models.job_fingerprint import JobFingerprint
+from app.services.job_dedup import add_fingerprint, collapse_into, find_duplicate, minhash_signature
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill fingerprints and collapse duplicate jobs.")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report duplicates without changing anything (the full pass runs in one rolled-back transaction)",
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        jobs = (
+            db.query(Job)
+            .outerjoin(JobFingerprint, JobFingerprint.job_id == Job.id)
+            .filter(JobFingerprint.job_id.is_(None))
+            .order_by(Job.created_at.asc(), Job.id.asc())
+            .all()
+        )
+        print(f"Fingerprinting {len(jobs)} job(s)...")
+        collapsed = 0
+        for job in jobs:
+            signature = minhash_signature(job)
+            canonical_id = find_duplicate(db, signature, job.job_embedding, exclude_id=job.id)
+            if canonical_id:
+                print(f"  Duplicate: {job.title} at {job.company_name} ({job.id}) -> {canonical_id}")
+                collapsed += 1
+                collapse_into(db, job.id, canonical_id)
+            else:
+                # Later jobs must see this fingerprint (in dry runs too), so always write it
+                add_fingerprint(db, job.id, signature)
+            if args.dry_run:
+                db.flush()
+            else:
+                db.commit()
+        if args.dry_run:
+            db.rollback()
+    finally:
+        db.close()
+    print(f"Done. {'Found' if args.dry_run else 'Collapsed'} {collapsed} duplicate(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""Incrementally refresh users' cached match lists after new jobs are ingested.
+
+Scores only jobs added/updated since each user's last match against their stored profile
+and resume embedding (no Reducto parse, no re-embedding). Run after seeding, e.g. nightly:
+
+    python -m scripts.refresh_matches
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+_backend_root = Path(__file__).resolve().parent.parent
+if str(_backend_root) not in sys.path:
+    sys.path.insert(0, str(_backend_root))
+
+from app.config.database import SessionLocal
+from app.services.incremental_rematch import refresh_all_matches
+
+
+def main() -> None:
+    db = SessionLocal()
+    try:
+        refreshed, scored = refresh_all_matches(db)
+    finally:
+        db.close()
+    print(f"Refreshed {refreshed} user(s); scored {scored} new/changed job(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Run matching shard worker(s) for sharded scatter-gather matching.
+
+One shard per process (e.g. one per host):
+
+    python -m scripts.run_match_shard --shard 0 --shards 4 --port 7100
+
+All shards on this box, one process each (ports base-port .. base-port+N-1):
+
+    python -m scripts.run_match_shard --local 4 --base-port 7100
+
+Then point the API/worker at them:
+MATCH_SHARD_ADDRESSES=127.0.0.1:7100,127.0.0.1:7101,127.0.0.1:7102,127.0.0.1:7103
+(the address order defines shard numbers; MATCH_SHARD_KEY must match on both sides).
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import sys
+from pathlib import Path
+
+_backend_root = Path(__file__).resolve().parent.parent
+if str(_backend_root) not in sys.path:
+    sys.path.insert(0, str(_backend_root))
+
+from app.config.settings import settings
+from app.services.sharded_matching import run_shard_server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run matching shard worker(s).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--shard", type=int, help="Shard number served by this process")
+    parser.add_argument("--shards", type=int, help="Total number of shards")
+    parser.add_argument("--port", type=int, default=7100)
+    parser.add_argument("--local", type=int, help="Spawn this many shard processes on this box")
+    parser.add_argument("--base-port", type=int, default=7100)
+    parser.add_argument("--key", choices=["hash", "domain"], default=settings.MATCH_SHARD_KEY)
+    args = parser.parse_args()
+    if not (settings.MATCH_SHARD_AUTHKEY or "").strip():
+        parser.error("MATCH_SHARD_AUTHKEY must be set (the coordinator uses the same key)")
+
+    if args.local:
+        ctx = multiprocessing.get_context("spawn")
+        procs = [
+            ctx.Process(
+                target=run_shard_server,
+                args=(i, args.local, args.host, args.base_port + i, args.key),
+                name=f"match-shard-{i}",
+            )
+            for i in range(args.local)
+        ]
+        for p in procs:
+            p.start()
+        addresses = ",".join(f"{args.host}:{args.base_port + i}" for i in range(args.local))
+        print(f"Started {args.local} shard(s). MATCH_SHARD_ADDRESSES={addresses}")
+        try:
+            for p in procs:
+                p.join()
+        except KeyboardInterrupt:
+            for p in procs:
+                p.terminate()
+        return
+
+    if args.shard is None or not args.shards:
+        parser.error("--shard and --shards are required unless --local is given")
+    run_shard_server(args.shard, args.shards, args.host, args.port, args.key)
+
+
+if __name__ == "__main__":
+    main()
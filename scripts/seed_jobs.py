@@ -2,13 +2,15 @@
 """Seed jobs from a JSON file into the database.
 
 Job ingestion is only supported from a JSON file. Each job gets job_meaning (text) and
-job_embedding (vector) stored in Postgres. Usage (from backend/, venv activated):
+job_embedding (vector) stored in Postgres. Near-duplicates of already-ingested postings
+(MinHash + embedding similarity, see app/services/job_dedup.py) are skipped.
+Usage (from backend/, venv activated):
 
     python -m scripts.seed_jobs --file jobs.json
 
 The JSON file must be an array of job objects with at least: title, company_name.
 Optional: description, source, domain, subdomain, years_experience_min/max,
-skills_required, location, country, remote, salary_min, salary_max.
+skills_required, location, country, remote, salary_min, salary_max, expires_at (ISO 8601).
 """
 
 from __future__ import annotations
@@ -17,6 +19,7 @@ import argparse
 import asyncio
 import json
 import sys
+from datetime import datetime
 from pathlib import Path
 
 _backend_root = Path(__file__).resolve().parent.parent
@@ -26,9 +29,18 @@ if str(_backend_root) not in sys.path:
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from app.config.database import Base, SessionLocal, engine
+from app.config.database import Base, SessionLocal, engine, try_advisory_lock
+from app.config.settings import settings
 from app.models.job import Job
 from app.services.embedding import build_job_meaning, embed_text
+from app.services.job_dedup import add_fingerprint, find_duplicate, minhash_signature, record_duplicate
+from app.services.job_neighbors import build_neighbors
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
 def job_dict_to_model(data: dict) -> Job:
@@ -52,30 +64,50 @@ def job_dict_to_model(data: dict) -> Job:
         remote=data.get("remote", "onsite"),
         salary_min=data.get("salary_min"),
         salary_max=data.get("salary_max"),
+        expires_at=_parse_datetime(data.get("expires_at")),
     )
 
 
-async def embed_and_save_jobs(db: Session, jobs: list[Job]) -> int:
-    """Build job_meaning, embed, and update each job in DB. Returns count of successes."""
-    success = 0
-    for job in jobs:
+async def ingest_jobs(db: Session, jobs_data: list[dict]) -> tuple[list[Job], int]:
+    """Build job_meaning, embed, drop near-duplicates, and insert each job.
+
+    Returns (created jobs, number of postings collapsed into an existing canonical job).
+    """
+    created: list[Job] = []
+    duplicates = 0
+    for i, data in enumerate(jobs_data, 1):
+        job = job_dict_to_model(data)
+        job.job_meaning = build_job_meaning(
+            title=job.title,
+            domain=job.domain,
+            subdomain=job.subdomain or "",
+            years_experience_min=job.years_experience_min,
+            skills_required=job.skills_required or [],
+            description=job.description or "",
+        )
         try:
-            job_meaning = build_job_meaning(
-                title=job.title,
-                domain=job.domain,
-                subdomain=job.subdomain or "",
-                years_experience_min=job.years_experience_min,
-                skills_required=job.skills_required or [],
-                description=job.description or "",
-            )
-            vector = await embed_text(job_meaning)
-            job.job_meaning = job_meaning
-            job.job_embedding = vector
-            db.commit()
-            success += 1
+            job.job_embedding = await embed_text(job.job_meaning)
         except Exception as e:
-            print(f"  ✗ Embed failed for {job.id}: {e}")
-    return success
+            print(f"  ✗ Embed failed for {job.title} at {job.company_name}: {e}")
+
+        signature = minhash_signature(job)
+        if settings.DEDUP_ENABLED:
+            canonical_id = find_duplicate(db, signature, job.job_embedding)
+            if canonical_id:
+                record_duplicate(db, canonical_id)
+                db.commit()
+                duplicates += 1
+                print(f"[{i}/{len(jobs_data)}] Duplicate of {canonical_id}: {job.title} at {job.company_name}")
+                continue
+
+        db.add(job)
+        db.flush()
+        add_fingerprint(db, job.id, signature)
+        db.commit()
+        db.refresh(job)
+        created.append(job)
+        print(f"[{i}/{len(jobs_data)}] Inserted: {job.title} at {job.company_name} (id={job.id})")
+    return created, duplicates
 
 
 def main() -> None:
@@ -111,19 +143,19 @@ def main() -> None:
 
     db: Session = SessionLocal()
     try:
-        created: list[Job] = []
-        for i, data in enumerate(jobs_data, 1):
-            job = job_dict_to_model(data)
-            db.add(job)
-            db.commit()
-            db.refresh(job)
-            created.append(job)
-            print(f"[{i}/{len(jobs_data)}] Inserted: {job.title} at {job.company_name} (id={job.id})")
+        created, duplicates = asyncio.run(ingest_jobs(db, jobs_data))
+        embedded = sum(1 for job in created if job.job_embedding is not None)
+        print(f"\n  ✓ Inserted {len(created)} jobs ({embedded} embedded); skipped {duplicates} near-duplicates.")
 
         if created:
-            print("\nBuilding embeddings and saving to Postgres...")
-            n = asyncio.run(embed_and_save_jobs(db, created))
-            print(f"  ✓ Embedded and saved {n}/{len(created)} jobs.")
+            print("\nBuilding similar-job neighbours...")
+            with try_advisory_lock("job_neighbors") as held:
+                if held:
+                    built = build_neighbors(db, [job.id for job in created])
+                    print(f"  ✓ Built neighbours for {built} jobs.")
+                else:
+                    # New jobs are stale (neighbors_built_at NULL): the running builder picks them up
+                    print("  Another process is building neighbours; it will pick up the new jobs.")
     finally:
         db.close()
 
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Stand-in for the OpenRouter embeddings API and the Reducto upload/pipeline API, for offline load tests.
+
+    python -m scripts.stub_external_apis --port 8900 --embed-median-ms 150 --reducto-median-ms 4000 --error-rate 0.02
+
+Then point the API/worker at it:
+OPENROUTER_BASE_URL=http://127.0.0.1:8900/api/v1
+REDUCTO_BASE_URL=http://127.0.0.1:8900
+OPENROUTER_API_KEY=stub REDUCTO_API_KEY=stub RESUME_PARSER=reducto
+
+Latencies are log-normal (median + sigma per API); --error-rate of requests get a 500 or 429.
+Embeddings are deterministic per input text; Reducto jobs stay Pending until their sampled
+processing time has passed, and return a resume picked deterministically from the file hash.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import math
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import numpy as np
+import uvicorn
+from fastapi import FastAPI, File, Request, UploadFile
+from fastapi.responses import JSONResponse
+
+SAMPLE_RESUMES: List[Dict[str, Any]] = [
+    {"Domain": "Engineering", "experience": 6, "Country": "USA",
+     "Technical Skills": ["Python", "PostgreSQL", "AWS", "Docker", "REST APIs"],
+     "Summary": "Backend engineer building data-heavy APIs and cloud services."},
+    {"Domain": "Engineering", "experience": 3, "Country": "IND",
+     "Technical Skills": ["React", "TypeScript", "JavaScript", "CSS", "Node.js"],
+     "Summary": "Frontend developer focused on design systems and web performance."},
+    {"Domain": "Finance", "experience": 8, "Country": "GBR",
+     "Technical Skills": ["Financial Modeling", "Excel", "Valuation", "SQL"],
+     "Summary": "Investment banking analyst turned FP&A lead."},
+    {"Domain": "Design", "experience": 5, "Country": "DEU",
+     "Technical Skills": ["Figma", "Prototyping", "User Research", "Design Systems"],
+     "Summary": "Product designer shipping B2B SaaS workflows."},
+    {"Domain": "Healthcare", "experience": 10, "Country": "CAN",
+     "Technical Skills": ["Clinical Trials", "GCP", "Data Management", "Protocol Compliance"],
+     "Summary": "Clinical research associate running multi-site trials."},
+    {"Domain": "Sales & Marketing", "experience": 4, "Country": "AUS",
+     "Technical Skills": ["SEO", "Google Analytics", "Content Strategy", "Copywriting"],
+     "Summary": "Growth marketer owning content and organic acquisition."},
+]
+
+
+@dataclass
+class Latency:
+    median_ms: float
+    sigma: float
+
+    def sample(self) -> float:
+        if self.median_ms <= 0:
+            return 0.0
+        return random.lognormvariate(math.log(self.median_ms), self.sigma) / 1000.0
+
+
+@dataclass
+class StubConfig:
+    embed: Latency
+    upload: Latency
+    reducto_job: Latency
+    error_rate: float
+    dimension: int
+
+
+@dataclass
+class StubJob:
+    resume: Dict[str, Any]
+    ready_at: float
+    cancelled: bool = False
+
+
+def _embedding(text: str, dimension: int) -> List[float]:
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+    vec = np.random.default_rng(seed).standard_normal(dimension)
+    return (vec / np.linalg.norm(vec)).round(6).tolist()
+
+
+def create_app(config: StubConfig) -> FastAPI:
+    app = FastAPI(title="External API stand-in")
+    uploads: Dict[str, bytes] = {}
+    jobs: Dict[str, StubJob] = {}
+
+    def injected_error() -> JSONResponse | None:
+        if random.random() >= config.error_rate:
+            return None
+        if random.random() < 0.5:
+            return JSONResponse({"error": "rate limited (stub)"}, status_code=429, headers={"Retry-After": "1"})
+        return JSONResponse({"error": "internal error (stub)"}, status_code=500)
+
+    @app.post("/api/v1/embeddings")
+    async def embeddings(request: Request):
+        await asyncio.sleep(config.embed.sample())
+        if (err := injected_error()) is not None:
+            return err
+        body = await request.json()
+        inputs = body.get("input") or []
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        return {
+            "object": "list",
+            "model": body.get("model", "stub"),
+            "data": [
+                {"object": "embedding", "index": i, "embedding": _embedding(text, config.dimension)}
+                for i, text in enumerate(inputs)
+            ],
+        }
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        await asyncio.sleep(config.upload.sample())
+        if (err := injected_error()) is not None:
+            return err
+        file_id = f"reducto://{uuid.uuid4().hex}"
+        uploads[file_id] = hashlib.sha256(await file.read()).digest()
+        return {"file_id": file_id, "presigned_url": None}
+
+    @app.post("/pipeline_async")
+    async def pipeline_async(request: Request):
+        if (err := injected_error()) is not None:
+            return err
+        body = await request.json()
+        digest = uploads.pop(body.get("input"), None)
+        if digest is None:
+            return JSONResponse({"detail": "Unknown input file"}, status_code=400)
+        job_id = uuid.uuid4().hex
+        jobs[job_id] = StubJob(
+            resume=SAMPLE_RESUMES[digest[0] % len(SAMPLE_RESUMES)],
+            ready_at=time.monotonic() + config.reducto_job.sample(),
+        )
+        return {"job_id": job_id}
+
+    @app.get("/job/{job_id}")
+    async def job_status(job_id: str):
+        if (err := injected_error()) is not None:
+            return err
+        job = jobs.get(job_id)
+        if job is None:
+            return JSONResponse({"detail": "Job not found"}, status_code=404)
+        if job.cancelled:
+            return {"status": "Failed", "reason": "Cancelled", "result": None}
+        if time.monotonic() < job.ready_at:
+            return {"status": "Pending", "result": None}
+        jobs.pop(job_id, None)
+        return {
+            "status": "Completed",
+            "result": {"job_id": job_id, "result": {"extract": {"result": [job.resume]}}},
+        }
+
+    @app.post("/cancel/{job_id}")
+    async def cancel(job_id: str):
+        if job_id in jobs:
+            jobs[job_id].cancelled = True
+        return {}
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run stand-in OpenRouter + Reducto APIs.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--embed-median-ms", type=float, default=150.0)
+    parser.add_argument("--embed-sigma", type=float, default=0.5)
+    parser.add_argument("--upload-median-ms", type=float, default=200.0)
+    parser.add_argument("--upload-sigma", type=float, default=0.5)
+    parser.add_argument("--reducto-median-ms", type=float, default=4000.0, help="Pipeline job processing time")
+    parser.add_argument("--reducto-sigma", type=float, default=0.6)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 500/429")
+    parser.add_argument("--dimension", type=int, default=1536, help="Embedding dimension (EMBEDDING_DIMENSION)")
+    parser.add_argument("--seed", type=int, help="Seed latency/error sampling for repeatable runs")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    config = StubConfig(
+        embed=Latency(args.embed_median_ms, args.embed_sigma),
+        upload=Latency(args.upload_median_ms, args.upload_sigma),
+        reducto_job=Latency(args.reducto_median_ms, args.reducto_sigma),
+        error_rate=max(0.0, min(1.0, args.error_rate)),
+        dimension=args.dimension,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()